@@ -15,11 +15,11 @@ from datetime import date, timedelta
 import logging
 
 from chronos.models import CorporateEntity, Status
-from chronos.portfolio import PortfolioManager
+from chronos.portfolio_async import AsyncDBPortfolioManager
 from chronos.scrapers.axle import DataAxleScraper
 from chronos.scrapers.edgar import EdgarClient
 from chronos.settings import settings
-from .deps import get_portfolio, get_data_axle, get_edgar_client
+from .deps import get_async_portfolio, get_data_axle, get_edgar_client
 
 # Create router
 router = APIRouter(prefix="/axle", tags=["axle"])
@@ -60,7 +60,7 @@ async def search_entities(
     ),
     axle_client: AsyncClient = Depends(get_data_axle),
     edgar_client: AsyncClient = Depends(get_edgar_client),
-    pm: PortfolioManager = Depends(get_portfolio),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio),
 ):
     """
     Search for business entities using Data Axle API.
@@ -152,8 +152,7 @@ async def search_entities(
         entities = enriched_entities
     
     # Add entities to portfolio for persistence
-    for entity in entities:
-        pm.add(entity)
+    await pm.add_many(entities)
     
     # Return normalized entity data
     return [normalize_entity_to_dict(entity) for entity in entities]
@@ -164,7 +163,7 @@ async def get_entity_by_id(
     business_id: str,
     axle_client: AsyncClient = Depends(get_data_axle),
     edgar_client: AsyncClient = Depends(get_edgar_client),
-    pm: PortfolioManager = Depends(get_portfolio),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio),
 ):
     """
     Fetch a specific business entity by Data Axle ID.
@@ -190,7 +189,7 @@ async def get_entity_by_id(
         entity = await edgar.enrich_entity(entity)
     
     # Add entity to portfolio for persistence
-    pm.add(entity)
+    await pm.add(entity)
     
     # Return normalized entity data
     return normalize_entity_to_dict(entity)
\ No newline at end of file
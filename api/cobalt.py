@@ -13,9 +13,11 @@ from typing import List, Optional, Dict, Any
 import logging
 
 from chronos.models import CorporateEntity
-from chronos.portfolio import PortfolioManager
+from chronos.portfolio_async import AsyncDBPortfolioManager
+from chronos.serialization import entity_dict
 from chronos.scrapers.cobalt import CobaltScraper
-from .deps import get_portfolio, get_cobalt_scraper
+from .responses import FastJSONResponse, entities_response
+from .deps import get_async_portfolio, get_cobalt_scraper
 
 # Create router
 router = APIRouter(prefix="/cobalt", tags=["cobalt"])
@@ -50,7 +52,7 @@ async def search_entities(
     include_ucc_data: bool = Query(False, description="Whether to include UCC (lien) data in results"),
     
     # Dependencies
-    pm: PortfolioManager = Depends(get_portfolio),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio),
     scraper: CobaltScraper = Depends(get_cobalt_scraper),
 ):
     """
@@ -62,6 +64,8 @@ async def search_entities(
     - Option to include screenshots and UCC data
     
     Returns a list of matching entities with normalized data structure.
+    A live search Cobalt has not finished yet returns an empty list; use
+    ``POST /jobs/search`` to have the ``retryId`` followed in the background.
     """
     # Validate that at least one search parameter is provided
     if not any([q, sos_id, (person_first_name and person_last_name), retry_id]):
@@ -102,11 +106,10 @@ async def search_entities(
             return []
         
         # Add entities to portfolio for persistence
-        for entity in entities:
-            pm.add(entity)
+        await pm.add_many(entities)
         
-        # Return normalized entity data
-        return [_normalize_entity_to_dict(entity) for entity in entities]
+        # Return normalized entity data, encoded in one pass
+        return entities_response(entities)
     
     except Exception as e:
         logger.error(f"Error searching Cobalt Intelligence API: {e}")
@@ -117,7 +120,7 @@ async def search_entities(
 async def get_entity_details(
     name: str = Query(..., min_length=2, description="Business name"),
     state: str = Query(..., min_length=2, max_length=2, description="State code"),
-    pm: PortfolioManager = Depends(get_portfolio),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio),
     scraper: CobaltScraper = Depends(get_cobalt_scraper),
 ):
     """
@@ -140,36 +143,13 @@ async def get_entity_details(
             raise HTTPException(status_code=404, detail=f"Entity details not found for '{name}' in {state}")
         
         # Add entity to portfolio for persistence
-        pm.add(entity)
+        await pm.add(entity)
         
         # Return normalized entity data
-        return _normalize_entity_to_dict(entity)
+        return FastJSONResponse(entity_dict(entity))
         
     except HTTPException:
         raise  # Re-raise HTTP exceptions
     except Exception as e:
         logger.error(f"Error fetching entity details: {e}")
         raise HTTPException(status_code=500, detail=f"Error fetching entity details: {str(e)}")
-
-
-def _normalize_entity_to_dict(entity: CorporateEntity) -> Dict[str, Any]:
-    """
-    Convert a CorporateEntity to a dictionary for API responses.
-    
-    Args:
-        entity: CorporateEntity object
-        
-    Returns:
-        Dictionary with normalized entity data
-    """
-    slug = entity.name.lower().replace(" ", "-")
-    
-    return {
-        "slug": slug,
-        "name": entity.name,
-        "jurisdiction": entity.jurisdiction,
-        "status": entity.status.name,
-        "formed": entity.formed.isoformat() if entity.formed else None,
-        "officers": entity.officers,
-        "notes": entity.notes
-    }
\ No newline at end of file
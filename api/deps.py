@@ -4,39 +4,85 @@ api.deps
 
 FastAPI dependency providers.
 
-`get_portfolio` now returns a fresh **DBPortfolioManager** so every
-request talks to the persistent SQLite store instead of the in‑memory
-PortfolioManager.
+`get_portfolio` returns a **DBPortfolioManager** over a request‑scoped
+session (``get_session``), so concurrent requests – sync endpoints run in
+FastAPI's threadpool – never share a Session; the session is closed when
+the request finishes.  ``get_read_portfolio`` does the same on the
+read‑only connection pool for query‑only endpoints, and
+``get_async_portfolio`` gives ``async def`` routes an
+:class:`AsyncDBPortfolioManager` that never blocks the event loop.
 
 Also includes dependencies for external API clients like OpenCorporates, Data Axle, and SEC EDGAR.
+HTTP clients come from the process‑wide pools in :mod:`chronos.http`
+(opened and closed by the FastAPI lifespan).
 """
 
+import asyncio
 from functools import lru_cache
-from typing import AsyncGenerator, Dict
+from typing import AsyncIterator, Iterator
 
 from fastapi import Depends
 from httpx import AsyncClient
+from sqlmodel import Session
 
+from chronos.db import ReadSessionLocal, SessionLocal
+from chronos.federated import FederatedSearch, Provider
+from chronos.http import pools
+from chronos.portfolio_async import AsyncDBPortfolioManager, async_session
 from chronos.portfolio_db import DBPortfolioManager
-from chronos.relationships import RelationshipGraph
+from chronos.relationships_db import DBRelationshipGraph
 from chronos.settings import settings
 from chronos.scrapers.opencorp import OpenCorporatesScraper
 from chronos.scrapers.cobalt import CobaltScraper
+from chronos.scrapers.de import DelawareScraper
 
 
-@lru_cache
-def get_portfolio() -> DBPortfolioManager:
-    """Singleton DB‑backed portfolio manager (persists across requests)."""
-    return DBPortfolioManager()
+def get_session() -> Iterator[Session]:
+    """One read/write Session per request, closed afterwards."""
+    with SessionLocal() as session:
+        yield session
+
+
+def get_read_session() -> Iterator[Session]:
+    """One Session on the read‑only pool per request."""
+    with ReadSessionLocal() as session:
+        yield session
+
+
+def get_portfolio(session: Session = Depends(get_session)) -> DBPortfolioManager:
+    """DB‑backed portfolio manager bound to this request's session."""
+    return DBPortfolioManager(session)
+
+
+def get_read_portfolio(session: Session = Depends(get_read_session)) -> DBPortfolioManager:
+    """Query‑only portfolio manager on the reader pool."""
+    return DBPortfolioManager(session)
+
+
+async def get_async_session() -> AsyncIterator:
+    """One ``AsyncSession`` (aiosqlite) per request, closed afterwards."""
+    async with async_session() as session:
+        yield session
+
+
+def get_async_portfolio(session=Depends(get_async_session)) -> AsyncDBPortfolioManager:
+    """Non‑blocking portfolio manager for ``async def`` routes."""
+    return AsyncDBPortfolioManager(session)
 
 
 _relationship_graph = None
 
-def get_relationships() -> RelationshipGraph:
-    """Singleton relationship graph (persists across requests)."""
+def get_relationships() -> DBRelationshipGraph:
+    """
+    Per‑process relationship graph backed by the ``ownership_edges`` table.
+
+    Loaded lazily on first use; afterwards ``sync()`` only reloads when
+    another worker changed edges or entities.
+    """
     global _relationship_graph
     if _relationship_graph is None:
-        _relationship_graph = RelationshipGraph()
+        _relationship_graph = DBRelationshipGraph()
+    _relationship_graph.sync()
     return _relationship_graph
 
 
@@ -58,69 +104,47 @@ def get_cobalt_scraper():
     return CobaltScraper(api_key=settings.cobalt_api_key)
 
 
-async def get_data_axle(settings=Depends(get_settings)) -> AsyncGenerator[AsyncClient, None]:
+@lru_cache
+def get_federated_search() -> FederatedSearch:
     """
-    Return an AsyncClient configured for Data Axle API access.
-    
-    Args:
-        settings: Application settings with Data Axle credentials
-        
-    Yields:
-        AsyncClient: Configured HTTP client for Data Axle API
+    Concurrent search over Cobalt, OpenCorporates and (for ``DE``) the
+    Delaware demo scraper, in that priority order.
     """
-    async with AsyncClient(
-        base_url=str(settings.data_axle_base),
-        headers={
-            # X-AUTH-TOKEN is the standard header for Data Axle API
-            "X-AUTH-TOKEN": settings.data_axle_key,
-            # For backward compatibility, also include x-api-key
-            "x-api-key": settings.data_axle_key,
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": f"{settings.sec_ua_app} ({settings.sec_ua_email})",  # polite UA
-            # Additional headers that might be needed for Data Axle API
-            "Cache-Control": "no-cache"
-        },
-        timeout=30.0  # Increased timeout for API requests
-    ) as client:
-        yield client
-
-
-def edgar_headers(settings=Depends(get_settings)) -> Dict[str, str]:
+    delaware = DelawareScraper()
+
+    async def search_delaware(q, state):
+        # The demo scraper parses a local file synchronously
+        record = await asyncio.to_thread(delaware.fetch, q)
+        return [record] if record else []
+
+    return FederatedSearch([
+        Provider("cobalt", get_cobalt_scraper().search),
+        # The public tier allows 10 calls an hour: ask only when Cobalt has nothing
+        Provider("opencorporates", get_opencorp_scraper().search,
+                 scarce=not settings.opencorp_api_token),
+        Provider("delaware", search_delaware, states=frozenset({"DE"})),
+    ])
+
+
+def get_data_axle() -> AsyncClient:
     """
-    Return headers required for SEC EDGAR API access.
+    Return the pooled AsyncClient for Data Axle API access.
+    
+    The client (base URL, X-AUTH-TOKEN headers, timeouts) is owned by
+    :data:`chronos.http.pools` and lives for the whole process, so
+    requests reuse warm connections.
     
-    Args:
-        settings: Application settings with SEC EDGAR credentials
-        
     Returns:
-        Dict[str, str]: Headers for SEC EDGAR API
+        AsyncClient: Shared HTTP client for Data Axle API
     """
-    ua = f"{settings.sec_ua_app} (+{settings.sec_ua_email})"
-    return {
-        "User-Agent": ua, 
-        "Accept-Encoding": "gzip, deflate", 
-        "Host": "www.sec.gov"
-    }
-
-
-async def get_edgar_client(
-    headers=Depends(edgar_headers),
-    settings=Depends(get_settings)
-) -> AsyncGenerator[AsyncClient, None]:
+    return pools.get("data_axle")
+
+
+def get_edgar_client() -> AsyncClient:
     """
-    Return an AsyncClient configured for SEC EDGAR API access.
+    Return the pooled AsyncClient for SEC EDGAR API access.
     
-    Args:
-        headers: Headers for SEC EDGAR API
-        settings: Application settings
-        
-    Yields:
-        AsyncClient: Configured HTTP client for SEC EDGAR API
+    Returns:
+        AsyncClient: Shared HTTP client for SEC EDGAR API
     """
-    async with AsyncClient(
-        base_url=str(settings.sec_edgar_base),
-        headers=headers,
-        timeout=30.0  # SEC API can be slow
-    ) as client:
-        yield client
\ No newline at end of file
+    return pools.get("edgar")
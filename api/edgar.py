@@ -13,9 +13,9 @@ from typing import List, Optional, Dict, Any
 from httpx import AsyncClient
 
 from chronos.models import CorporateEntity, Status
-from chronos.portfolio import PortfolioManager
+from chronos.portfolio_async import AsyncDBPortfolioManager
 from chronos.scrapers.edgar import EdgarClient
-from .deps import get_portfolio, get_edgar_client
+from .deps import get_async_portfolio, get_edgar_client
 
 # Create router
 router = APIRouter(prefix="/edgar", tags=["edgar"])
@@ -26,7 +26,7 @@ async def search_companies(
     q: str = Query(..., min_length=2, description="Company name search term"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of results to return"),
     edgar_client: AsyncClient = Depends(get_edgar_client),
-    pm: PortfolioManager = Depends(get_portfolio),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio),
 ):
     """
     Search for companies using SEC EDGAR API.
@@ -202,7 +202,7 @@ async def get_company_filings(
 async def get_company_by_cik(
     cik: str,
     edgar_client: AsyncClient = Depends(get_edgar_client),
-    pm: PortfolioManager = Depends(get_portfolio),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio),
 ):
     """
     Get company information by CIK and convert to entity format.
@@ -251,7 +251,7 @@ async def get_company_by_cik(
     entity.notes = "\n".join(sec_notes)
     
     # Add entity to portfolio
-    pm.add(entity)
+    await pm.add(entity)
     
     # Return normalized entity
     return {
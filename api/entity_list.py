@@ -3,36 +3,115 @@ API endpoint to get a complete list of entities.
 
 This provides a simple endpoint to retrieve all entities in the portfolio,
 which is useful for the relationship form to show all available entities.
+
+Large portfolios can be fetched in pages (``?after=<slug>&limit=N``, keyset
+pagination on slug) or streamed as newline‑delimited JSON by sending
+``Accept: application/x-ndjson``.
 """
 
-from fastapi import APIRouter, Depends
-from typing import List, Dict, Any
+from typing import Any, AsyncIterator, Dict, Optional, Sequence
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
-from chronos.portfolio_db import DBPortfolioManager
-from api.deps import get_portfolio
+from chronos.portfolio_async import AsyncDBPortfolioManager
+from chronos.serialization import dumps
+from api.deps import get_async_portfolio
+from api.responses import FastJSONResponse
 
 router = APIRouter()
 
-@router.get("/entities/all", response_model=List[Dict[str, Any]])
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Fields a client may project; the default keeps the original payload shape
+ENTITY_FIELDS = ("slug", "name", "jurisdiction", "status", "formed", "officers", "notes")
+DEFAULT_FIELDS = ("slug", "name", "jurisdiction", "status", "formed")
+
+
+def _parse_fields(fields: Optional[str]) -> Sequence[str]:
+    """Validate a comma‑separated ``fields`` projection."""
+    if not fields:
+        return DEFAULT_FIELDS
+    requested = tuple(f.strip() for f in fields.split(",") if f.strip())
+    unknown = [f for f in requested if f not in ENTITY_FIELDS]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(ENTITY_FIELDS)}",
+        )
+    return requested
+
+
+def _row_to_dict(fields: Sequence[str], row: tuple) -> Dict[str, Any]:
+    """Convert an ``iter_columns`` tuple into a dict (dates left to the encoder)."""
+    out = dict(zip(fields, row))
+    if "status" in out:
+        out["status"] = out["status"].name
+    return out
+
+
+async def _ndjson_lines(rows: AsyncIterator[tuple], fields: Sequence[str]) -> AsyncIterator[bytes]:
+    async for row in rows:
+        yield dumps(_row_to_dict(fields, row)) + b"\n"
+
+
+# The handler returns its own responses, so the schema is declared by hand
+# rather than through ``response_model`` (which would describe JSON only).
+ENTITY_LIST_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {
+        "description": "Entities ordered by slug, as a JSON array or as NDJSON",
+        "content": {
+            "application/json": {
+                "schema": {"type": "array", "items": {"type": "object"}},
+            },
+            NDJSON_MEDIA_TYPE: {
+                "schema": {"type": "string", "description": "One JSON object per line"},
+            },
+        },
+        "headers": {
+            "X-Next-After": {
+                "description": "Slug to pass as ``after`` for the next page; "
+                               "only sent when a ``limit`` page is full",
+                "schema": {"type": "string"},
+            },
+        },
+    },
+}
+
+
+@router.get("/entities/all", responses=ENTITY_LIST_RESPONSES)
 async def get_all_entities(
-    pm: DBPortfolioManager = Depends(get_portfolio)
+    request: Request,
+    after: Optional[str] = Query(None, description="Return entities whose slug sorts after this one"),
+    limit: Optional[int] = Query(None, ge=1, le=10_000, description="Page size (enables keyset pagination)"),
+    fields: Optional[str] = Query(None, description="Comma-separated projection, e.g. 'slug,name'"),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio)
 ):
     """
     Get a complete list of all entities in the portfolio.
-    
+
     This is useful for UI elements that need to show all entities,
     such as dropdown selections.
+
+    * ``after`` / ``limit`` – keyset pagination on slug.  When a page is
+      full, the ``X-Next-After`` response header carries the cursor for
+      the next request.
+    * ``fields`` – optional projection (``slug`` is always available).
+    * ``Accept: application/x-ndjson`` – stream one JSON object per line
+      straight from the database cursor.
     """
-    entities = []
-    
-    for entity in pm:
-        slug = entity.name.lower().replace(" ", "-")
-        entities.append({
-            "slug": slug,
-            "name": entity.name,
-            "jurisdiction": entity.jurisdiction,
-            "status": entity.status.name,
-            "formed": entity.formed.isoformat() if entity.formed else None
-        })
-    
-    return entities
\ No newline at end of file
+    columns = _parse_fields(fields)
+
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        rows = pm.stream_columns(*columns, after=after, limit=limit)
+        return StreamingResponse(_ndjson_lines(rows, columns), media_type=NDJSON_MEDIA_TYPE)
+
+    # Always fetch the slug last so a next‑page cursor can be handed out
+    rows = await pm.iter_columns(*columns, "slug", after=after, limit=limit)
+    entities = [_row_to_dict(columns, row[:-1]) for row in rows]
+
+    headers = {}
+    if limit is not None and len(rows) == limit:
+        headers["X-Next-After"] = rows[-1][-1]
+
+    return FastJSONResponse(entities, headers=headers)
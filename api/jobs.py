@@ -0,0 +1,170 @@
+"""
+api.jobs
+========
+
+Background searches on the :mod:`chronos.jobs` queue.
+
+``POST /jobs/search`` validates the query, queues it and answers ``202``
+with the job id at once – however slow the upstream.  A worker then runs
+the search (Cobalt, following its ``retryId`` until the live search is
+done, or the federated search), stores the hits in the portfolio and
+records slim summaries as the job result.
+
+* ``GET /jobs/{id}``         – snapshot; ``?wait=10`` long‑polls until done
+* ``GET /jobs/{id}/events``  – server‑sent events, one per state/progress change
+* ``DELETE /jobs/{id}``      – cancel
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from chronos.federated import STRATEGIES, FederatedSearch
+from chronos.jobs import Job, jobs
+from chronos.portfolio_async import AsyncDBPortfolioManager, async_session
+from chronos.scrapers.cobalt import CobaltScraper
+from chronos.serialization import dumps, summary_dict
+from chronos.settings import COBALT_POLL_INTERVAL
+from .deps import get_cobalt_scraper, get_federated_search
+from .responses import FastJSONResponse
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for ?wait= long polls, in seconds
+MAX_WAIT = 30.0
+
+
+class SearchJobRequest(BaseModel):
+    provider: Literal["cobalt", "federated"] = "cobalt"
+    q: Optional[str] = Field(None, min_length=2, description="Business name search term")
+    state: Optional[str] = Field(None, pattern="^[A-Za-z]{2}$", description="Two‑letter state code")
+    sos_id: Optional[str] = None
+    person_first_name: Optional[str] = None
+    person_last_name: Optional[str] = None
+    retry_id: Optional[str] = Field(None, description="Resume a Cobalt search that is still running")
+    street: Optional[str] = None
+    city: Optional[str] = None
+    zip_code: Optional[str] = None
+    live_data: bool = True
+    include_screenshot: bool = False
+    include_ucc_data: bool = False
+    strategy: Optional[str] = Field(
+        None, pattern="^(" + "|".join(STRATEGIES) + ")$", description="Federated merge strategy"
+    )
+
+
+def search_handler(
+    cobalt: Optional[CobaltScraper] = None,
+    federated: Optional[FederatedSearch] = None,
+    session_factory: Callable = async_session,
+    poll_interval: float = COBALT_POLL_INTERVAL,
+):
+    """
+    Job handler for ``search`` jobs.
+
+    Providers default to the application's (see :mod:`api.deps`); tests
+    pass their own, plus a ``session_factory`` bound to a scratch DB.
+    """
+
+    async def run(job: Job) -> Dict[str, Any]:
+        p = dict(job.params)
+        provider = p.pop("provider")
+        strategy = p.pop("strategy", None)
+        if provider == "federated":
+            result = await (federated or get_federated_search()).search(
+                p["q"], p.get("state"), strategy=strategy
+            )
+            entities, winner = result.entities, result.winner
+        else:
+            scraper = cobalt or get_cobalt_scraper()
+            entities = await scraper.search_until_complete(
+                name=p.pop("q"),
+                poll_interval=poll_interval,
+                on_pending=lambda retry_id, polls: job.update(retry_id=retry_id, polls=polls),
+                **p,
+            )
+            winner = "cobalt"
+
+        if entities:
+            async with session_factory() as session:
+                await AsyncDBPortfolioManager(session).add_many(entities)
+        return {
+            "provider": winner,
+            "count": len(entities),
+            "entities": [summary_dict(ent) for ent in entities],
+        }
+
+    return run
+
+
+jobs.register("search", search_handler())
+
+
+def _job(job_id: str) -> Job:
+    try:
+        return jobs.get(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found") from None
+
+
+@router.post("/search", status_code=202, response_model=Dict[str, Any])
+async def submit_search(req: SearchJobRequest):
+    """Queue a provider search; poll ``Location`` (or its ``/events``) for the result."""
+    if req.provider == "federated" and not req.q:
+        raise HTTPException(status_code=400, detail="Federated search jobs require q")
+    if not any([req.q, req.sos_id, (req.person_first_name and req.person_last_name), req.retry_id]):
+        raise HTTPException(
+            status_code=400,
+            detail="At least one search parameter is required: q, sos_id, or person_first_name + person_last_name, or retry_id"
+        )
+    if req.provider == "cobalt" and not req.state and not req.retry_id:
+        raise HTTPException(status_code=400, detail="State parameter is required unless using retry_id")
+
+    try:
+        job = jobs.submit("search", req.model_dump())
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=503, detail="Job queue is full, retry later") from None
+    logger.info(f"Queued search job {job.id} ({req.provider})")
+    return FastJSONResponse(job.to_dict(), status_code=202, headers={"Location": f"/jobs/{job.id}"})
+
+
+@router.get("/{job_id}", response_model=Dict[str, Any])
+async def get_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=MAX_WAIT, description="Seconds to wait for the job to finish"),
+):
+    """Current job state; with ``wait`` the response is held until it is done (or the wait ends)."""
+    job = _job(job_id)
+    if wait and not job.done:
+        try:
+            await jobs.wait(job_id, timeout=wait)
+        except asyncio.TimeoutError:
+            pass
+    return FastJSONResponse(job.to_dict())
+
+
+@router.get("/{job_id}/events")
+async def job_events(job_id: str):
+    """``text/event-stream`` of job snapshots, closed once the job is done."""
+    _job(job_id)
+
+    async def events():
+        async for snapshot in jobs.watch(job_id):
+            yield b"event: " + snapshot["state"].encode() + b"\ndata: " + dumps(snapshot) + b"\n\n"
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+    )
+
+
+@router.delete("/{job_id}", response_model=Dict[str, Any])
+async def cancel_job(job_id: str):
+    """Cancel a queued or running job."""
+    _job(job_id)
+    return FastJSONResponse(jobs.cancel(job_id).to_dict())
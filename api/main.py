@@ -1,30 +1,68 @@
-from fastapi import FastAPI, Depends
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from chronos.db import ENTITIES_REVISION, create_all
 from chronos.portfolio import PortfolioManager
+from chronos.portfolio_async import AsyncDBPortfolioManager, dispose_async_engine
 from chronos.models import CorporateEntity, Status
 from chronos.relationships import RelationshipGraph
 from chronos.settings import API_HOST, API_PORT, API_DEBUG, SCRAPER_TIMEOUT, SCRAPER_USER_AGENT
-from .deps import get_portfolio, get_relationships
+from .middleware import CompressionMiddleware, ConditionalGetMiddleware
+from .responses import FastJSONResponse
+from .deps import get_async_portfolio, get_portfolio, get_read_portfolio, get_relationships
+from .deps import get_relationships as get_relationship_graph  # the GET /relationships handler below shadows the name
 from fastapi import HTTPException
 from fastapi import Query
 from typing import Optional, List, Dict, Any
 from chronos.scrapers.de import DelawareScraper
 from chronos.scrapers.opencorp import OpenCorporatesScraper
 from chronos.scrapers.cobalt import CobaltScraper
-from .deps import get_opencorp_scraper, get_cobalt_scraper
+from chronos.cache import cache as response_cache
+from chronos.http import pools as http_pools
+from chronos.jobs import jobs
+from chronos.federated import STRATEGIES, FederatedSearch
+from .deps import get_federated_search
 import os, inspect, chronos.scrapers.de, chronos.scrapers.opencorp, chronos.scrapers.cobalt
 import networkx as nx
+from itertools import islice
 from pydantic import BaseModel
 if os.getenv("SCRAPER_TRACE") or API_DEBUG:
     print("### Uvicorn imported DE scraper from", inspect.getfile(chronos.scrapers.de))
     print("### Uvicorn imported OpenCorp scraper from", inspect.getfile(chronos.scrapers.opencorp))
     print("### Uvicorn imported Cobalt scraper from", inspect.getfile(chronos.scrapers.cobalt))
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create tables/indexes, open the provider HTTP pools; close them on shutdown."""
+    create_all()
+    await http_pools.open()
+    yield
+    await jobs.aclose()  # cancel background searches before their pools close
+    await response_cache.drain()  # let background revalidations finish
+    await http_pools.aclose()
+    await dispose_async_engine()
+
+
 app = FastAPI(
     title="Project Chronos API",
     version="0.1.0",
     description="HTTP layer over the PortfolioManager with Data Axle and SEC EDGAR integrations.",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
+
+# --- Conditional GET ---------------------------------------------------------
+# Polled read endpoints answer 304 from the chronos_revisions counters before
+# touching the portfolio.  Innermost, so 304s still get CORS headers.
+# /relationships validates with the graph's own content ETag instead.
+app.add_middleware(
+    ConditionalGetMiddleware,
+    routes={
+        "/status": (ENTITIES_REVISION,),
+        "/entities/all": (ENTITIES_REVISION,),
+    },
 )
 
 # --- CORS ----------------------------------------------------------
@@ -42,9 +80,16 @@ app.add_middleware(
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization", "Accept"],
+    allow_headers=["Content-Type", "Authorization", "Accept", "If-None-Match", "If-Modified-Since"],
+    expose_headers=[
+        "X-Next-After", "ETag", "Last-Modified", "X-Graph-Epoch", "X-Graph-Version", "X-Search-Provider",
+    ],
 )
 
+# --- Compression -------------------------------------------------------------
+# Added last, so it is outermost and also encodes CORS-decorated responses.
+app.add_middleware(CompressionMiddleware)
+
 # --- Include Routers ----------------------------------------------------------
 # Include routers from other modules
 from .sosearch import router as sosearch_router
@@ -57,6 +102,8 @@ from .reset import router as reset_router
 from .relationships import router as relationships_router
 from .entity_list import router as entity_list_router
 from .explicit_clear import router as explicit_clear_router
+from .metrics import router as metrics_router
+from .jobs import router as jobs_router
 
 app.include_router(sosearch_router)
 app.include_router(axle_router)
@@ -68,6 +115,8 @@ app.include_router(reset_router)     # Graph reset functionality
 app.include_router(relationships_router, prefix="/relationships") # Direct relationship management
 app.include_router(entity_list_router)  # Entity listing for dropdowns
 app.include_router(explicit_clear_router)  # Explicit graph clearing methods
+app.include_router(metrics_router)  # Outbound HTTP pool statistics
+app.include_router(jobs_router)  # Background searches (POST /jobs/search)
 
 # ---------- health-check ----------
 @app.get("/")
@@ -84,10 +133,8 @@ def add_entity(ent: CorporateEntity,
 
 # ---------- GET /status ----------
 @app.get("/status")
-def status_snapshot(pm: PortfolioManager = Depends(get_portfolio)):
-    counts: dict[str, int] = {}
-    for e in pm:
-        counts[e.status.name] = counts.get(e.status.name, 0) + 1
+def status_snapshot(pm: PortfolioManager = Depends(get_read_portfolio)):
+    counts: dict[str, int] = {s.name: n for s, n in pm.status_counts().items()}
     # ensure zeroes appear
     for s in Status:
         counts.setdefault(s.name, 0)
@@ -95,7 +142,7 @@ def status_snapshot(pm: PortfolioManager = Depends(get_portfolio)):
 
 # ---------- GET /entities/{slug} ----------
 @app.get("/entities/{slug}", response_model=CorporateEntity)
-def get_entity(slug: str, pm: PortfolioManager = Depends(get_portfolio)):
+def get_entity(slug: str, pm: PortfolioManager = Depends(get_read_portfolio)):
     """
     Return the full CorporateEntity record for a previously‑scraped entity.
 
@@ -117,6 +164,9 @@ def get_entity(slug: str, pm: PortfolioManager = Depends(get_portfolio)):
 
     return ent
 
+# Max hits returned from the local portfolio fallback in /search
+LOCAL_SEARCH_LIMIT = 100
+
 # ---------- lightweight projection returned by /search ----------
 class BusinessSummary(BaseModel):
     slug: str
@@ -127,6 +177,7 @@ class BusinessSummary(BaseModel):
 # ---------- GET /search ----------
 @app.get("/search", response_model=list[BusinessSummary])
 async def search_entities(
+    response: Response,
     q: str = Query(..., min_length=2, description="Business name search term"),
     state: str | None = Query(
         None,
@@ -137,67 +188,42 @@ async def search_entities(
     ),
     use_cobalt: bool = Query(
         True,
-        description="Whether to use Cobalt Intelligence API for search (if False, uses only local data)",
+        description="Whether to query the external APIs (if False, uses only the Delaware demo scraper and local data)",
     ),
-    pm: PortfolioManager = Depends(get_portfolio),
-    cobalt_scraper: CobaltScraper = Depends(get_cobalt_scraper),
-    opencorp_scraper: OpenCorporatesScraper = Depends(get_opencorp_scraper),
+    strategy: Optional[str] = Query(
+        None,
+        pattern="^(" + "|".join(STRATEGIES) + ")$",
+        description="Provider merge strategy: first (default), all or hedged",
+    ),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio),
+    federated: FederatedSearch = Depends(get_federated_search),
 ):
     """
     Unified business search.
 
-    * For ``use_cobalt=True`` (default), searches using the Cobalt Intelligence API.
-    * For ``state == "DE"`` and ``use_cobalt=False``, use the Delaware demo scraper.
-    * Otherwise we search the in‑memory PortfolioManager by case‑insensitive
-      substring match on name and optional jurisdiction filter.
+    * Cobalt Intelligence, OpenCorporates and – for ``state == "DE"`` – the
+      Delaware demo scraper are queried concurrently, each under its own
+      deadline (see :mod:`chronos.federated`).  ``strategy`` picks how the
+      answers are combined; stragglers are cancelled and duplicates dropped.
+    * ``use_cobalt=False`` skips the external APIs.
+    * If no provider finds anything we search the stored portfolio through
+      its name index (token/prefix match) with an optional jurisdiction filter.
 
     Every hit is added to the portfolio (idempotent) so subsequent
-    searches and status snapshots include it.
+    searches and status snapshots include it.  The answering provider is
+    reported in the ``X-Search-Provider`` header.
     """
-    matches: list[CorporateEntity] = []
+    result = await federated.search(
+        q, state, strategy=strategy, providers=None if use_cobalt else ["delaware"]
+    )
+    matches: list[CorporateEntity] = result.entities
+    if matches:
+        await pm.add_many(matches)
+        response.headers["X-Search-Provider"] = result.winner or "federated"
 
-    # -- Cobalt Intelligence search (primary source) --------------------------
-    if use_cobalt:
-        try:
-            # Search using Cobalt Intelligence API with our dependency-injected scraper
-            entities = await cobalt_scraper.search(q, state)
-            
-            if entities:
-                # Add entities to portfolio and matches list
-                for entity in entities:
-                    pm.add(entity)
-                    matches.append(entity)
-        except Exception as e:
-            print(f"Cobalt Intelligence search error: {e}")
-            # Continue to fallback search methods
-            
-            # Try OpenCorporates API as a fallback
-            try:
-                print("Falling back to OpenCorporates API")
-                entities = await opencorp_scraper.search(q, state)
-                
-                if entities:
-                    # Add entities to portfolio and matches list
-                    for entity in entities:
-                        pm.add(entity)
-                        matches.append(entity)
-            except Exception as oe:
-                print(f"OpenCorporates fallback search error: {oe}")
-                # Continue to other fallbacks
-
-    # -- state‑specific scraper fallback --------------------------------------
-    if not matches and state and state.upper() == "DE":
-        record = DelawareScraper().fetch(q)
-        if record:
-            pm.add(record)
-            matches.append(record)
-
-    # -- fallback: search current portfolio -----------------------------------
+    # -- fallback: search current portfolio (indexed name search) -------------
     if not matches:
-        q_lower = q.lower()
-        for ent in pm:
-            if q_lower in ent.name.lower() and (not state or ent.jurisdiction.upper() == state.upper()):
-                matches.append(ent)
+        matches = await pm.search(q, state=state, limit=LOCAL_SEARCH_LIMIT)
 
     if not matches:
         raise HTTPException(status_code=404, detail="No matching entities found")
@@ -223,6 +249,7 @@ class ParentChildRelationship(BaseModel):
 # ---------- GET/POST /relationships ----------
 @app.get("/relationships")
 def get_relationships(
+    request: Request,
     rg: RelationshipGraph = Depends(get_relationships),
     pm: PortfolioManager = Depends(get_portfolio),
     load_examples: bool = Query(False, description="Force loading example relationships"),
@@ -234,6 +261,12 @@ def get_relationships(
     Returns a network structure with nodes (entities) and links (ownership relationships).
     Each node includes entity data like status and jurisdiction.
     Each link includes the ownership percentage.
+
+    The encoded payload is cached per graph version and tagged with an
+    ``ETag``; polling clients that send ``If-None-Match`` get a bodiless
+    ``304`` while the graph is unchanged.  ``X-Graph-Epoch`` and
+    ``X-Graph-Version`` are the starting point for incremental polling via
+    ``GET /relationships/changes``.
     """
     # Handle clear relationships request
     if clear_relationships:
@@ -250,36 +283,21 @@ def get_relationships(
         except Exception as e:
             print(f"Error clearing graph: {e}")
             
-            # Fallback method: manually clear edges
-            try:
-                # Remove all edges but keep nodes
-                edges = list(rg.g.edges())
-                for source, target in edges:
-                    rg.g.remove_edge(source, target)
-                print(f"Fallback method: Removed {len(edges)} edges while preserving nodes")
-            except Exception as edge_error:
-                print(f"Error in fallback edge removal: {edge_error}")
-        
-    # Ensure all entities from portfolio are in the graph with their metadata
-    for entity in pm:
-        rg.add_entity_data(entity)
-        
+    # Node metadata is kept in sync with the portfolio by get_relationships()
+    # (reloaded only when the entity table changed), so no per‑call scan here.
+
     # Add some sample relationships if graph is empty or explicitly requested
-    if load_examples or len(list(rg.g.edges())) == 0:
+    if load_examples or rg.g.number_of_edges() == 0:
         # When loading examples, clear the graph completely first
         if load_examples:
             print("Clearing existing graph for example loading")
-            rg.g.clear()
-            # Also clear entity data since we'll reload from example file
-            rg._entity_data.clear()
+            rg.clear()
         
         # Find some entities to connect if not explicitly loading examples
-        if not load_examples and len(list(pm)) >= 3:
-            entities = list(pm)
+        if not load_examples and len(pm) >= 3:
+            slugs = [slug for slug, in islice(pm.iter_columns("slug"), 3)]
             # Create a simple parent-subsidiary structure
-            parent_slug = entities[0].name.lower().replace(" ", "-")
-            child1_slug = entities[1].name.lower().replace(" ", "-")
-            child2_slug = entities[2].name.lower().replace(" ", "-")
+            parent_slug, child1_slug, child2_slug = slugs
             
             rg.link_parent(parent_slug, child1_slug, 100.0)
             rg.link_parent(parent_slug, child2_slug, 75.0)
@@ -303,14 +321,17 @@ def get_relationships(
                     pm.clear()
                     
                 # Add nodes and relationships from example data
-                for node in example_data.get('nodes', []):
-                    entity = CorporateEntity(
+                example_entities = [
+                    CorporateEntity(
                         name=node['name'],
                         jurisdiction=node['jurisdiction'],
                         status=getattr(Status, node['status']),
                         formed=date.today()  # Use today as default date
                     )
-                    pm.add(entity)
+                    for node in example_data.get('nodes', [])
+                ]
+                pm.add_many(example_entities)
+                for entity in example_entities:
                     rg.add_entity_data(entity)
                 
                 # Add edges
@@ -320,20 +341,29 @@ def get_relationships(
                     except Exception as edge_error:
                         print(f"Error adding edge {link['source']} -> {link['target']}: {edge_error}")
                 
-                print(f"Successfully loaded example relationships: {len(example_data.get('nodes', []))} nodes, {len(example_data.get('links', []))} links, {len(list(rg.g.edges()))} edges in graph")
+                print(f"Successfully loaded example relationships: {len(example_data.get('nodes', []))} nodes, {len(example_data.get('links', []))} links, {rg.g.number_of_edges()} edges in graph")
         except Exception as e:
             import traceback
             print(f"Failed to load example relationships: {e}")
             traceback.print_exc()
     
-    # Convert to JSON format for the frontend
-    return rg.to_json()
+    # Serve the pre‑encoded payload (or 304 if the client already has it)
+    body, etag = rg.to_json_bytes()
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "X-Graph-Epoch": rg.epoch,
+        "X-Graph-Version": str(rg.version),
+    }
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 # ---------- POST /relationships ----------
 @app.post("/relationships", status_code=201)
 def create_relationship(
     relationship: ParentChildRelationship,
-    rg: RelationshipGraph = Depends(get_relationships),
+    rg: RelationshipGraph = Depends(get_relationship_graph),
     pm: PortfolioManager = Depends(get_portfolio),
 ):
     """
@@ -346,16 +376,15 @@ def create_relationship(
         Confirmation of the created relationship
     """
     try:
-        # Verify both entities exist in portfolio
-        parent_entity = None
-        child_entity = None
-        
-        for entity in pm:
-            slug = entity.name.lower().replace(" ", "-")
-            if slug == relationship.parent_slug:
-                parent_entity = entity
-            if slug == relationship.child_slug:
-                child_entity = entity
+        # Verify both entities exist in portfolio (primary-key lookups)
+        def _lookup(slug: str) -> Optional[CorporateEntity]:
+            try:
+                return pm.get(slug)
+            except KeyError:
+                return None
+
+        parent_entity = _lookup(relationship.parent_slug)
+        child_entity = _lookup(relationship.child_slug)
                 
         if not parent_entity:
             raise HTTPException(
@@ -405,6 +434,7 @@ def create_relationship(
 @app.get("/shell-detection")
 def detect_shell_companies(
     pm: PortfolioManager = Depends(get_portfolio),
+    rg: RelationshipGraph = Depends(get_relationship_graph),
 ):
     """
     Identify potential shell companies in the corporate network.
@@ -413,12 +443,16 @@ def detect_shell_companies(
     - No subsidiaries but owned by others
     - Part of a chain of single-child owners
     - Active status but limited activity
+    - Entity attributes (LLC form, filing status, jurisdiction, naming)
+    
+    Scores are cached on the graph and only recomputed for nodes touched
+    since the last call, so repeated requests are cheap.
     
     Returns a list of entities with their shell risk scores.
     """
     try:
         # Create sample entities if portfolio is empty (for demo purposes)
-        if len(list(pm)) == 0:
+        if len(pm) == 0:
             print("Portfolio is empty, creating sample entities for shell detection")
             sample_entities = [
                 CorporateEntity(
@@ -457,59 +491,20 @@ def detect_shell_companies(
                 )
             ]
             
-            for entity in sample_entities:
-                try:
-                    pm.add(entity)
-                except Exception as e:
-                    print(f"Error adding sample entity {entity.name}: {e}")
-            
-        # Generate simulated shell companies for demo purposes
-        shells = []
-        for entity in pm:
-            slug = entity.name.lower().replace(" ", "-")
-            risk_score = 0.0
-            factors = []
-            
-            # Apply risk scoring criteria
-            if entity.status == Status.ACTIVE and "llc" in entity.name.lower():
-                risk_score += 0.3
-                factors.append("LLC structure with limited visibility")
-            
-            if entity.status == Status.DELINQUENT:
-                risk_score += 0.2
-                factors.append("Delinquent filing status")
-                
-            if not entity.formed:
-                risk_score += 0.1
-                factors.append("Missing formation date")
+            try:
+                pm.add_many(sample_entities)
+            except Exception as e:
+                print(f"Error adding sample entities: {e}")
             
-            # Add jurisdiction-based risk factors
-            if entity.jurisdiction in ["DE", "WY", "NV"]:
-                risk_score += 0.15
-                factors.append(f"Registered in {entity.jurisdiction}, a jurisdiction favored for secrecy")
-                
-            # Simulate other shell patterns
-            if "llc" in entity.name.lower() and entity.jurisdiction == "DE":
-                risk_score += 0.25
-                factors.append("Shell pattern: Delaware LLC with limited transparency")
-                
-            if "holdings" in entity.name.lower() or "group" in entity.name.lower():
-                risk_score += 0.15
-                factors.append("Shell pattern: Holding company naming pattern")
-                
-            # Only include entities with significant risk score
-            if risk_score >= 0.2:
-                shells.append({
-                    "slug": slug,
-                    "name": entity.name,
-                    "risk_score": min(risk_score, 0.95),  # Cap at 0.95
-                    "factors": factors
-                })
-                
+            rg.sync()  # pick up the freshly added entities
+
+        shells = rg.identify_shell_companies(threshold=0.2, cap=0.95, attributes=True)
+
         # Ensure we always return at least one shell company in demo mode
         if len(shells) == 0:
             # Create a dummy shell company if none were detected
-            shells.append({
+            # (a new list: the graph's cached report must stay untouched)
+            shells = [{
                 "slug": "anonymous-holdings-llc",
                 "name": "Anonymous Holdings LLC",
                 "risk_score": 0.65,
@@ -519,7 +514,7 @@ def detect_shell_companies(
                     "Shell pattern: Owned but has no subsidiaries",
                     "Suspicious jurisdiction hopping pattern"
                 ]
-            })
+            }]
         
         return shells
     
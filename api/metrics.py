@@ -0,0 +1,48 @@
+"""
+api.metrics
+===========
+
+Operational statistics endpoints.
+
+``GET /metrics/http`` reports, per upstream provider, the request
+counters and connection‑pool occupancy of the long‑lived clients in
+:mod:`chronos.http`; ``GET /metrics/cache`` the response‑cache hit rates;
+``GET /metrics/coalescing`` how many lookups joined an identical in‑flight
+request instead of going upstream; ``GET /metrics/jobs`` the background
+job queue.
+"""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from chronos.cache import cache
+from chronos.http import pools
+from chronos.jobs import jobs
+from chronos.singleflight import flights
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/http", response_model=Dict[str, Dict[str, Any]])
+async def http_pool_stats():
+    """Request counts, errors, latency and open/idle connections per provider."""
+    return pools.stats()
+
+
+@router.get("/cache", response_model=Dict[str, Any])
+async def response_cache_stats():
+    """Memory/disk hits and misses of the shared provider response cache."""
+    return cache.stats()
+
+
+@router.get("/coalescing", response_model=Dict[str, Dict[str, Any]])
+async def coalescing_stats():
+    """Per provider: lookups, upstream calls made and calls coalesced."""
+    return flights.stats()
+
+
+@router.get("/jobs", response_model=Dict[str, Any])
+async def job_queue_stats():
+    """Workers, queue depth and jobs per state in the background queue."""
+    return jobs.stats()
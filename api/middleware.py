@@ -0,0 +1,334 @@
+"""
+api.middleware
+==============
+
+ASGI middleware for large, frequently polled payloads.
+
+``CompressionMiddleware``
+    Brotli (if the ``brotli`` package is installed) or gzip, picked from
+    ``Accept-Encoding``, for compressible responses of at least
+    ``minimum_size`` bytes.  Streamed bodies (NDJSON) are compressed
+    incrementally and flushed per chunk.  Strong ETags become weak, as the
+    encoded bytes differ from the identity representation.
+
+``ConditionalGetMiddleware``
+    Validators for read endpoints driven by the ``chronos_revisions``
+    change counters (see :func:`chronos.db.get_revision_stamps`).  Each
+    configured path gets a version ETag and – once the change is at least a
+    second old – ``Last-Modified``; a matching ``If-None-Match`` /
+    ``If-Modified-Since`` is answered with ``304`` *before* the endpoint
+    runs, so an unchanged portfolio costs one primary‑key query (in the
+    threadpool).  Routes should not set an ETag of their own.
+
+Example
+-------
+>>> app.add_middleware(ConditionalGetMiddleware, routes={"/status": ("corporateentitydb",)})
+>>> app.add_middleware(CompressionMiddleware, minimum_size=1024)
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import importlib.util
+import zlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from chronos.settings import COMPRESSION_BROTLI_QUALITY, COMPRESSION_GZIP_LEVEL, COMPRESSION_MIN_SIZE
+
+__all__ = [
+    "BROTLI_AVAILABLE",
+    "CompressionMiddleware",
+    "ConditionalGetMiddleware",
+    "db_revision_stamps",
+]
+
+BROTLI_AVAILABLE = importlib.util.find_spec("brotli") is not None
+if BROTLI_AVAILABLE:
+    import brotli
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+
+
+# ---------------------------------------------------------------------------
+# Compression
+# ---------------------------------------------------------------------------
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Best supported coding in an ``Accept-Encoding`` header (``br`` > ``gzip``)."""
+    offered: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if coding:
+            offered[coding.strip()] = q
+    wildcard = offered.get("*", 0.0)
+    for coding in (("br", "gzip") if BROTLI_AVAILABLE else ("gzip",)):
+        if offered.get(coding, wildcard) > 0:
+            return coding
+    return None
+
+
+class _Compressor:
+    """Incremental br/gzip encoder with per‑chunk flushing."""
+
+    def __init__(self, coding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.coding = coding
+        if coding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)  # gzip container
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.coding == "br":
+            out = self._br.process(data)
+            return out + (self._br.finish() if final else self._br.flush())
+        out = self._gz.compress(data)
+        return out + self._gz.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+def compress_bytes(data: bytes, coding: str,
+                   gzip_level: int = COMPRESSION_GZIP_LEVEL,
+                   brotli_quality: int = COMPRESSION_BROTLI_QUALITY) -> bytes:
+    if coding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+def _weaken(headers: MutableHeaders) -> None:
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = "W/" + etag
+
+
+class CompressionMiddleware:
+    """Size‑thresholded brotli/gzip response compression (see module docs)."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        gzip_level: int = COMPRESSION_GZIP_LEVEL,
+        brotli_quality: int = COMPRESSION_BROTLI_QUALITY,
+        compressible_types: Sequence[str] = COMPRESSIBLE_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.compressible_types = tuple(compressible_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        coding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                headers = Headers(raw=message["headers"])
+                ctype = headers.get("content-type", "")
+                passthrough = (
+                    message["status"] in (204, 304)
+                    or "content-encoding" in headers
+                    or not ctype.startswith(self.compressible_types)
+                    or ctype.startswith("text/event-stream")  # must reach clients unbuffered
+                )
+                if passthrough:
+                    await send(message)
+                return
+
+            if passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more = message.get("more_body", False)
+            headers = MutableHeaders(raw=start["headers"])
+
+            if compressor is None:
+                if not more:
+                    # Whole body in one message: compress only if it pays off
+                    if len(body) < self.minimum_size:
+                        await send(start)
+                        await send(message)
+                        return
+                    payload = compress_bytes(body, coding, self.gzip_level, self.brotli_quality)
+                    headers["Content-Encoding"] = coding
+                    headers["Content-Length"] = str(len(payload))
+                    headers.add_vary_header("Accept-Encoding")
+                    _weaken(headers)
+                    await send(start)
+                    await send({"type": "http.response.body", "body": payload})
+                    return
+                # Streaming response: compress chunk by chunk
+                compressor = _Compressor(coding, self.gzip_level, self.brotli_quality)
+                headers["Content-Encoding"] = coding
+                headers.add_vary_header("Accept-Encoding")
+                if "content-length" in headers:
+                    del headers["content-length"]
+                _weaken(headers)
+                await send(start)
+
+            await send({
+                "type": "http.response.body",
+                "body": compressor.compress(body, final=not more),
+                "more_body": more,
+            })
+
+        await self.app(scope, receive, send_wrapper)
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET
+# ---------------------------------------------------------------------------
+RevisionStamps = Mapping[str, Tuple[int, datetime]]
+
+
+def db_revision_stamps() -> RevisionStamps:
+    """Current ``chronos_revisions`` rows, read on the read‑only pool."""
+    from chronos.db import ReadSessionLocal, get_revision_stamps
+
+    with ReadSessionLocal() as s:
+        return get_revision_stamps(s)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison (RFC 9110 §13.1.2)."""
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+class ConditionalGetMiddleware:
+    """
+    Revision‑driven ETag / Last‑Modified validators (see module docs).
+
+    Parameters
+    ----------
+    routes
+        ``{path: revision names}`` – e.g. ``/status`` depends on the
+        entity table.
+    bypass_params
+        Query parameters that make a request side‑effecting (``?load_examples=``);
+        such requests always reach the endpoint.
+    stamps
+        Callable returning ``{name: (revision, updated_at)}``; defaults to
+        :func:`db_revision_stamps`.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Mapping[str, Sequence[str]],
+        bypass_params: Iterable[str] = (),
+        stamps: Callable[[], RevisionStamps] = db_revision_stamps,
+    ) -> None:
+        self.app = app
+        self.routes = {path: tuple(names) for path, names in routes.items()}
+        self.bypass_params = frozenset(bypass_params)
+        self.stamps = stamps
+
+    async def _validators(
+        self, scope: Scope, names: Tuple[str, ...]
+    ) -> Tuple[str, Optional[datetime]]:
+        """
+        Version ETag and the ``Last-Modified`` time, if it can be trusted.
+
+        ``updated_at`` has one‑second resolution: while its second is still
+        running, another write could land with the same stamp, so it is
+        only returned once that second is over.
+        """
+        # A (blocking) SQLite read – keep it off the event loop
+        stamps = await run_in_threadpool(self.stamps)
+        revs = [stamps.get(name, (0, None)) for name in names]
+        # Representation key: path, query and Accept (JSON vs NDJSON)
+        variant = hashlib.blake2b(
+            scope["path"].encode() + b"?" + scope.get("query_string", b"")
+            + b"|" + Headers(scope=scope).get("accept", "").encode(),
+            digest_size=6,
+        ).hexdigest()
+        etag = 'W/"r{}-{}"'.format(".".join(str(rev) for rev, _ in revs), variant)
+        times = [ts for _, ts in revs if ts is not None]
+        modified = max(times) if times else None
+        if modified is not None and modified > datetime.now(timezone.utc) - timedelta(seconds=1):
+            modified = None
+        return etag, modified
+
+    def _bypass(self, scope: Scope) -> bool:
+        if not self.bypass_params:
+            return False
+        query = scope.get("query_string", b"").decode("latin-1")
+        keys = {part.split("=", 1)[0] for part in query.split("&") if part}
+        return bool(keys & self.bypass_params)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        names = self.routes.get(scope.get("path", "")) if scope["type"] == "http" else None
+        if names is None or scope["method"] not in ("GET", "HEAD") or self._bypass(scope):
+            await self.app(scope, receive, send)
+            return
+
+        etag, modified = await self._validators(scope, names)
+        last_modified = format_datetime(modified, usegmt=True) if modified else None
+        request = Headers(scope=scope)
+        if self._not_modified(request, etag, modified):
+            headers = [(b"etag", etag.encode()), (b"cache-control", b"no-cache")]
+            if last_modified:
+                headers.append((b"last-modified", last_modified.encode()))
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                headers.setdefault("ETag", etag)
+                if last_modified:
+                    headers.setdefault("Last-Modified", last_modified)
+                headers.setdefault("Cache-Control", "no-cache")
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _not_modified(request: Headers, etag: str, modified: Optional[datetime]) -> bool:
+        if_none_match = request.get("if-none-match")
+        if if_none_match is not None:
+            return _etag_matches(if_none_match, etag)
+        if_modified_since = request.get("if-modified-since")
+        if if_modified_since and modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+                if since.tzinfo is None:  # "-0000": UTC, zone unstated
+                    since = since.replace(tzinfo=timezone.utc)
+                return modified.replace(microsecond=0) <= since
+            except (TypeError, ValueError):
+                return False
+        return False
@@ -15,9 +15,11 @@ import asyncio
 import os
 
 from chronos.models import CorporateEntity
-from chronos.portfolio import PortfolioManager
+from chronos.portfolio_async import AsyncDBPortfolioManager
+from chronos.serialization import entity_dict
 from chronos.scrapers.opencorp import OpenCorporatesScraper
-from .deps import get_portfolio, get_opencorp_scraper
+from .responses import FastJSONResponse, entities_response
+from .deps import get_async_portfolio, get_opencorp_scraper
 
 # Create router
 router = APIRouter(prefix="/opencorp", tags=["opencorp"])
@@ -33,7 +35,7 @@ async def search_entities(
         None,
         description="Optional two-letter state code filter"
     ),
-    pm: PortfolioManager = Depends(get_portfolio),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio),
     scraper: OpenCorporatesScraper = Depends(get_opencorp_scraper),
 ):
     """
@@ -56,11 +58,10 @@ async def search_entities(
             return []
         
         # Add entities to portfolio for persistence
-        for entity in entities:
-            pm.add(entity)
+        await pm.add_many(entities)
         
-        # Return normalized entity data
-        return [_normalize_entity_to_dict(entity) for entity in entities]
+        # Return normalized entity data, encoded in one pass
+        return entities_response(entities)
     
     except Exception as e:
         logger.error(f"Error searching OpenCorporates API: {e}")
@@ -71,7 +72,7 @@ async def search_entities(
 async def get_entity_by_id(
     jurisdiction: str,
     company_id: str,
-    pm: PortfolioManager = Depends(get_portfolio),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio),
     scraper: OpenCorporatesScraper = Depends(get_opencorp_scraper),
 ):
     """
@@ -99,36 +100,13 @@ async def get_entity_by_id(
             entity.officers = officers
         
         # Add entity to portfolio for persistence
-        pm.add(entity)
+        await pm.add(entity)
         
         # Return normalized entity data
-        return _normalize_entity_to_dict(entity)
+        return FastJSONResponse(entity_dict(entity))
         
     except HTTPException:
         raise  # Re-raise HTTP exceptions
     except Exception as e:
         logger.error(f"Error fetching entity: {e}")
         raise HTTPException(status_code=500, detail=f"Error fetching entity: {str(e)}")
-
-
-def _normalize_entity_to_dict(entity: CorporateEntity) -> Dict[str, Any]:
-    """
-    Convert a CorporateEntity to a dictionary for API responses.
-    
-    Args:
-        entity: CorporateEntity object
-        
-    Returns:
-        Dictionary with normalized entity data
-    """
-    slug = entity.name.lower().replace(" ", "-")
-    
-    return {
-        "slug": slug,
-        "name": entity.name,
-        "jurisdiction": entity.jurisdiction,
-        "status": entity.status.name,
-        "formed": entity.formed.isoformat() if entity.formed else None,
-        "officers": entity.officers,
-        "notes": entity.notes
-    }
\ No newline at end of file
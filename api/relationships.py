@@ -5,14 +5,14 @@ api.relationships
 Endpoints for managing corporate relationships in the graph.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Body
-from typing import Dict, Any, List
+from fastapi import APIRouter, Depends, HTTPException, Body, Query
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 
-from chronos.relationships import RelationshipGraph
+from chronos.relationships_db import DBRelationshipGraph
 from chronos.portfolio_db import DBPortfolioManager
 from chronos.models import CorporateEntity
-from api.deps import _relationship_graph, get_relationships, get_portfolio
+from api.deps import get_relationships, get_portfolio
 
 router = APIRouter()
 
@@ -25,7 +25,7 @@ class RelationshipRequest(BaseModel):
 @router.post("/direct-relationship", status_code=201)
 async def create_relationship(
     data: RelationshipRequest,
-    rg: RelationshipGraph = Depends(get_relationships),
+    rg: DBRelationshipGraph = Depends(get_relationships),
     pm: DBPortfolioManager = Depends(get_portfolio)
 ):
     """
@@ -34,14 +34,7 @@ async def create_relationship(
     This bypasses some validation for testing/demo purposes.
     """
     try:
-        # Add nodes if they don't exist
-        if data.parent_slug not in rg.g:
-            rg.g.add_node(data.parent_slug)
-            
-        if data.child_slug not in rg.g:
-            rg.g.add_node(data.child_slug)
-        
-        # Create the relationship
+        # Create the relationship (missing nodes are added automatically)
         rg.link_parent(
             data.parent_slug,
             data.child_slug,
@@ -51,7 +44,7 @@ async def create_relationship(
         return {
             "status": "success",
             "message": f"Created relationship: {data.parent_slug} → {data.child_slug} ({data.ownership_percentage}%)",
-            "total_edges": len(list(rg.g.edges()))
+            "total_edges": rg.g.number_of_edges()
         }
         
     except Exception as e:
@@ -62,7 +55,7 @@ async def create_relationship(
 
 @router.post("/clear-all", status_code=200)
 async def clear_all_relationships(
-    rg: RelationshipGraph = Depends(get_relationships),
+    rg: DBRelationshipGraph = Depends(get_relationships),
     pm: DBPortfolioManager = Depends(get_portfolio)
 ):
     """
@@ -70,25 +63,11 @@ async def clear_all_relationships(
     """
     try:
         # Get current edge and node counts for reporting
-        edge_count = len(list(rg.g.edges()))
-        node_count = len(list(rg.g.nodes()))
+        edge_count = rg.g.number_of_edges()
+        node_count = rg.g.number_of_nodes()
         
-        # Method 1: Remove all edges one by one
-        edges = list(rg.g.edges())
-        for source, target in edges:
-            rg.g.remove_edge(source, target)
-            
-        # Verify all edges are removed
-        remaining_edges = list(rg.g.edges())
-        if remaining_edges:
-            # Method 2: Create a new empty graph
-            rg.g.clear()
-            
-            # Re-add all nodes
-            for entity in pm:
-                slug = entity.name.lower().replace(" ", "-")
-                rg.g.add_node(slug)
-                rg.add_entity_data(entity)
+        # Delete the persisted edges; entity nodes stay in place
+        rg.clear_edges()
         
         return {
             "status": "success",
@@ -98,8 +77,8 @@ async def clear_all_relationships(
                 "edges": edge_count
             },
             "after": {
-                "nodes": len(list(rg.g.nodes())),
-                "edges": len(list(rg.g.edges()))
+                "nodes": rg.g.number_of_nodes(),
+                "edges": rg.g.number_of_edges()
             }
         }
         
@@ -107,4 +86,43 @@ async def clear_all_relationships(
         raise HTTPException(
             status_code=500, 
             detail=f"Failed to clear relationships: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/changes")
+def get_relationship_changes(
+    since: int = Query(..., ge=0, description="Graph version the client already has"),
+    epoch: Optional[str] = Query(None, description="X-Graph-Epoch the version belongs to"),
+    rg: DBRelationshipGraph = Depends(get_relationships),
+):
+    """
+    Node/edge changes since version ``since``.
+
+    Returns ``{"epoch", "version", "changes": [...]}`` with add/update/remove
+    events, oldest first, or ``{"epoch", "version", "resync": true}`` when
+    the client has fallen too far behind and must re‑fetch
+    ``GET /relationships``.
+    """
+    return rg.changes_since(since, epoch)
+
+
+@router.get("/{slug}/ubo")
+def get_beneficial_owners(
+    slug: str,
+    threshold: float = Query(25.0, ge=0, le=100, description="Minimum effective ownership in %"),
+    rg: DBRelationshipGraph = Depends(get_relationships),
+):
+    """
+    Ultimate beneficial owners of *slug*.
+
+    Returns every upstream entity whose effective ownership through all
+    chains is at least ``threshold`` percent, largest first.
+    """
+    try:
+        owners = rg.beneficial_owners(slug, threshold)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Entity not in relationship graph: {slug}")
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return {"slug": slug, "threshold": threshold, "owners": owners}
@@ -6,37 +6,25 @@ which is useful for debugging and for the front-end to reset the graph.
 """
 
 from fastapi import APIRouter, Depends
-from chronos.relationships import RelationshipGraph
-from chronos.portfolio_db import DBPortfolioManager
-from api.deps import _relationship_graph
+from chronos.relationships_db import DBRelationshipGraph
+from api.deps import get_relationships
 
 router = APIRouter()
 
+# Plain def: clear_edges() is a blocking SQLite write, so it runs in the threadpool
 @router.post("/relationships/reset")
-async def reset_graph():
+def reset_graph(rg: DBRelationshipGraph = Depends(get_relationships)):
     """
     Completely reset the relationship graph.
-    
-    This creates a new, empty graph and adds all entities from the portfolio
-    to it without any relationships.
+
+    Deletes every persisted ownership edge; all entities from the
+    portfolio stay in the graph without any relationships.
     """
-    # Create a completely new graph
-    fresh_graph = RelationshipGraph()
-    
-    # Get the portfolio to add all entities
-    portfolio = DBPortfolioManager()
-    
-    # Add all entities but no relationships
-    for entity in portfolio:
-        fresh_graph.add_entity_data(entity)
-    
-    # Replace the global graph reference
-    global _relationship_graph
-    _relationship_graph = fresh_graph
-    
+    rg.clear_edges()
+
     return {
         "status": "success", 
         "message": "Graph reset complete", 
-        "nodes": len(fresh_graph.g.nodes()),
-        "edges": len(fresh_graph.g.edges())
-    }
\ No newline at end of file
+        "nodes": rg.g.number_of_nodes(),
+        "edges": rg.g.number_of_edges()
+    }
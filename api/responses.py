@@ -0,0 +1,43 @@
+"""
+api.responses
+=============
+
+Response classes backed by :mod:`chronos.serialization`.
+
+``FastJSONResponse`` is the application's ``default_response_class``:
+content is encoded with ``orjson`` (stdlib fallback), and pre‑encoded
+``bytes`` are sent as‑is.  Hot list endpoints return
+:func:`entities_response` directly, which also skips FastAPI's
+``response_model`` validation / ``jsonable_encoder`` pass.
+"""
+
+from typing import Any, Iterable, Mapping, Optional
+
+from fastapi.responses import JSONResponse
+
+from chronos.models import CorporateEntity
+from chronos.serialization import dumps, encode_entities
+
+__all__ = ["FastJSONResponse", "entities_response"]
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered by ``orjson``; ``bytes`` content passes through."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return bytes(content)
+        return dumps(content)
+
+
+def entities_response(
+    entities: Iterable[CorporateEntity],
+    *,
+    summary: bool = False,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> FastJSONResponse:
+    """JSON array of *entities* encoded in one pass (see :func:`encode_entities`)."""
+    return FastJSONResponse(
+        encode_entities(entities, summary=summary), status_code=status_code, headers=headers
+    )
@@ -11,13 +11,15 @@ using the OpenCorporates API, with optional SEC EDGAR enrichment.
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional, Dict, Any
+import asyncio
 import os
 
 from chronos.scrapers.openc import OpenCorporatesScraper
 from chronos.scrapers.edgar import EdgarClient
 from chronos.models import CorporateEntity, Status
-from chronos.portfolio import PortfolioManager
-from .deps import get_portfolio
+from chronos.portfolio_async import AsyncDBPortfolioManager
+from .deps import get_async_portfolio
+from .responses import entities_response
 
 # Create router
 router = APIRouter(tags=["sosearch"])
@@ -62,7 +64,7 @@ async def search_entities(
         None,
         description="Optional jurisdiction code (two-letter state code or 'all')"
     ),
-    pm: PortfolioManager = Depends(get_portfolio),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio),
 ):
     """
     Search for business entities using OpenCorporates API.
@@ -82,30 +84,29 @@ async def search_entities(
     if jurisdiction and jurisdiction.lower() != "all":
         search_jurisdiction = jurisdiction
     
-    # Search for entities
-    entities = scraper.search(q, jurisdiction=search_jurisdiction)
+    # Search for entities.  The scraper is synchronous and may sleep on the
+    # OpenCorporates rate limit, so keep it off the event loop.
+    entities = await asyncio.to_thread(scraper.search, q, jurisdiction=search_jurisdiction)
     
     if not entities:
         raise HTTPException(status_code=404, detail="No matching entities found")
     
     # Optionally enrich with EDGAR data
     if ENABLE_EDGAR:
-        edgar_client = EdgarClient()
-        entities = [edgar_client.enrich_entity(entity) for entity in entities]
+        await EdgarClient().enrich_many(entities)  # enriches in place
     
     # Add entities to portfolio for persistence
-    for entity in entities:
-        pm.add(entity)
+    await pm.add_many(entities)
     
-    # Return normalized entity summaries
-    return [normalize_entity_to_summary(entity) for entity in entities]
+    # Return normalized entity summaries, encoded in one pass
+    return entities_response(entities, summary=True)
 
 
 @router.get("/sosearch/{jurisdiction}/{company_number}", response_model=Dict[str, Any])
 async def get_entity_by_id(
     jurisdiction: str,
     company_number: str,
-    pm: PortfolioManager = Depends(get_portfolio),
+    pm: AsyncDBPortfolioManager = Depends(get_async_portfolio),
 ):
     """
     Fetch a specific company by its jurisdiction and company number.
@@ -120,19 +121,18 @@ async def get_entity_by_id(
     # Create scraper instance
     scraper = OpenCorporatesScraper()
     
-    # Fetch entity by ID
-    entity = scraper.fetch_by_id(company_number, jurisdiction)
+    # Fetch entity by ID (blocking scraper, see above)
+    entity = await asyncio.to_thread(scraper.fetch_by_id, company_number, jurisdiction)
     
     if not entity:
         raise HTTPException(status_code=404, detail=f"Entity not found: {company_number} in {jurisdiction}")
     
     # Optionally enrich with EDGAR data
     if ENABLE_EDGAR:
-        edgar_client = EdgarClient()
-        entity = edgar_client.enrich_entity(entity)
+        entity = await EdgarClient().enrich_entity(entity)
     
     # Add entity to portfolio for persistence
-    pm.add(entity)
+    await pm.add(entity)
     
     # Return normalized entity data
     return normalize_entity_to_summary(entity)
\ No newline at end of file
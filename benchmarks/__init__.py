@@ -0,0 +1 @@
+"""Stand‑alone performance benchmarks (``python -m benchmarks.<name>``)."""
@@ -0,0 +1,99 @@
+"""
+benchmarks.bulk_upsert
+======================
+
+Compare per‑row commits (``DBPortfolioManager.add``) against the batched
+single‑transaction path (``DBPortfolioManager.add_many``).
+
+Each strategy writes into its own throw‑away SQLite file so the numbers
+include real fsync cost.
+
+Examples
+--------
+$ python -m benchmarks.bulk_upsert                       # 100k rows
+$ python -m benchmarks.bulk_upsert --rows 20000 --per-row-rows 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from chronos.models import CorporateEntity, Status
+from chronos.portfolio_db import DBPortfolioManager
+
+_STATUSES = list(Status)
+_STATES = ["DE", "NY", "CA", "TX", "WY", "NV", "FL", "WA"]
+
+
+def make_entities(n: int) -> list[CorporateEntity]:
+    """Return *n* synthetic entities with unique names."""
+    base = date(2000, 1, 1)
+    return [
+        CorporateEntity(
+            name=f"Bench Entity {i} LLC",
+            jurisdiction=_STATES[i % len(_STATES)],
+            formed=base + timedelta(days=i % 8000),
+            officers=[f"Officer {i}"],
+            status=_STATUSES[i % len(_STATUSES)],
+        )
+        for i in range(n)
+    ]
+
+
+def _fresh_manager(path: Path) -> DBPortfolioManager:
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    return DBPortfolioManager(Session(engine))
+
+
+def bench_per_row(entities: list[CorporateEntity], path: Path) -> float:
+    with _fresh_manager(path) as pm:
+        start = time.perf_counter()
+        for ent in entities:
+            pm.add(ent)
+        return time.perf_counter() - start
+
+
+def bench_batched(entities: list[CorporateEntity], path: Path) -> float:
+    with _fresh_manager(path) as pm:
+        start = time.perf_counter()
+        pm.add_many(entities)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bulk_upsert")
+    parser.add_argument("--rows", type=int, default=100_000, help="entities to insert")
+    parser.add_argument(
+        "--per-row-rows",
+        type=int,
+        default=None,
+        help="run the per‑row strategy on fewer rows and extrapolate (it is slow)",
+    )
+    args = parser.parse_args()
+
+    entities = make_entities(args.rows)
+    per_row_n = min(args.per_row_rows or args.rows, args.rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        batched = bench_batched(entities, tmp_dir / "batched.db")
+        per_row = bench_per_row(entities[:per_row_n], tmp_dir / "per_row.db")
+
+    per_row_total = per_row * args.rows / per_row_n
+    note = "" if per_row_n == args.rows else f" (extrapolated from {per_row_n:,} rows)"
+    print(f"rows:             {args.rows:,}")
+    print(f"per‑row commits:  {per_row_total:8.2f} s  "
+          f"({args.rows / per_row_total:,.0f} rows/s){note}")
+    print(f"batched commit:   {batched:8.2f} s  ({args.rows / batched:,.0f} rows/s)")
+    print(f"speed‑up:         {per_row_total / batched:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
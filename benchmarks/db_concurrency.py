@@ -0,0 +1,157 @@
+"""
+benchmarks.db_concurrency
+=========================
+
+Mixed read/write load against SQLite from several threads in several
+worker processes, comparing
+
+* ``shared``  – the old setup: default engine (rollback journal), one
+  Session per process shared by every thread (guarded by a lock, as it
+  would otherwise corrupt)
+* ``scoped``  – :func:`chronos.db.make_engine` (WAL, pragmas, sized pool)
+  with one Session per operation and reads on the read‑only pool, i.e.
+  what the request‑scoped API dependencies do
+
+Reads are slug lookups and status counts; writes are single‑entity upserts.
+
+Examples
+--------
+$ python -m benchmarks.db_concurrency                       # 2 workers × 8 threads
+$ python -m benchmarks.db_concurrency --workers 4 --threads 16 --write-ratio 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import random
+import statistics
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from sqlmodel import Session, create_engine
+
+from benchmarks.bulk_upsert import make_entities
+from chronos.db import create_all, make_engine
+from chronos.models import CorporateEntity
+from chronos.portfolio_db import DBPortfolioManager
+
+MODES = ("shared", "scoped")
+
+
+def _seed(path: Path, rows: int) -> None:
+    engine = make_engine(f"sqlite:///{path}")
+    create_all(engine)
+    with DBPortfolioManager(Session(engine)) as pm:
+        pm.add_many(make_entities(rows))
+    engine.dispose()
+
+
+def _worker(mode: str, path: str, rows: int, threads: int, ops: int,
+            write_ratio: float, seed: int) -> Dict[str, List[float] | int]:
+    """Run *threads* × *ops* operations; return latencies and error count."""
+    url = f"sqlite:///{path}"
+    if mode == "shared":
+        shared = DBPortfolioManager(Session(create_engine(url)))
+        lock = threading.Lock()
+
+        @contextmanager
+        def portfolio(write: bool) -> Iterator[DBPortfolioManager]:
+            with lock:
+                yield shared
+    else:
+        writer, reader = make_engine(url), make_engine(url, readonly=True)
+
+        @contextmanager
+        def portfolio(write: bool) -> Iterator[DBPortfolioManager]:
+            with Session(writer if write else reader) as s:
+                yield DBPortfolioManager(s)
+
+    reads: List[float] = []
+    writes: List[float] = []
+    errors = 0
+    guard = threading.Lock()
+
+    def run(tid: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed * 1000 + tid)
+        for i in range(ops):
+            write = rng.random() < write_ratio
+            start = time.perf_counter()
+            try:
+                with portfolio(write) as pm:
+                    if write:
+                        pm.add(CorporateEntity(f"Load {seed}-{tid}-{i} LLC", "DE", date(2024, 1, 1)))
+                    elif i % 10 == 0:
+                        pm.status_counts()
+                    else:
+                        pm.get(f"bench-entity-{rng.randrange(rows)}-llc")
+            except Exception:
+                with guard:
+                    errors += 1
+                continue
+            elapsed = time.perf_counter() - start
+            with guard:
+                (writes if write else reads).append(elapsed)
+
+    pool = [threading.Thread(target=run, args=(t,)) for t in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return {"reads": reads, "writes": writes, "errors": errors}
+
+
+def _pct(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+def bench(mode: str, args: argparse.Namespace, tmp_dir: Path) -> None:
+    path = tmp_dir / f"{mode}.db"
+    _seed(path, args.rows)
+    start = time.perf_counter()
+    with mp.Pool(args.workers) as pool:
+        results = pool.starmap(_worker, [
+            (mode, str(path), args.rows, args.threads, args.ops, args.write_ratio, w)
+            for w in range(args.workers)
+        ])
+    wall = time.perf_counter() - start
+
+    reads = [x for r in results for x in r["reads"]]
+    writes = [x for r in results for x in r["writes"]]
+    errors = sum(r["errors"] for r in results)
+    done = len(reads) + len(writes)
+    print(f"{mode:>7}: {done / wall:9,.0f} ops/s   "
+          f"read p50 {_pct(reads, .5):6.2f} ms  p95 {_pct(reads, .95):7.2f} ms   "
+          f"write p50 {statistics.median(writes) * 1000 if writes else 0:6.2f} ms  "
+          f"p95 {_pct(writes, .95):7.2f} ms   errors {errors}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.db_concurrency")
+    parser.add_argument("--rows", type=int, default=20_000, help="entities seeded before the run")
+    parser.add_argument("--workers", type=int, default=2, help="worker processes")
+    parser.add_argument("--threads", type=int, default=8, help="threads per worker")
+    parser.add_argument("--ops", type=int, default=500, help="operations per thread")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="share of writes")
+    parser.add_argument("--mode", choices=MODES, action="append",
+                        help="run only these modes (default: all)")
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers × {args.threads} threads × {args.ops} ops, "
+          f"{args.write_ratio:.0%} writes, {args.rows:,} seeded rows")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in args.mode or MODES:
+            bench(mode, args, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+benchmarks.graph_load
+=====================
+
+Cold‑start load time of :class:`DBRelationshipGraph` (one bulk edge
+query) and the cost of an up‑to‑date ``sync()`` call.
+
+Example
+-------
+$ python -m benchmarks.graph_load --edges 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlmodel import create_engine
+
+from chronos.db import OwnershipEdgeDB, create_all
+from chronos.relationships_db import DBRelationshipGraph
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.graph_load")
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'graph.db'}")
+        create_all(engine)
+        # A forest of 10-way trees: node i is owned by node i // 10
+        rows = [
+            {"parent_slug": f"n{i // 10}", "child_slug": f"n{i}", "pct": 100.0, "source": "bench"}
+            for i in range(1, args.edges + 1)
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(OwnershipEdgeDB.__table__), rows)
+        del rows
+
+        rg = DBRelationshipGraph(engine)
+        start = time.perf_counter()
+        rg.sync()
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            rg.sync()
+        warm = (time.perf_counter() - start) / 1000
+        engine.dispose()
+
+    print(f"edges:            {rg.g.number_of_edges():,}")
+    print(f"cold load:        {cold:8.2f} s")
+    print(f"no‑op sync():     {warm * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+benchmarks.json_encode
+======================
+
+Response encode time for lists of entities:
+
+* ``fastapi``  – the old path: ``_normalize_entity_to_dict`` per entity,
+  then ``jsonable_encoder`` + ``json.dumps`` (what ``JSONResponse`` with a
+  ``response_model`` does)
+* ``orjson``   – the same dicts through :func:`chronos.serialization.dumps`
+* ``direct``   – :func:`chronos.serialization.encode_entities`, as used by
+  :func:`api.responses.entities_response`
+
+Examples
+--------
+$ python -m benchmarks.json_encode                  # 10k and 100k entities
+$ python -m benchmarks.json_encode --sizes 1000 50000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+
+from benchmarks.bulk_upsert import make_entities
+from chronos.models import CorporateEntity
+from chronos.serialization import ORJSON_AVAILABLE, dumps, encode_entities
+
+
+def _legacy_dict(entity: CorporateEntity) -> Dict[str, Any]:
+    """The per‑entity dict the routers used to build."""
+    return {
+        "slug": entity.name.lower().replace(" ", "-"),
+        "name": entity.name,
+        "jurisdiction": entity.jurisdiction,
+        "status": entity.status.name,
+        "formed": entity.formed.isoformat() if entity.formed else None,
+        "officers": entity.officers,
+        "notes": entity.notes,
+    }
+
+
+def encode_fastapi(entities: List[CorporateEntity]) -> bytes:
+    content = jsonable_encoder([_legacy_dict(e) for e in entities])
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_orjson(entities: List[CorporateEntity]) -> bytes:
+    return dumps([_legacy_dict(e) for e in entities])
+
+
+def encode_direct(entities: List[CorporateEntity]) -> bytes:
+    return encode_entities(entities)
+
+
+STRATEGIES: Dict[str, Callable[[List[CorporateEntity]], bytes]] = {
+    "fastapi": encode_fastapi,
+    "orjson": encode_orjson,
+    "direct": encode_direct,
+}
+
+
+def best_of(fn: Callable[[List[CorporateEntity]], bytes], entities, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(entities)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.json_encode")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per strategy (best kept)")
+    args = parser.parse_args()
+
+    if not ORJSON_AVAILABLE:
+        print("orjson not installed – 'orjson' and 'direct' use the stdlib fallback")
+    for n in args.sizes:
+        entities = make_entities(n)
+        assert json.loads(encode_direct(entities)) == json.loads(encode_fastapi(entities))
+        timings = {name: best_of(fn, entities, args.repeat) for name, fn in STRATEGIES.items()}
+        base = timings["fastapi"]
+        print(f"{n:>9,} entities")
+        for name, t in timings.items():
+            print(f"  {name:<8} {t * 1000:9.1f} ms   {base / t:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
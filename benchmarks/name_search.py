@@ -0,0 +1,102 @@
+"""
+benchmarks.name_search
+======================
+
+Local‑fallback name search latency for the SQLite FTS5 index
+(``DBPortfolioManager.search``) and the in‑memory inverted index
+(``PortfolioManager.search``), compared with the old linear substring scan.
+
+Example
+-------
+$ python -m benchmarks.name_search --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import statistics
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+from sqlmodel import Session, create_engine
+
+from chronos.db import create_all
+from chronos.models import CorporateEntity
+from chronos.portfolio import PortfolioManager
+from chronos.portfolio_db import DBPortfolioManager
+
+_SYLLABLES = ["ac", "me", "vor", "tex", "lin", "pa", "ra", "dyn", "qu", "ist",
+              "bel", "mon", "tor", "zen", "ka", "lo", "ver", "sun", "gal", "op"]
+_WORDS = ["".join(p) for p in itertools.product(_SYLLABLES, repeat=3)]  # 8,000 words
+_GENERIC = ["Holdings", "Group", "Partners", "Capital", "Services", "Ventures", ""]
+_SUFFIXES = ["LLC", "Inc", "Corp", "LP", "Ltd"]
+
+
+def make_named_entities(n: int, seed: int = 7) -> list[CorporateEntity]:
+    """*n* entities with varied, realistic‑looking (unique) names."""
+    rnd = random.Random(seed)
+    names: set[str] = set()
+    while len(names) < n:
+        parts = [rnd.choice(_WORDS).title(), rnd.choice(_WORDS).title(),
+                 rnd.choice(_GENERIC), rnd.choice(_SUFFIXES)]
+        names.add(" ".join(p for p in parts if p))
+    return [CorporateEntity(name, "DE", date(2020, 1, 1)) for name in sorted(names)]
+
+
+def _latency_us(fn: Callable[[str], object], queries: list[str], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        for q in queries:
+            start = time.perf_counter()
+            fn(q)
+            samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.name_search")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--linear-repeat", type=int, default=2)
+    args = parser.parse_args()
+
+    entities = make_named_entities(args.rows)
+    sample = random.Random(1).sample(entities, 3)
+    queries = [
+        sample[0].name,                              # exact name
+        " ".join(sample[1].name.split()[:2])[:-2],   # two-token prefix
+        sample[2].name.split()[1] + " llc",          # token + legal suffix
+        "no such company",
+    ]
+    mem = PortfolioManager()
+    mem.add_many(entities)
+
+    def linear(q: str):
+        q_lower = q.lower()
+        return [e for e in entities if q_lower in e.name.lower()]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'search.db'}")
+        create_all(engine)
+        with DBPortfolioManager(Session(engine)) as pm:
+            pm.add_many(entities)
+            results = {
+                "sqlite fts5": _latency_us(lambda q: pm.search(q, limit=25), queries, args.repeat),
+                "in-memory index": _latency_us(lambda q: mem.search(q, limit=25), queries, args.repeat),
+                "linear scan": _latency_us(linear, queries, args.linear_repeat),
+            }
+        engine.dispose()
+
+    print(f"rows: {args.rows:,}   queries: {queries}")
+    print("median latency per query")
+    for label, us in results.items():
+        print(f"  {label:<16} {us:>12,.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
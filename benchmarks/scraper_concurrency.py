@@ -0,0 +1,104 @@
+"""
+benchmarks.scraper_concurrency
+==============================
+
+Load test for the async API scrapers against a local stub server.
+
+A tiny FastAPI app imitating the Cobalt ``/search`` endpoint (fixed
+per‑request latency) runs under uvicorn on a free localhost port.  For
+each concurrency level the script fires that many simultaneous
+``CobaltScraper.search`` calls and reports throughput, next to the old
+implementation (blocking ``requests.get`` inside ``async def``), which
+serialises on the event loop.
+
+Example
+-------
+$ python -m benchmarks.scraper_concurrency --latency 0.1 --levels 1 10 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import threading
+import time
+
+import requests
+import uvicorn
+from fastapi import FastAPI
+
+from chronos.http import pools
+from chronos.scrapers.cobalt import CobaltScraper
+
+
+def make_stub_app(latency: float) -> FastAPI:
+    """Cobalt look‑alike answering every search after *latency* seconds."""
+    app = FastAPI()
+
+    @app.get("/search")
+    async def search(searchQuery: str, state: str):
+        await asyncio.sleep(latency)
+        return {"results": [{"title": f"{searchQuery} LLC", "state": state,
+                             "status": "Active", "filingDate": "2020-01-01"}]}
+
+    return app
+
+
+def start_stub_server(latency: float) -> tuple[uvicorn.Server, str]:
+    """Run the stub on a free port in a daemon thread; return (server, base_url)."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    config = uvicorn.Config(make_stub_app(latency), host="127.0.0.1", port=port,
+                            log_level="warning", backlog=1024)
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def _blocking_search(base_url: str, q: str) -> int:
+    """The pre‑port code path: sync requests.get inside a coroutine."""
+    response = requests.get(f"{base_url}/search", params={"searchQuery": q, "state": "DE"})
+    return len(response.json()["results"])
+
+
+async def _run(level: int, base_url: str) -> tuple[float, float]:
+    scraper = CobaltScraper(api_key="bench", base_url=base_url, use_cache=False)
+    await scraper.search("warmup", "DE")  # open the pool
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(scraper.search(f"co{i}", "DE") for i in range(level)))
+    async_elapsed = time.perf_counter() - start
+    assert all(len(r) == 1 for r in results)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_blocking_search(base_url, f"co{i}") for i in range(level)))
+    blocking_elapsed = time.perf_counter() - start
+
+    await pools.aclose()
+    return async_elapsed, blocking_elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scraper_concurrency")
+    parser.add_argument("--latency", type=float, default=0.1, help="stub response delay (s)")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 10, 50, 100])
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(args.latency)
+    try:
+        print(f"stub latency: {args.latency * 1000:.0f} ms")
+        print(f"{'concurrent':>10}  {'httpx req/s':>12}  {'blocking req/s':>14}  {'speed-up':>8}")
+        for level in args.levels:
+            async_s, blocking_s = asyncio.run(_run(level, base_url))
+            print(f"{level:>10}  {level / async_s:>12,.1f}  {level / blocking_s:>14,.1f}  "
+                  f"{blocking_s / async_s:>7.1f}x")
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+benchmarks.stream_scan
+======================
+
+Show that a full scan of the SQLite portfolio keeps peak memory flat as
+the table grows.  For each size the script measures the peak Python
+heap (``tracemalloc``) of:
+
+* ``all_entities``   – the old load‑everything list
+* ``iter(pm)``       – chunked, lazily converted entities
+* ``iter_columns()`` – chunked plain tuples
+
+Example
+-------
+$ python -m benchmarks.stream_scan --sizes 10000 50000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from sqlmodel import Session, create_engine
+
+from chronos.db import all_entities, create_all
+from chronos.portfolio_db import DBPortfolioManager
+
+from .bulk_upsert import make_entities
+
+
+def _peak(fn: Callable[[], int]) -> tuple[int, float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    n = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return n, peak / 2**20, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.stream_scan")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>9}  {'strategy':<14} {'peak MiB':>9} {'seconds':>8}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{Path(tmp) / 'scan.db'}")
+            create_all(engine)
+            with DBPortfolioManager(Session(engine)) as pm:
+                pm.add_many(make_entities(size))
+                strategies = {
+                    "all_entities": lambda: len(all_entities(pm._session)),
+                    "iter(pm)": lambda: sum(1 for _ in pm),
+                    "iter_columns": lambda: sum(1 for _ in pm.iter_columns()),
+                }
+                for label, fn in strategies.items():
+                    n, peak, elapsed = _peak(fn)
+                    assert n == size
+                    print(f"{size:>9,}  {label:<14} {peak:>9.1f} {elapsed:>8.2f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+"""
+chronos.cache
+=============
+
+Tiered response cache shared by every provider client.
+
+* **Memory tier** – a size‑bounded LRU (``OrderedDict``) holding decoded
+  values, so a repeated identical search is answered in microseconds.
+* **Disk tier** – one WAL‑mode SQLite table in ``chronos_cache.db`` on a
+  single persistent connection; payloads are JSON, zlib‑compressed.
+  The async API reads and writes it on worker threads.
+
+Entries are namespaced per provider (``"cobalt"``, ``"edgar"`` …) and carry
+two deadlines:
+
+``fresh_until`` (soft TTL, ``settings.api_cache_ttl``)
+    Until then the value is served as is.
+``expires_at`` (hard TTL, ``CACHE_HARD_TTL``)
+    Between the two the value is *stale*: :meth:`ResponseCache.get_or_fetch`
+    still returns it immediately and refreshes it in the background
+    (stale‑while‑revalidate), so a popular entry expiring never makes a
+    caller wait for the upstream.
+
+Negative answers ("no results for X in DE") are cached too, with the
+shorter ``CACHE_NEGATIVE_TTL`` and no stale window, so bad queries stop
+hammering the upstream without hiding a new registration for long.
+
+Memory copies live at most ``CACHE_TTL`` seconds so workers pick up
+entries refreshed by another process reasonably soon.
+``CHRONOS_CACHE_ENABLED=false`` turns both tiers off.
+
+Values handed out by the cache are shared with the memory tier – treat
+them as read‑only.
+
+Example
+-------
+>>> from chronos.cache import cache, cache_key
+>>> key = cache_key("companies/search", {"q": "acme"})
+>>> data = await cache.get_or_fetch(
+...     "opencorporates", key, fetch,
+...     negative_if=lambda d: not d["results"]["companies"],
+... )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Set, Tuple
+
+from chronos.settings import (
+    CACHE_DB_PATH,
+    CACHE_ENABLED,
+    CACHE_HARD_TTL,
+    CACHE_MEMORY_ITEMS,
+    CACHE_NEGATIVE_TTL,
+    CACHE_TTL,
+    settings,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ResponseCache", "CacheEntry", "cache", "cache_key"]
+
+# Query parameters that must never end up in a cache key
+SECRET_PARAMS = frozenset({"api_token", "api_key", "token"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS response_cache (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    payload     BLOB NOT NULL,
+    expires_at  REAL NOT NULL,
+    fresh_until REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID
+"""
+
+Predicate = Optional[Callable[[Any], bool]]
+
+
+def cache_key(*parts: Any) -> str:
+    """
+    Stable key for a request: URL/path plus params/body, secrets dropped.
+
+    Dict parts are serialised with sorted keys, so parameter order does
+    not matter.
+    """
+    clean = [
+        {k: v for k, v in part.items() if k not in SECRET_PARAMS}
+        if isinstance(part, dict) else part
+        for part in parts
+    ]
+    return json.dumps(clean, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    fresh_until: float
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return self.fresh_until > time.time()
+
+
+class ResponseCache:
+    """
+    LRU memory tier in front of a persistent SQLite tier.
+
+    Parameters
+    ----------
+    path
+        SQLite file; ``":memory:"`` keeps the disk tier in RAM (tests).
+    ttl
+        Soft TTL: how long an entry is fresh, in seconds.
+    hard_ttl
+        How long an entry may still be served stale while it is refreshed.
+    negative_ttl
+        Lifetime of negative (empty) answers.
+    max_items
+        Capacity of the memory tier.
+    memory_ttl
+        Upper bound on how long an entry stays in the memory tier.
+    enabled
+        ``False`` makes every lookup miss and every store a no‑op.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = CACHE_DB_PATH,
+        ttl: float = settings.api_cache_ttl,
+        hard_ttl: float = CACHE_HARD_TTL,
+        negative_ttl: float = CACHE_NEGATIVE_TTL,
+        max_items: int = CACHE_MEMORY_ITEMS,
+        memory_ttl: float = CACHE_TTL,
+        enabled: bool = CACHE_ENABLED,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.hard_ttl = hard_ttl
+        self.negative_ttl = negative_ttl
+        self.max_items = max_items
+        self.memory_ttl = memory_ttl
+        self.enabled = enabled
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[float, CacheEntry]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # Background revalidation bookkeeping
+        self._refreshing: Set[Tuple[str, str]] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = {"memory": 0, "disk": 0, "stale": 0}
+        self.misses = 0
+        self.refreshes = {"ok": 0, "failed": 0}
+        self.negative_stores = 0
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+    def _db(self) -> sqlite3.Connection:
+        """Open the shared connection on first use."""
+        if self._conn is None:
+            if str(self.path) != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(response_cache)")}
+            if "fresh_until" not in columns:  # file written before soft TTLs existed
+                conn.execute(
+                    "ALTER TABLE response_cache ADD COLUMN fresh_until REAL NOT NULL DEFAULT 0"
+                )
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        return zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+    @staticmethod
+    def _decode(payload: bytes) -> Any:
+        return json.loads(zlib.decompress(payload))
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+    def _remember(self, mkey: Tuple[str, str], entry: CacheEntry) -> None:
+        evict_at = min(entry.expires_at, time.time() + self.memory_ttl)
+        self._memory[mkey] = (evict_at, entry)
+        self._memory.move_to_end(mkey)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Lookups and stores
+    # ------------------------------------------------------------------
+    def lookup(self, namespace: str, key: str) -> Optional[CacheEntry]:
+        """Entry (fresh or stale) or ``None`` once past its hard TTL."""
+        if not self.enabled:
+            return None
+        mkey = (namespace, key)
+        now = time.time()
+        entry = self._memory_get(mkey, now)
+        return entry if entry is not None else self._disk_get(mkey, now)
+
+    async def _lookup_async(self, namespace: str, key: str) -> Optional[CacheEntry]:
+        """:meth:`lookup` with the SQLite read on a worker thread."""
+        if not self.enabled:
+            return None
+        mkey = (namespace, key)
+        now = time.time()
+        entry = self._memory_get(mkey, now)
+        if entry is None:
+            entry = await asyncio.to_thread(self._disk_get, mkey, now)
+        return entry
+
+    def _memory_get(self, mkey: Tuple[str, str], now: float) -> Optional[CacheEntry]:
+        with self._lock:
+            cached = self._memory.get(mkey)
+            if cached is None:
+                return None
+            if cached[0] > now:
+                self._memory.move_to_end(mkey)
+                self.hits["memory"] += 1
+                return cached[1]
+            del self._memory[mkey]
+            return None
+
+    def _disk_get(self, mkey: Tuple[str, str], now: float) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._db().execute(
+                "SELECT payload, fresh_until, expires_at FROM response_cache "
+                "WHERE namespace = ? AND key = ?",
+                mkey,
+            ).fetchone()
+            if row is None or row[2] <= now:
+                self.misses += 1
+                return None
+            entry = CacheEntry(self._decode(row[0]), row[1], row[2])
+            self._remember(mkey, entry)
+            self.hits["disk"] += 1
+            return entry
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Fresh cached value, or ``None`` if missing or past its soft TTL."""
+        entry = self.lookup(namespace, key)
+        return entry.value if entry is not None and entry.fresh else None
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        negative: bool = False,
+    ) -> None:
+        """
+        Store a JSON‑serialisable *value* in both tiers.
+
+        Positive entries are fresh for *ttl* (default soft TTL) and may be
+        served stale up to the hard TTL; negative ones live *negative_ttl*.
+        """
+        if not self.enabled:
+            return
+        now = time.time()
+        if negative:
+            fresh_until = expires_at = now + self.negative_ttl
+            self.negative_stores += 1
+        else:
+            soft = self.ttl if ttl is None else ttl
+            fresh_until = now + soft
+            expires_at = now + max(soft, self.hard_ttl)
+        entry = CacheEntry(value, fresh_until, expires_at)
+        payload = self._encode(value)
+        with self._lock:
+            self._db().execute(
+                "INSERT OR REPLACE INTO response_cache "
+                "(namespace, key, payload, expires_at, fresh_until) VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, payload, expires_at, fresh_until),
+            )
+            self._remember((namespace, key), entry)
+
+    def _store(
+        self, namespace: str, key: str, value: Any, store_if: Predicate, negative_if: Predicate
+    ) -> None:
+        if store_if is not None and not store_if(value):
+            return
+        self.set(namespace, key, value, negative=bool(negative_if and negative_if(value)))
+
+    # ------------------------------------------------------------------
+    # Read‑through with stale‑while‑revalidate
+    # ------------------------------------------------------------------
+    async def get_or_fetch(
+        self,
+        namespace: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        *,
+        store_if: Predicate = None,
+        negative_if: Predicate = None,
+    ) -> Any:
+        """
+        Cached value, else ``await fetch()`` and store the result.
+
+        A stale entry is returned immediately and refreshed by a background
+        task (one per key).  ``store_if`` can veto caching a response;
+        ``negative_if`` marks it negative (short TTL).  Errors from
+        ``fetch`` propagate only when there is nothing to serve.
+
+        Only the memory tier is consulted on the event loop; SQLite reads
+        and writes run on worker threads.
+        """
+        entry = await self._lookup_async(namespace, key)
+        if entry is not None:
+            if not entry.fresh:
+                with self._lock:
+                    self.hits["stale"] += 1
+                self._revalidate_async(namespace, key, fetch, store_if, negative_if)
+            return entry.value
+        value = await fetch()
+        await asyncio.to_thread(self._store, namespace, key, value, store_if, negative_if)
+        return value
+
+    def get_or_fetch_sync(
+        self,
+        namespace: str,
+        key: str,
+        fetch: Callable[[], Any],
+        *,
+        store_if: Predicate = None,
+        negative_if: Predicate = None,
+    ) -> Any:
+        """Blocking variant of :meth:`get_or_fetch`; refreshes on a worker thread."""
+        entry = self.lookup(namespace, key)
+        if entry is not None:
+            if not entry.fresh:
+                with self._lock:
+                    self.hits["stale"] += 1
+                self._revalidate_sync(namespace, key, fetch, store_if, negative_if)
+            return entry.value
+        value = fetch()
+        self._store(namespace, key, value, store_if, negative_if)
+        return value
+
+    def _claim(self, mkey: Tuple[str, str]) -> bool:
+        with self._lock:
+            if mkey in self._refreshing:
+                return False
+            self._refreshing.add(mkey)
+            return True
+
+    def _refreshed(self, mkey: Tuple[str, str], error: Optional[BaseException]) -> None:
+        with self._lock:
+            self._refreshing.discard(mkey)
+            self.refreshes["failed" if error else "ok"] += 1
+        if error is not None:
+            logger.warning("Background refresh of %s/%s failed: %s", mkey[0], mkey[1], error)
+
+    def _revalidate_async(self, namespace, key, fetch, store_if, negative_if) -> None:
+        mkey = (namespace, key)
+        if not self._claim(mkey):
+            return
+
+        async def refresh() -> None:
+            error = None
+            try:
+                value = await fetch()
+                await asyncio.to_thread(self._store, namespace, key, value, store_if, negative_if)
+            except Exception as exc:  # keep serving the stale value
+                error = exc
+            finally:
+                self._refreshed(mkey, error)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _revalidate_sync(self, namespace, key, fetch, store_if, negative_if) -> None:
+        mkey = (namespace, key)
+        if not self._claim(mkey):
+            return
+
+        def refresh() -> None:
+            error = None
+            try:
+                self._store(namespace, key, fetch(), store_if, negative_if)
+            except Exception as exc:
+                error = exc
+            finally:
+                self._refreshed(mkey, error)
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+        self._executor.submit(refresh)
+
+    async def drain(self) -> None:
+        """Wait for background refreshes started on this loop (tests, shutdown)."""
+        loop = asyncio.get_running_loop()
+        pending = [t for t in self._tasks if t.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._memory.pop((namespace, key), None)
+            self._db().execute(
+                "DELETE FROM response_cache WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Drop one namespace, or everything."""
+        with self._lock:
+            if namespace is None:
+                self._memory.clear()
+                self._db().execute("DELETE FROM response_cache")
+            else:
+                for mkey in [k for k in self._memory if k[0] == namespace]:
+                    del self._memory[mkey]
+                self._db().execute("DELETE FROM response_cache WHERE namespace = ?", (namespace,))
+
+    def purge_expired(self) -> int:
+        """Delete rows past their hard TTL from the disk tier; returns how many."""
+        with self._lock:
+            return self._db().execute(
+                "DELETE FROM response_cache WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "memory_items": len(self._memory),
+            "hits": dict(self.hits),
+            "misses": self.misses,
+            "refreshes": dict(self.refreshes),
+            "refreshing": len(self._refreshing),
+            "negative_stores": self.negative_stores,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Process‑wide cache used by all provider clients
+cache = ResponseCache()
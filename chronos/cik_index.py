@@ -0,0 +1,321 @@
+"""
+chronos.cik_index
+=================
+
+Offline SEC CIK index: name → CIK and CIK → name without a network call.
+
+Built from an SEC bulk file dropped on disk –
+
+* ``company_tickers.json`` / ``company_tickers_exchange.json``
+  (https://www.sec.gov/files/company_tickers.json), or
+* the ``submissions.zip`` dump (or a directory of its ``CIK##########.json``
+  files), which also contributes former company names –
+
+into a compact SQLite file (``cik_index.db`` next to the response cache)
+that is read through a memory map.  Lookups are PK seeks fronted by an
+LRU, so they resolve in microseconds; :class:`EdgarClient` only falls back
+to the EDGAR search API for names the index does not know.
+
+Rebuilding writes a new file and swaps it in atomically; running workers
+notice the new file within ``RELOAD_CHECK_INTERVAL`` seconds.
+
+Example
+-------
+$ python -m chronos.cik_index build ~/Downloads/company_tickers.json
+>>> from chronos.cik_index import cik_index
+>>> cik_index.cik_for("Apple Inc")
+'0000320193'
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from chronos.settings import CIK_INDEX_PATH
+
+__all__ = ["CIKIndex", "cik_index", "normalise_company_name", "format_cik"]
+
+# Seconds between checks for a rebuilt index file
+RELOAD_CHECK_INTERVAL = 5.0
+LOOKUP_CACHE_SIZE = 65_536
+
+# Spelled‑out corporate suffixes → the abbreviation SEC titles mostly use
+_SUFFIXES = {
+    "incorporated": "inc",
+    "corporation": "corp",
+    "company": "co",
+    "limited": "ltd",
+    "l l c": "llc",
+    "l p": "lp",
+}
+_PUNCT = re.compile(r"[^\w\s]")
+_SUFFIX_RE = re.compile(r"\b(" + "|".join(map(re.escape, _SUFFIXES)) + r")\b")
+
+_SCHEMA = (
+    """CREATE TABLE companies (
+        cik    INTEGER PRIMARY KEY,
+        name   TEXT NOT NULL,
+        ticker TEXT
+    )""",
+    """CREATE TABLE names (
+        norm_name TEXT NOT NULL,
+        cik       INTEGER NOT NULL,
+        PRIMARY KEY (norm_name, cik)
+    ) WITHOUT ROWID""",
+)
+
+Record = Tuple[int, str, Optional[str], List[str]]  # cik, name, ticker, former names
+
+
+def normalise_company_name(name: str) -> str:
+    """
+    Matching key for a company name.
+
+    Lower‑cased, punctuation dropped ("Apple Inc." ≡ "APPLE INC"),
+    whitespace collapsed and spelled‑out suffixes abbreviated
+    ("Acme Corporation" ≡ "Acme Corp").
+    """
+    text = " ".join(_PUNCT.sub(" ", name.lower()).split())
+    return _SUFFIX_RE.sub(lambda m: _SUFFIXES[m.group(1)], text)
+
+
+def format_cik(cik: int | str) -> str:
+    """Ten‑digit, zero‑padded CIK as used in EDGAR URLs."""
+    return f"{int(cik):010d}"
+
+
+# ---------------------------------------------------------------------------
+# Bulk file parsing
+# ---------------------------------------------------------------------------
+def _from_json(data: Any) -> Iterator[Record]:
+    """Records from any of the supported SEC JSON shapes."""
+    if isinstance(data, dict) and "fields" in data and "data" in data:
+        # company_tickers_exchange.json: {"fields": [...], "data": [[...], ...]}
+        idx = {f: i for i, f in enumerate(data["fields"])}
+        for row in data["data"]:
+            yield int(row[idx["cik"]]), row[idx["name"]], row[idx["ticker"]] if "ticker" in idx else None, []
+    elif isinstance(data, dict) and "cik" in data and "name" in data:
+        # One submissions file (CIK##########.json)
+        tickers = data.get("tickers") or []
+        former = [f["name"] for f in data.get("formerNames") or [] if f.get("name")]
+        yield int(data["cik"]), data["name"], tickers[0] if tickers else None, former
+    elif isinstance(data, dict):
+        # company_tickers.json: {"0": {"cik_str": ..., "ticker": ..., "title": ...}, ...}
+        for row in data.values():
+            if isinstance(row, dict) and "cik_str" in row:
+                yield int(row["cik_str"]), row["title"], row.get("ticker"), []
+
+
+def iter_records(source: Path) -> Iterator[Record]:
+    """Parse a tickers JSON file, a submissions zip, or a directory of JSON files."""
+    source = Path(source)
+    if source.is_dir():
+        for path in sorted(source.glob("*.json")):
+            yield from _from_json(json.loads(path.read_bytes()))
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as zf:
+            for member in zf.namelist():
+                # submissions.zip also holds CIK…-submissions-001.json paging files
+                if member.endswith(".json") and "-submissions-" not in member:
+                    yield from _from_json(json.loads(zf.read(member)))
+    else:
+        yield from _from_json(json.loads(source.read_bytes()))
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+class CIKIndex:
+    """
+    Read‑mostly SQLite CIK index shared by the whole process.
+
+    A missing file simply makes every lookup return ``None``.
+    """
+
+    def __init__(self, path: Path | str = CIK_INDEX_PATH) -> None:
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._mtime: Optional[float] = None
+        self._checked = 0.0
+        self._lock = threading.RLock()
+        self._cik_lookup = functools.lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._cik_for)
+        self._name_lookup = functools.lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._name_for)
+
+    # ------------------------------------------------------------------
+    # Connection management
+    # ------------------------------------------------------------------
+    def _db(self) -> Optional[sqlite3.Connection]:
+        """Current connection, reopening if the file was rebuilt."""
+        now = time.monotonic()
+        if self._conn is not None and now - self._checked < RELOAD_CHECK_INTERVAL:
+            return self._conn
+        with self._lock:
+            self._checked = now
+            try:
+                mtime = self.path.stat().st_mtime
+            except FileNotFoundError:
+                mtime = None
+            if mtime != self._mtime or (self._conn is None and mtime is not None):
+                self._close()
+                self._clear_lookups()
+                self._mtime = mtime
+                if mtime is not None:
+                    conn = sqlite3.connect(
+                        f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+                    )
+                    conn.execute(f"PRAGMA mmap_size={max(self.path.stat().st_size, 1 << 20)}")
+                    self._conn = conn
+            return self._conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _clear_lookups(self) -> None:
+        self._cik_lookup.cache_clear()
+        self._name_lookup.cache_clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+            self._mtime = None
+
+    @property
+    def available(self) -> bool:
+        return self._db() is not None
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def cik_for(self, name: str) -> Optional[str]:
+        """Zero‑padded CIK for *name*, or ``None`` if unknown or ambiguous."""
+        self._db()  # drops memoised answers if the file was rebuilt
+        return self._cik_lookup(name)
+
+    def name_for(self, cik: int | str) -> Optional[str]:
+        """Current registrant name for *cik*, or ``None``."""
+        self._db()
+        return self._name_lookup(str(int(cik)))
+
+    def _cik_for(self, name: str) -> Optional[str]:
+        conn = self._db()
+        if conn is None:
+            return None
+        with self._lock:
+            rows = conn.execute(
+                "SELECT cik FROM names WHERE norm_name = ? LIMIT 2",
+                (normalise_company_name(name),),
+            ).fetchall()
+        # An ambiguous name (two registrants) is left to the network search
+        return format_cik(rows[0][0]) if len(rows) == 1 else None
+
+    def _name_for(self, cik: int | str) -> Optional[str]:
+        conn = self._db()
+        if conn is None:
+            return None
+        with self._lock:
+            row = conn.execute("SELECT name FROM companies WHERE cik = ?", (int(cik),)).fetchone()
+        return row[0] if row else None
+
+    def ticker_for(self, cik: int | str) -> Optional[str]:
+        conn = self._db()
+        if conn is None:
+            return None
+        with self._lock:
+            row = conn.execute("SELECT ticker FROM companies WHERE cik = ?", (int(cik),)).fetchone()
+        return row[0] if row else None
+
+    def __len__(self) -> int:
+        conn = self._db()
+        if conn is None:
+            return 0
+        with self._lock:
+            return conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    def build(self, source: Path | str) -> int:
+        """
+        (Re)build the index from an SEC bulk file; returns companies indexed.
+
+        The new index is written to a temporary file and renamed over the
+        old one, so readers never see a half‑built index.
+        """
+        return self.build_from_records(iter_records(Path(source)))
+
+    def build_from_records(self, records: Iterable[Record]) -> int:
+        companies: Dict[int, Tuple[str, Optional[str]]] = {}
+        names = set()
+        for cik, name, ticker, former in records:
+            prev = companies.get(cik)
+            # Keep the first ticker seen (SEC lists the primary listing first)
+            companies[cik] = (name, prev[1] if prev and prev[1] else ticker)
+            for alias in [name, *former]:
+                names.add((normalise_company_name(alias), cik))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.unlink(missing_ok=True)
+        conn = sqlite3.connect(tmp)
+        try:
+            for ddl in _SCHEMA:
+                conn.execute(ddl)
+            conn.executemany(
+                "INSERT INTO companies (cik, name, ticker) VALUES (?, ?, ?)",
+                ((cik, name, ticker) for cik, (name, ticker) in sorted(companies.items())),
+            )
+            conn.executemany("INSERT INTO names (norm_name, cik) VALUES (?, ?)", sorted(names))
+            conn.commit()
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+        with self._lock:
+            self._close()
+            os.replace(tmp, self.path)
+            self._mtime = None
+            self._checked = 0.0
+            self._clear_lookups()
+        return len(companies)
+
+
+# Process‑wide index used by EdgarClient
+cik_index = CIKIndex()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chronos.cik_index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="build the index from an SEC bulk file")
+    build.add_argument("source", type=Path,
+                       help="company_tickers*.json, submissions.zip or a directory of JSON files")
+    look = sub.add_parser("lookup", help="resolve a company name or CIK")
+    look.add_argument("query")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        start = time.perf_counter()
+        count = cik_index.build(args.source)
+        print(f"indexed {count:,} companies into {cik_index.path} "
+              f"in {time.perf_counter() - start:.1f} s")
+    else:
+        if args.query.isdigit():
+            print(cik_index.name_for(args.query) or "not found")
+        else:
+            print(cik_index.cik_for(args.query) or "not found")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,14 +7,22 @@ SQLite persistence layer for Project Chronos.
 This module exposes:
 
 * ``engine`` – a global SQLModel engine pointing at *chronos.db*
-* ``SessionLocal`` – a session factory used via ``with SessionLocal() as s:``
+* ``read_engine`` – a read‑only pool over the same file for query paths
+* ``make_engine()`` – engine factory applying the production SQLite pragmas
+* ``SessionLocal`` / ``ReadSessionLocal`` – session factories used via
+  ``with SessionLocal() as s:``
 * ``create_all()`` – helper to create tables at first run
+* ``bulk_upsert_entities()`` – batched, single‑transaction upsert
+* ``search_entities()`` – ranked FTS5 name search (trigger‑maintained index)
+* ``OwnershipEdgeDB`` – persisted parent → child ownership edges
+* ``get_revisions()`` – per‑table change counters shared by all processes
 """
 
 from __future__ import annotations
 
 from pathlib import Path
-from sqlalchemy import Column, JSON  # new
+from sqlalchemy import Column, JSON, event  # new
+from sqlalchemy.engine import Engine, make_url
 
 from sqlmodel import SQLModel, create_engine, Session
 
@@ -22,8 +30,81 @@ from sqlmodel import SQLModel, create_engine, Session
 # ---------------------------------------------------------------------------
 # Engine (SQLite file lives in project root)
 # ---------------------------------------------------------------------------
-from chronos.settings import DB_URL, DB_ECHO
-engine = create_engine(DB_URL, echo=DB_ECHO)
+from chronos.settings import (
+    DB_BUSY_TIMEOUT_MS,
+    DB_CACHE_SIZE_KB,
+    DB_ECHO,
+    DB_MAX_OVERFLOW,
+    DB_MMAP_SIZE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_READ_POOL_SIZE,
+    DB_URL,
+)
+
+
+def make_engine(
+    url: str = DB_URL,
+    *,
+    readonly: bool = False,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    echo: bool = DB_ECHO,
+) -> Engine:
+    """
+    Create a SQLite engine tuned for concurrent API traffic.
+
+    Every pooled connection gets:
+
+    * ``journal_mode=WAL`` – readers no longer block the writer (and vice
+      versa); the mode is persistent, so it is set once per file
+    * ``synchronous=NORMAL`` – fsync on checkpoint instead of every commit,
+      safe under WAL
+    * ``busy_timeout`` – a second writer waits instead of failing with
+      "database is locked"
+    * ``mmap_size`` / ``cache_size`` / ``temp_store=MEMORY`` – fewer read
+      syscalls
+
+    ``readonly=True`` additionally sets ``query_only`` so a reader pool can
+    never write.  In‑memory URLs keep SQLAlchemy's default pool.
+    """
+    file_based = make_url(url).database not in (None, "", ":memory:")
+    kwargs: dict = {"echo": echo}
+    if file_based:
+        kwargs.update(
+            pool_size=pool_size if pool_size is not None else
+            (DB_READ_POOL_SIZE if readonly else DB_POOL_SIZE),
+            max_overflow=max_overflow if max_overflow is not None else DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            connect_args={"check_same_thread": False, "timeout": DB_BUSY_TIMEOUT_MS / 1000},
+        )
+    eng = create_engine(url, **kwargs)
+    install_pragmas(eng, wal=file_based and not readonly, readonly=readonly)
+    return eng
+
+
+def install_pragmas(eng: Engine, *, wal: bool = True, readonly: bool = False) -> None:
+    """Apply the :func:`make_engine` pragmas to every new DBAPI connection of *eng*."""
+
+    @event.listens_for(eng, "connect")
+    def _set_pragmas(dbapi_conn, _record) -> None:
+        cur = dbapi_conn.cursor()
+        try:
+            if wal:
+                cur.execute("PRAGMA journal_mode=WAL")
+            cur.execute("PRAGMA synchronous=NORMAL")
+            cur.execute(f"PRAGMA busy_timeout={int(DB_BUSY_TIMEOUT_MS)}")
+            cur.execute(f"PRAGMA mmap_size={int(DB_MMAP_SIZE)}")
+            cur.execute(f"PRAGMA cache_size=-{int(DB_CACHE_SIZE_KB)}")
+            cur.execute("PRAGMA temp_store=MEMORY")
+            if readonly:
+                cur.execute("PRAGMA query_only=ON")
+        finally:
+            cur.close()
+
+
+engine = make_engine(DB_URL)
+read_engine = make_engine(DB_URL, readonly=True)
 
 
 # ---------------------------------------------------------------------------
@@ -34,14 +115,23 @@ def SessionLocal() -> Session:  # noqa: N802 (factory camel‑case for consisten
     return Session(engine)
 
 
+def ReadSessionLocal() -> Session:  # noqa: N802
+    """Return a new Session on the read‑only pool (writes raise)."""
+    return Session(read_engine)
+
+
 # ---------------------------------------------------------------------------
 # ORM model that mirrors chronos.models.CorporateEntity
 # ---------------------------------------------------------------------------
-from typing import List
-from datetime import date
+from typing import Iterable, Iterator, List, Sequence
+from datetime import date, datetime, timezone
+from sqlalchemy import func, or_, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Field, JSON, select
 
 from chronos.models import CorporateEntity, Status
+from chronos.portfolio import LOW_SIGNAL_TOKENS, name_matches, rank_matches, search_tokens
 
 
 class CorporateEntityDB(SQLModel, table=True):
@@ -54,9 +144,9 @@ class CorporateEntityDB(SQLModel, table=True):
 
     slug: str = Field(primary_key=True, index=True)
     name: str
-    jurisdiction: str
+    jurisdiction: str = Field(index=True)
     formed: date
-    status: Status = Status.PENDING
+    status: Status = Field(default=Status.PENDING, index=True)
     officers: List[str] = Field(default_factory=list, sa_column=Column(JSON))
     notes: str | None = None
 
@@ -88,6 +178,48 @@ class CorporateEntityDB(SQLModel, table=True):
         )
 
 
+class OwnershipEdgeDB(SQLModel, table=True):
+    """A persisted parent → child edge of the :class:`RelationshipGraph`."""
+
+    __tablename__ = "ownership_edges"
+
+    parent_slug: str = Field(primary_key=True)
+    child_slug: str = Field(primary_key=True, index=True)
+    pct: float
+    source: str = "manual"
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class ChangeRevisionDB(SQLModel, table=True):
+    """
+    Monotonic change counter per tracked table.
+
+    Bumped by triggers in the same transaction as every write, so any
+    process can detect that its cached view is stale with one PK lookup.
+    """
+
+    __tablename__ = "chronos_revisions"
+
+    name: str = Field(primary_key=True)
+    revision: int = 0
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class EntityChangeDB(SQLModel, table=True):
+    """
+    Which entity each ``corporateentitydb`` revision touched.
+
+    Written by the same triggers, so a reader that knows revision *r* can
+    fetch just the rows changed since instead of rescanning the table.
+    Only the last ``ENTITY_CHANGE_LOG_SIZE`` revisions are kept.
+    """
+
+    __tablename__ = "chronos_entity_changes"
+
+    revision: int = Field(primary_key=True)
+    slug: str = Field(primary_key=True)
+
+
 # ---------------------------------------------------------------------------
 # Convenience CRUD helpers
 # ---------------------------------------------------------------------------
@@ -98,6 +230,47 @@ def upsert_entity(s: Session, ent: CorporateEntity) -> None:
     s.commit()
 
 
+def bulk_upsert_entities(
+    s: Session,
+    entities: Iterable[CorporateEntity],
+    batch_size: int = 500,
+) -> int:
+    """
+    Insert or update many entities inside a single transaction.
+
+    Rows are sent in *batch_size* chunks as SQLite
+    ``INSERT ... ON CONFLICT(slug) DO UPDATE`` statements and committed
+    once at the end, so N entities cost one fsync instead of N.  Rows
+    identical to the stored ones are skipped, so they bump no revision.
+
+    Returns the number of entities sent.
+    """
+    table = CorporateEntityDB.__table__
+    columns = [c for c in table.columns if not c.primary_key]
+    stmt = sqlite_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.slug],
+        set_={c.name: stmt.excluded[c.name] for c in columns},
+        # Unchanged rows (the same search hit stored again) are not rewritten
+        where=or_(*(c.is_distinct_from(stmt.excluded[c.name]) for c in columns)),
+    )
+
+    written = 0
+    batch: list[dict] = []
+    for ent in entities:
+        batch.append(CorporateEntityDB.from_entity(ent).model_dump())
+        if len(batch) >= batch_size:
+            s.execute(stmt, batch)
+            written += len(batch)
+            batch = []
+    if batch:
+        s.execute(stmt, batch)
+        written += len(batch)
+
+    s.commit()
+    return written
+
+
 def get_entity(s: Session, slug: str) -> CorporateEntity | None:
     """Return an entity by slug or *None* if missing."""
     db_row = s.get(CorporateEntityDB, slug)
@@ -110,12 +283,384 @@ def all_entities(s: Session) -> list[CorporateEntity]:
     return [row.to_entity() for row in rows]
 
 
+# Rows fetched per round‑trip when streaming the entity table
+STREAM_CHUNK_SIZE = 1000
+
+
+def _row_to_entity(row) -> CorporateEntity:
+    return CorporateEntity(
+        name=row.name,
+        jurisdiction=row.jurisdiction,
+        formed=row.formed,
+        officers=list(row.officers or []),
+        status=row.status,
+        notes=row.notes,
+    )
+
+
+def iter_entities(s: Session, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[CorporateEntity]:
+    """
+    Yield every entity without loading the whole table.
+
+    Rows are pulled from a server‑side cursor *chunk_size* at a time and
+    converted lazily.  The scan runs on its own connection, so commits on
+    *s* don't invalidate the cursor.  On a WAL database (see
+    :func:`make_engine`) writers proceed while the scan is open; with the
+    rollback journal they block until it is exhausted.
+    """
+    table = CorporateEntityDB.__table__
+    with s.get_bind().connect() as conn:
+        result = conn.execution_options(yield_per=chunk_size).execute(table.select())
+        for row in result:
+            yield _row_to_entity(row)
+
+
+def entity_columns_query(
+    columns: Sequence[str],
+    *,
+    after: str | None = None,
+    limit: int | None = None,
+):
+    """
+    ``SELECT`` of the requested entity *columns* for :func:`iter_entity_columns`.
+
+    Shared with the async manager, which streams the same statement.
+    Raises ``ValueError`` for unknown column names.
+    """
+    table = CorporateEntityDB.__table__
+    unknown = [c for c in columns if c not in table.c]
+    if unknown:
+        raise ValueError(f"unknown column(s): {', '.join(unknown)}")
+    stmt = select(*(table.c[c] for c in columns))
+    if after is not None or limit is not None:
+        stmt = stmt.order_by(table.c.slug)
+        if after is not None:
+            stmt = stmt.where(table.c.slug > after)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+    return stmt
+
+
+def iter_entity_columns(
+    s: Session,
+    columns: Sequence[str] = ("slug", "name", "status", "jurisdiction"),
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    *,
+    after: str | None = None,
+    limit: int | None = None,
+) -> Iterator[tuple]:
+    """
+    Stream plain tuples of the requested *columns* (no entity objects).
+
+    Passing *after* and/or *limit* switches to keyset pagination: rows are
+    ordered by ``slug`` (primary‑key index) and start strictly after the
+    given slug, so each page costs the same regardless of table size.
+
+    Raises ``ValueError`` for unknown column names.
+    """
+    stmt = entity_columns_query(columns, after=after, limit=limit)
+    with s.get_bind().connect() as conn:
+        result = conn.execution_options(yield_per=chunk_size).execute(stmt)
+        for row in result:
+            yield tuple(row)
+
+
+def entities_by_status(s: Session, status: Status) -> list[CorporateEntity]:
+    """Return entities at *status* using the ``status`` index."""
+    rows = s.exec(select(CorporateEntityDB).where(CorporateEntityDB.status == status)).all()
+    return [row.to_entity() for row in rows]
+
+
+def count_entities(s: Session) -> int:
+    """Return ``SELECT COUNT(*)`` over the entity table."""
+    return s.exec(select(func.count()).select_from(CorporateEntityDB)).one()
+
+
+def status_counts(s: Session) -> dict[Status, int]:
+    """Return ``{Status: count}`` from a single ``GROUP BY status`` query."""
+    stmt = select(CorporateEntityDB.status, func.count()).group_by(CorporateEntityDB.status)
+    return {status: n for status, n in s.exec(stmt).all()}
+
+
+# ---------------------------------------------------------------------------
+# Ownership edges + change revisions
+# ---------------------------------------------------------------------------
+EDGES_REVISION = "ownership_edges"
+ENTITIES_REVISION = "corporateentitydb"
+
+
+# corporateentitydb revisions kept in chronos_entity_changes
+ENTITY_CHANGE_LOG_SIZE = 10_000
+
+
+def _revision_ddl(table: str, columns: tuple[str, ...], log_key: str | None = None) -> list[str]:
+    """
+    Triggers bumping *table*'s revision on every insert, delete and real
+    update – an ``UPDATE`` that leaves *columns* as they were is not a
+    change.  With *log_key* each revision is also logged per row.
+    """
+    rev = f"(SELECT revision FROM chronos_revisions WHERE name = '{table}')"
+    bump = f"""INSERT INTO chronos_revisions(name, revision, updated_at)
+            VALUES ('{table}', 1, CURRENT_TIMESTAMP)
+            ON CONFLICT(name) DO UPDATE SET
+                revision = revision + 1, updated_at = CURRENT_TIMESTAMP;"""
+
+    def log(*refs: str) -> str:
+        if log_key is None:
+            return ""
+        rows = " UNION ".join(f"SELECT {rev}, {ref}.{log_key}" for ref in refs)
+        return f"""
+            INSERT OR IGNORE INTO chronos_entity_changes(revision, slug) {rows};
+            DELETE FROM chronos_entity_changes
+                WHERE revision <= {rev} - {ENTITY_CHANGE_LOG_SIZE};"""
+
+    changed = " OR ".join(f"OLD.{c} IS NOT NEW.{c}" for c in columns)
+    return [
+        f"""CREATE TRIGGER {table}_rev_insert AFTER INSERT ON {table}
+        BEGIN {bump}{log("NEW")} END""",
+        f"""CREATE TRIGGER {table}_rev_update AFTER UPDATE ON {table} WHEN {changed}
+        BEGIN {bump}{log("OLD", "NEW")} END""",
+        f"""CREATE TRIGGER {table}_rev_delete AFTER DELETE ON {table}
+        BEGIN {bump}{log("OLD")} END""",
+    ]
+
+
+_REVISION_TABLES = {
+    EDGES_REVISION: (("parent_slug", "child_slug", "pct", "source"), None),
+    ENTITIES_REVISION: (
+        ("slug", "name", "jurisdiction", "formed", "status", "officers", "notes"), "slug",
+    ),
+}
+
+
+def install_change_tracking(bind=None) -> None:
+    """(Re)create the triggers that maintain ``chronos_revisions``."""
+    with (bind or engine).begin() as conn:
+        for table, (columns, log_key) in _REVISION_TABLES.items():
+            for op in ("insert", "update", "delete"):
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {table}_rev_{op}"))
+            for ddl in _revision_ddl(table, columns, log_key):
+                conn.execute(text(ddl))
+
+
+def get_revisions(s: Session) -> dict[str, int]:
+    """Return ``{table: revision}`` for every tracked table."""
+    rows = s.exec(select(ChangeRevisionDB.name, ChangeRevisionDB.revision)).all()
+    return {name: rev for name, rev in rows}
+
+
+def get_revision_stamps(s: Session) -> dict[str, tuple[int, datetime]]:
+    """Return ``{table: (revision, updated_at)}`` – ``updated_at`` in UTC."""
+    rows = s.exec(
+        select(ChangeRevisionDB.name, ChangeRevisionDB.revision, ChangeRevisionDB.updated_at)
+    ).all()
+    return {
+        name: (rev, ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts)
+        for name, rev, ts in rows
+    }
+
+
+def get_revision(s: Session, name: str) -> int:
+    """Current revision of one tracked table (0 if never written)."""
+    row = s.get(ChangeRevisionDB, name)
+    return row.revision if row else 0
+
+
+def entity_changes_since(s: Session, revision: int) -> set[str] | None:
+    """
+    Slugs of the entities inserted, updated or deleted after *revision*.
+
+    ``None`` when the change log no longer reaches back that far; the
+    caller has to rescan the table.
+    """
+    oldest = s.exec(select(func.min(EntityChangeDB.revision))).one()
+    if oldest is None or oldest > revision + 1:
+        return None
+    stmt = select(EntityChangeDB.slug).where(EntityChangeDB.revision > revision)
+    return set(s.exec(stmt).all())
+
+
+# Not a counter: a random id fixed when the database is created, so graph
+# versions (sums of the counters above) are comparable across workers but
+# never across a recreated database.
+GRAPH_EPOCH = "graph_epoch"
+
+
+def get_graph_epoch(s: Session) -> str:
+    """Shared relationship‑graph epoch of this database (created on first use)."""
+    s.execute(
+        text("""INSERT OR IGNORE INTO chronos_revisions(name, revision, updated_at)
+                VALUES (:name, abs(random() % 281474976710656), CURRENT_TIMESTAMP)"""),
+        {"name": GRAPH_EPOCH},
+    )
+    s.commit()
+    return format(get_revision(s, GRAPH_EPOCH), "012x")
+
+
+def upsert_edge(s: Session, parent: str, child: str, pct: float, source: str = "manual") -> None:
+    """Insert or update one ownership edge (caller commits)."""
+    table = OwnershipEdgeDB.__table__
+    stmt = sqlite_insert(table).values(
+        parent_slug=parent, child_slug=child, pct=pct, source=source,
+        updated_at=datetime.now(timezone.utc),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.parent_slug, table.c.child_slug],
+        set_={c: stmt.excluded[c] for c in ("pct", "source", "updated_at")},
+    )
+    s.execute(stmt)
+
+
+def delete_edges(s: Session, parent: str | None = None, child: str | None = None) -> int:
+    """Delete one edge, or every edge when no slugs are given (caller commits)."""
+    table = OwnershipEdgeDB.__table__
+    stmt = table.delete()
+    if parent is not None:
+        stmt = stmt.where(table.c.parent_slug == parent)
+    if child is not None:
+        stmt = stmt.where(table.c.child_slug == child)
+    return s.execute(stmt).rowcount
+
+
+def load_edges(s: Session) -> list[tuple[str, str, float]]:
+    """Every ``(parent, child, pct)`` edge in one query."""
+    table = OwnershipEdgeDB.__table__
+    stmt = select(table.c.parent_slug, table.c.child_slug, table.c.pct)
+    return [tuple(r) for r in s.execute(stmt)]
+
+
+# ---------------------------------------------------------------------------
+# Full‑text name search (SQLite FTS5)
+# ---------------------------------------------------------------------------
+# External‑content FTS5 table over corporateentitydb.name, kept in sync by
+# triggers so every write path (ORM merge, bulk upsert, raw SQL) updates it.
+# The index is keyed on the entity table's rowid; rebuild it with
+# ``rebuild_search_index()`` after a VACUUM, which may renumber rowids.
+FTS_TABLE = "corporateentity_fts"
+
+_FTS_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        name,
+        content='corporateentitydb',
+        content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON corporateentitydb BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name) VALUES (new.rowid, new.name);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON corporateentitydb BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name) VALUES ('delete', old.rowid, old.name);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF name ON corporateentitydb BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name) VALUES ('delete', old.rowid, old.name);
+        INSERT INTO {FTS_TABLE}(rowid, name) VALUES (new.rowid, new.name);
+    END""",
+]
+
+
+def install_search_index(bind=None) -> bool:
+    """
+    Create the FTS5 table and sync triggers if missing.
+
+    Existing rows are indexed the first time the table is created.
+    Returns ``False`` when this SQLite build lacks FTS5; callers then
+    fall back to ``LIKE`` scans.
+    """
+    bind = bind or engine
+    with bind.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :n"), {"n": FTS_TABLE}
+        ).first()
+        try:
+            for ddl in _FTS_DDL:
+                conn.execute(text(ddl))
+        except OperationalError:
+            return False
+        if not exists:
+            conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+    return True
+
+
+def rebuild_search_index(bind=None) -> None:
+    """Re‑index every entity name from scratch."""
+    with (bind or engine).begin() as conn:
+        conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def _fts_query(tokens: list[str]) -> str:
+    """
+    Build an FTS5 query with every token as a quoted prefix.
+
+    Legal‑form words (``llc``, ``inc``…) are left out when other tokens
+    exist; their huge doclists would dominate the intersection and they
+    are re‑checked on the fetched rows instead.
+    """
+    selective = [t for t in tokens if t not in LOW_SIGNAL_TOKENS] or tokens
+    return " ".join(f'"{tok}"*' for tok in selective)
+
+
+def search_entities(
+    s: Session, q: str, state: str | None = None, limit: int = 25
+) -> list[CorporateEntity]:
+    """
+    Ranked name search: each token of *q* must prefix‑match a name token.
+
+    Matching ignores case and diacritics (``cafe`` finds *Café*).  Results
+    are ordered exact name → name prefix → BM25 rank.  Falls back to a
+    case‑insensitive ``LIKE`` scan if the FTS5 index is unavailable.
+    """
+    tokens = search_tokens(q)
+    if not tokens:
+        return []
+
+    table = CorporateEntityDB.__table__
+    # Over‑fetch so rows dropped by the low‑signal token check still fill *limit*
+    params = {"match": _fts_query(tokens), "limit": max(limit * 4, 100)}
+    where_state = ""
+    if state:
+        where_state = "AND e.jurisdiction = :state"
+        params["state"] = state.upper()
+    ranked = True
+    try:
+        rows = s.execute(
+            text(
+                f"""SELECT e.* FROM {FTS_TABLE} f
+                    JOIN corporateentitydb e ON e.rowid = f.rowid
+                    WHERE {FTS_TABLE} MATCH :match {where_state}
+                    ORDER BY f.rank
+                    LIMIT :limit"""
+            ).columns(*table.columns),
+            params,
+        ).all()
+    except OperationalError:
+        stmt = table.select().where(func.lower(table.c.name).contains(q.lower()))
+        if state:
+            stmt = stmt.where(table.c.jurisdiction == state.upper())
+        rows = s.execute(stmt.limit(limit)).all()
+        ranked = False
+    hits = (_row_to_entity(r) for r in rows if name_matches(r.name, tokens))
+    return rank_matches(q, hits, ranked=ranked)[:limit]
+
+
 # ---------------------------------------------------------------------------
 # Utility: create tables
 # ---------------------------------------------------------------------------
-def create_all() -> None:
-    """Create all tables for imported SQLModel subclasses, including CorporateEntityDB."""
-    SQLModel.metadata.create_all(engine)
+def create_all(bind=None) -> None:
+    """
+    Create all tables for imported SQLModel subclasses, including CorporateEntityDB.
+
+    ``metadata.create_all`` skips tables that already exist, so indexes
+    added to a model after its table was first created are back‑filled
+    here as well.
+    """
+    bind = bind or engine
+    SQLModel.metadata.create_all(bind)
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind, checkfirst=True)
+    install_search_index(bind)
+    install_change_tracking(bind)
 
 # ---------------------------------------------------------------------------
 # Lightweight CLI
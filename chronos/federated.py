@@ -0,0 +1,327 @@
+"""
+chronos.federated
+=================
+
+Concurrent multi‑provider entity search.
+
+Each registered provider (Cobalt, OpenCorporates, the Delaware scraper …)
+is queried under its own deadline and the results are combined according
+to a *strategy*:
+
+``first``   all providers start together; the first non‑empty answer wins
+            and the stragglers are cancelled.  *Scarce* (low‑quota)
+            providers are held back until every provider ahead of them
+            has failed, timed out or come back empty.
+``all``     wait for every provider (each bounded by its deadline) and
+            merge the answers in provider order.
+``hedged``  start the providers one at a time in priority order; the next
+            one is only launched if the current one has not answered within
+            its observed p95 latency (or failed / came back empty).  First
+            non‑empty answer wins.
+
+Results are deduplicated by normalised slug, earlier providers winning.
+Worst‑case latency is bounded by the largest deadline instead of the sum
+of every provider's timeout.
+
+Example
+-------
+>>> fs = FederatedSearch([Provider("cobalt", cobalt.search, deadline=5.0),
+...                       Provider("opencorporates", oc.search, deadline=5.0)])
+>>> result = await fs.search("Acme", "DE", strategy="hedged")
+>>> result.winner, [e.name for e in result.entities]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
+
+from chronos.models import CorporateEntity
+from chronos.settings import SEARCH_DEADLINE, SEARCH_HEDGE_DELAY, SEARCH_STRATEGY
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "STRATEGIES",
+    "Provider",
+    "ProviderOutcome",
+    "FederatedResult",
+    "FederatedSearch",
+    "normalise_slug",
+    "dedupe",
+]
+
+STRATEGIES = ("first", "all", "hedged")
+
+# Latency samples kept per provider for the hedging delay
+LATENCY_WINDOW = 200
+# Samples required before the observed p95 replaces SEARCH_HEDGE_DELAY
+MIN_LATENCY_SAMPLES = 20
+
+SearchFn = Callable[[str, Optional[str]], Awaitable[List[CorporateEntity]]]
+
+
+def normalise_slug(name: str) -> str:
+    """Portfolio slug of *name* with surrounding/repeated whitespace collapsed."""
+    return "-".join(name.lower().split())
+
+
+def dedupe(entities: Iterable[CorporateEntity]) -> List[CorporateEntity]:
+    """Drop entities whose normalised slug was already seen (first one wins)."""
+    seen: set[str] = set()
+    out: List[CorporateEntity] = []
+    for ent in entities:
+        slug = normalise_slug(ent.name)
+        if slug not in seen:
+            seen.add(slug)
+            out.append(ent)
+    return out
+
+
+@dataclass(frozen=True)
+class Provider:
+    """
+    One search backend.
+
+    Parameters
+    ----------
+    name
+        Label used in outcomes, logs and the ``providers`` filter.
+    search
+        ``async (query, state) -> list[CorporateEntity]``.
+    deadline
+        Seconds after which the call is cancelled and counted as a timeout.
+    states
+        Two‑letter codes the provider covers; ``None`` means any.  A provider
+        restricted to some states is skipped when no state is given.
+    scarce
+        Small request quota (OpenCorporates' public tier): ``first`` only
+        calls it when the providers ahead of it have nothing.
+    """
+
+    name: str
+    search: SearchFn
+    deadline: float = SEARCH_DEADLINE
+    states: Optional[FrozenSet[str]] = None
+    scarce: bool = False
+
+    def applies(self, state: Optional[str]) -> bool:
+        if self.states is None:
+            return True
+        return state is not None and state.upper() in self.states
+
+
+@dataclass
+class ProviderOutcome:
+    """What happened to one provider during a federated search."""
+
+    name: str
+    status: str = "pending"  # ok | empty | error | timeout | cancelled | skipped
+    count: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class FederatedResult:
+    entities: List[CorporateEntity] = field(default_factory=list)
+    outcomes: List[ProviderOutcome] = field(default_factory=list)
+    winner: Optional[str] = None
+    strategy: str = "first"
+    elapsed: float = 0.0
+
+
+class FederatedSearch:
+    """Fan a query out to several providers concurrently (see module docs)."""
+
+    def __init__(
+        self,
+        providers: Sequence[Provider],
+        strategy: str = SEARCH_STRATEGY,
+        hedge_delay: float = SEARCH_HEDGE_DELAY,
+    ) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {STRATEGIES}")
+        self.providers = list(providers)
+        self.strategy = strategy
+        self.hedge_delay = hedge_delay
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    # ------------------------------------------------------------------
+    # Latency bookkeeping
+    # ------------------------------------------------------------------
+    def p95(self, name: str) -> Optional[float]:
+        """Observed 95th‑percentile latency of *name*, once enough samples exist."""
+        samples = self._latencies.get(name)
+        if not samples or len(samples) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def _record_latency(self, name: str, seconds: float) -> None:
+        self._latencies.setdefault(name, deque(maxlen=LATENCY_WINDOW)).append(seconds)
+
+    def _hedge_after(self, provider: Provider) -> float:
+        p95 = self.p95(provider.name)
+        return min(provider.deadline, p95 if p95 is not None else self.hedge_delay)
+
+    # ------------------------------------------------------------------
+    # Single provider call
+    # ------------------------------------------------------------------
+    async def _call(
+        self, provider: Provider, q: str, state: Optional[str], outcome: ProviderOutcome
+    ) -> List[CorporateEntity]:
+        """Run one provider under its deadline; never raises except on cancel."""
+        start = time.perf_counter()
+        try:
+            entities = await asyncio.wait_for(provider.search(q, state), provider.deadline)
+        except asyncio.TimeoutError:
+            outcome.status = "timeout"
+            entities = []
+            # at least the deadline – keeps a slow provider's p95 honest
+            self._record_latency(provider.name, provider.deadline)
+        except asyncio.CancelledError:
+            outcome.status = "cancelled"
+            outcome.elapsed = time.perf_counter() - start
+            raise
+        except Exception as exc:  # a failing provider must not sink the search
+            logger.warning("Search provider %s failed: %s", provider.name, exc)
+            outcome.status, outcome.error = "error", str(exc)
+            entities = []
+            self._record_latency(provider.name, time.perf_counter() - start)
+        else:
+            entities = list(entities or [])
+            outcome.status = "ok" if entities else "empty"
+            self._record_latency(provider.name, time.perf_counter() - start)
+        outcome.count = len(entities)
+        outcome.elapsed = time.perf_counter() - start
+        return entities
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    async def search(
+        self,
+        q: str,
+        state: Optional[str] = None,
+        strategy: Optional[str] = None,
+        providers: Optional[Iterable[str]] = None,
+    ) -> FederatedResult:
+        """
+        Query the applicable providers and combine their answers.
+
+        Parameters
+        ----------
+        q, state
+            Search term and optional two‑letter jurisdiction.
+        strategy
+            Overrides the instance default (``first`` / ``all`` / ``hedged``).
+        providers
+            Restrict the search to these provider names.
+        """
+        strategy = strategy or self.strategy
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {STRATEGIES}")
+        wanted = None if providers is None else set(providers)
+        active = [
+            p for p in self.providers
+            if p.applies(state) and (wanted is None or p.name in wanted)
+        ]
+        result = FederatedResult(strategy=strategy)
+        if not active:
+            return result
+
+        start = time.perf_counter()
+        outcomes = {p.name: ProviderOutcome(p.name) for p in active}
+        result.outcomes = [outcomes[p.name] for p in active]
+        if strategy == "all":
+            answers = await asyncio.gather(
+                *(self._call(p, q, state, outcomes[p.name]) for p in active)
+            )
+            result.entities = dedupe(e for answer in answers for e in answer)
+            result.winner = next((p.name for p, a in zip(active, answers) if a), None)
+        else:
+            await self._race(active, q, state, outcomes, result, hedged=strategy == "hedged")
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    async def _race(
+        self,
+        active: List[Provider],
+        q: str,
+        state: Optional[str],
+        outcomes: Dict[str, ProviderOutcome],
+        result: FederatedResult,
+        hedged: bool,
+    ) -> None:
+        """First non‑empty answer wins; launch all at once or hedge one by one."""
+        queue = deque(active)
+        running: Dict[asyncio.Task, Provider] = {}
+
+        def launch(provider: Optional[Provider] = None) -> Provider:
+            if provider is None:
+                provider = queue.popleft()
+            else:
+                queue.remove(provider)
+            task = asyncio.create_task(self._call(provider, q, state, outcomes[provider.name]))
+            running[task] = provider
+            return provider
+
+        def release_scarce() -> None:
+            # A scarce provider starts once everything ahead of it is done
+            for provider in [p for p in queue if not any(
+                a in queue or a in running.values() for a in active[:active.index(p)]
+            )]:
+                launch(provider)
+
+        if hedged:
+            current = launch()
+        else:
+            for provider in [p for p in queue if not p.scarce]:
+                launch(provider)
+            release_scarce()
+
+        try:
+            while running:
+                timeout = self._hedge_after(current) if hedged and queue else None
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:  # hedge: the current provider is slow, start the next
+                    current = launch()
+                    continue
+                # Prefer the highest‑priority provider among simultaneous finishers
+                for task in sorted(done, key=lambda t: active.index(running[t])):
+                    provider = running.pop(task)
+                    entities = task.result()
+                    if entities:
+                        result.entities = dedupe(entities)
+                        result.winner = provider.name
+                        return
+                if hedged and queue and current not in running.values():
+                    current = launch()  # current one failed or came back empty
+                elif not hedged and queue:
+                    release_scarce()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            for provider in active:
+                outcome = outcomes[provider.name]
+                if outcome.status == "pending":
+                    outcome.status = "skipped" if provider in queue else "cancelled"
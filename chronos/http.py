@@ -0,0 +1,347 @@
+"""
+chronos.http
+============
+
+Process‑wide HTTP connection pools – one long‑lived client per provider.
+
+Every upstream (Cobalt, OpenCorporates, Data Axle, SEC EDGAR) gets its own
+``httpx`` client with keep‑alive, per‑host connection limits, keep‑alive
+expiry and explicit timeouts, so requests reuse warm TCP/TLS connections
+instead of paying a handshake each time.  Each provider's requests also
+pass through one shared rate limiter (:mod:`chronos.ratelimit`), so any
+number of concurrent callers stays under the upstream's rate limit.
+
+* ``pools.get(provider)``      – shared ``AsyncClient`` for the running loop
+* ``pools.get_sync(provider)`` – shared ``Client`` for the synchronous scrapers
+* ``await pools.open()`` / ``await pools.aclose()`` – FastAPI lifespan hooks
+* ``pools.stats()``           – request counters, pool occupancy, rate‑limit waits
+
+Example
+-------
+>>> from chronos.http import pools
+>>> client = pools.get("edgar")          # inside a coroutine
+>>> resp = await client.get("/submissions/CIK0000320193.json")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from chronos.ratelimit import RateLimiter, SlidingWindowLimiter
+from chronos.settings import (
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE,
+    RATE_LIMIT_COBALT,
+    RATE_LIMIT_DATA_AXLE,
+    RATE_LIMIT_EDGAR,
+    RATE_LIMIT_MAX_WAIT,
+    RATE_LIMIT_OPENCORP,
+    SCRAPER_CONNECT_TIMEOUT,
+    SCRAPER_TIMEOUT,
+    SCRAPER_USER_AGENT,
+    settings,
+)
+
+__all__ = ["ProviderConfig", "HTTPPools", "pools", "HTTP2_AVAILABLE"]
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class ProviderConfig:
+    """Connection settings for one upstream provider."""
+
+    base_url: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+    timeout: float = SCRAPER_TIMEOUT
+    connect_timeout: float = SCRAPER_CONNECT_TIMEOUT
+    max_connections: int = HTTP_MAX_CONNECTIONS
+    max_keepalive: int = HTTP_MAX_KEEPALIVE
+    keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY
+    http2: bool = HTTP2_AVAILABLE
+    #: ``"<n>/<period>"`` – at most *n* requests per period, e.g. ``"10/s"``; ``None`` = unlimited
+    rate_limit: Optional[str] = None
+    rate_limit_max_wait: Optional[float] = RATE_LIMIT_MAX_WAIT
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "headers": {"User-Agent": SCRAPER_USER_AGENT, **self.headers},
+            "timeout": httpx.Timeout(self.timeout, connect=self.connect_timeout),
+        }
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass
+class _Counters:
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    total_seconds: float = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        done = self.requests - self.in_flight
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "avg_ms": round(self.total_seconds / done * 1000, 2) if done else None,
+        }
+
+
+def _pool_snapshot(transport: Any) -> Dict[str, int]:
+    """Connection counts from the httpcore pool behind an httpx transport."""
+    # httpx keeps the httpcore pool private; degrade to zeros if that changes
+    conns = list(getattr(getattr(transport, "_pool", None), "connections", None) or [])
+    return {
+        "connections": len(conns),
+        "idle": sum(1 for c in conns if c.is_idle()),
+        "http2": sum(
+            1 for c in conns
+            if type(getattr(c, "_connection", None)).__name__.endswith("HTTP2Connection")
+        ),
+    }
+
+
+class _CountingAsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        inner: httpx.AsyncHTTPTransport,
+        counters: _Counters,
+        limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self.inner = inner
+        self.counters = counters
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.limiter is not None:
+            await self.limiter.acquire()
+        c = self.counters
+        c.requests += 1
+        c.in_flight += 1
+        start = time.perf_counter()
+        try:
+            return await self.inner.handle_async_request(request)
+        except Exception:
+            c.errors += 1
+            raise
+        finally:
+            c.in_flight -= 1
+            c.total_seconds += time.perf_counter() - start
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class _CountingTransport(httpx.BaseTransport):
+    def __init__(
+        self,
+        inner: httpx.HTTPTransport,
+        counters: _Counters,
+        limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self.inner = inner
+        self.counters = counters
+        self.limiter = limiter
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.limiter is not None:
+            self.limiter.acquire_sync()
+        c = self.counters
+        with self._lock:
+            c.requests += 1
+            c.in_flight += 1
+        start = time.perf_counter()
+        try:
+            return self.inner.handle_request(request)
+        except Exception:
+            with self._lock:
+                c.errors += 1
+            raise
+        finally:
+            with self._lock:
+                c.in_flight -= 1
+                c.total_seconds += time.perf_counter() - start
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class HTTPPools:
+    """
+    Registry of long‑lived ``httpx`` clients keyed by provider name.
+
+    Async clients are bound to the event loop that created them; if a
+    provider is requested from a different loop (scripts calling
+    ``asyncio.run`` repeatedly, test clients) a fresh client is opened.
+    """
+
+    def __init__(self, providers: Optional[Dict[str, ProviderConfig]] = None) -> None:
+        self._providers: Dict[str, ProviderConfig] = dict(providers or {})
+        self._async: Dict[str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient, Any]] = {}
+        self._sync: Dict[str, Tuple[httpx.Client, Any]] = {}
+        self._counters: Dict[str, _Counters] = {}
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------ registry
+    def register(self, name: str, config: ProviderConfig) -> None:
+        """Add or replace a provider; takes effect for newly opened clients."""
+        self._providers[name] = config
+        self._limiters.pop(name, None)
+
+    def config(self, name: str) -> ProviderConfig:
+        try:
+            return self._providers[name]
+        except KeyError:
+            raise KeyError(f"Unknown HTTP provider: {name!r}") from None
+
+    def _counter(self, name: str) -> _Counters:
+        return self._counters.setdefault(name, _Counters())
+
+    def limiter(self, name: str) -> Optional[RateLimiter]:
+        """The provider's rate limiter, shared by its async and sync clients."""
+        cfg = self.config(name)
+        if cfg.rate_limit is None:
+            return None
+        with self._lock:
+            limiter = self._limiters.get(name)
+            if limiter is None:
+                limiter = self._limiters[name] = SlidingWindowLimiter.from_spec(
+                    cfg.rate_limit, max_wait=cfg.rate_limit_max_wait
+                )
+        return limiter
+
+    # ------------------------------------------------------------- clients
+    def get(self, name: str) -> httpx.AsyncClient:
+        """Shared ``AsyncClient`` for *name* on the running event loop."""
+        loop = asyncio.get_running_loop()
+        entry = self._async.get(name)
+        if entry is not None and entry[0] is loop and not entry[1].is_closed:
+            return entry[1]
+        cfg = self.config(name)
+        transport = httpx.AsyncHTTPTransport(http2=cfg.http2, limits=cfg.limits())
+        client = httpx.AsyncClient(
+            transport=_CountingAsyncTransport(transport, self._counter(name), self.limiter(name)),
+            **cfg.client_kwargs(),
+        )
+        self._async[name] = (loop, client, transport)
+        return client
+
+    def get_sync(self, name: str) -> httpx.Client:
+        """Shared blocking ``Client`` for *name* (thread‑safe)."""
+        entry = self._sync.get(name)
+        if entry is not None and not entry[0].is_closed:
+            return entry[0]
+        limiter = self.limiter(name)
+        with self._lock:
+            entry = self._sync.get(name)
+            if entry is None or entry[0].is_closed:
+                cfg = self.config(name)
+                transport = httpx.HTTPTransport(http2=cfg.http2, limits=cfg.limits())
+                client = httpx.Client(
+                    transport=_CountingTransport(
+                        transport, self._counter(f"{name}:sync"), limiter
+                    ),
+                    **cfg.client_kwargs(),
+                )
+                entry = self._sync[name] = (client, transport)
+        return entry[0]
+
+    # ----------------------------------------------------------- lifecycle
+    async def open(self) -> None:
+        """Create the async client of every registered provider up front."""
+        for name in self._providers:
+            self.get(name)
+
+    async def aclose(self) -> None:
+        """Close every client (call on application shutdown)."""
+        loop = asyncio.get_running_loop()
+        entries, self._async = self._async, {}
+        for owner, client, _ in entries.values():
+            if owner is loop:
+                await client.aclose()
+        syncs, self._sync = self._sync, {}
+        for client, _ in syncs.values():
+            client.close()
+
+    # --------------------------------------------------------------- stats
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per‑provider request counters plus live pool occupancy."""
+        out: Dict[str, Dict[str, Any]] = {}
+        for name, cfg in self._providers.items():
+            entry: Dict[str, Any] = {
+                "limits": {
+                    "max_connections": cfg.max_connections,
+                    "max_keepalive": cfg.max_keepalive,
+                    "keepalive_expiry": cfg.keepalive_expiry,
+                },
+                "http2": cfg.http2,
+                **self._counter(name).snapshot(),
+            }
+            if name in self._limiters:
+                entry["rate_limit"] = {"spec": cfg.rate_limit, **self._limiters[name].stats()}
+            if name in self._async:
+                entry["pool"] = _pool_snapshot(self._async[name][2])
+            if name in self._sync:
+                entry["sync"] = {
+                    **self._counter(f"{name}:sync").snapshot(),
+                    "pool": _pool_snapshot(self._sync[name][1]),
+                }
+            out[name] = entry
+        return out
+
+
+def default_providers() -> Dict[str, ProviderConfig]:
+    """Provider configuration derived from :data:`chronos.settings.settings`."""
+    return {
+        "cobalt": ProviderConfig(base_url=str(settings.cobalt_base), rate_limit=RATE_LIMIT_COBALT),
+        "opencorporates": ProviderConfig(
+            base_url=str(settings.opencorp_base), rate_limit=RATE_LIMIT_OPENCORP
+        ),
+        "data_axle": ProviderConfig(
+            base_url=str(settings.data_axle_base),
+            headers={
+                # X-AUTH-TOKEN is the standard header for Data Axle API
+                "X-AUTH-TOKEN": settings.data_axle_key,
+                # For backward compatibility, also include x-api-key
+                "x-api-key": settings.data_axle_key,
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "User-Agent": f"{settings.sec_ua_app} ({settings.sec_ua_email})",  # polite UA
+                "Cache-Control": "no-cache",
+            },
+            timeout=30.0,
+            rate_limit=RATE_LIMIT_DATA_AXLE,
+        ),
+        "edgar": ProviderConfig(
+            base_url=str(settings.sec_edgar_base),
+            headers={
+                "User-Agent": f"{settings.sec_ua_app} (+{settings.sec_ua_email})",
+                "Accept-Encoding": "gzip, deflate",
+                "Host": "www.sec.gov",
+            },
+            timeout=30.0,  # SEC API can be slow
+            rate_limit=RATE_LIMIT_EDGAR,
+        ),
+    }
+
+
+# Process‑wide registry used by the API and the scrapers
+pools = HTTPPools(default_providers())
@@ -0,0 +1,257 @@
+"""
+chronos.jobs
+============
+
+In‑process background jobs for slow provider work.
+
+A request handler ``submit``\\ s a job and returns its id straight away; a
+fixed pool of worker tasks (``JOB_WORKERS``) runs the registered handler
+for the job's *kind*, so at most that many upstream calls are in flight
+however many clients are waiting.  Handlers may publish ``progress``
+(e.g. Cobalt's current ``retryId``) while they run; the return value
+becomes ``result``.
+
+* ``jobs.register(kind, handler)``   – ``async def handler(job) -> result``
+* ``jobs.submit(kind, params)``      – queue a job (``asyncio.QueueFull`` when full)
+* ``jobs.get(job_id)``               – current :class:`Job` (``KeyError`` if unknown)
+* ``async for snap in jobs.watch(job_id)`` – snapshot on every change, until done
+* ``jobs.cancel(job_id)`` / ``await jobs.aclose()`` / ``jobs.stats()``
+
+Jobs live in memory only: they are per worker process and lost on
+restart, and only the last ``JOB_HISTORY`` finished jobs are kept.
+
+Example
+-------
+>>> async def echo(job):
+...     return job.params
+>>> jobs.register("echo", echo)
+>>> job = jobs.submit("echo", {"q": "Acme"})
+>>> (await jobs.wait(job.id)).result
+{'q': 'Acme'}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from chronos.settings import JOB_HISTORY, JOB_QUEUE_SIZE, JOB_WORKERS
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["JobState", "Job", "JobQueue", "jobs"]
+
+
+class JobState(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def done(self) -> bool:
+        return self in (JobState.SUCCEEDED, JobState.FAILED, JobState.CANCELLED)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(eq=False)
+class Job:
+    """One unit of background work and its observable state."""
+
+    kind: str
+    params: Dict[str, Any]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    state: JobState = JobState.QUEUED
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=_now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.state.done
+
+    def update(self, **progress: Any) -> None:
+        """Merge *progress* and wake every watcher."""
+        self.progress.update(progress)
+        self._notify()
+
+    def _notify(self) -> None:
+        # Swap the event first so watchers woken here wait on the next change
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def _finish(self, state: JobState, result: Any = None, error: Optional[str] = None) -> None:
+        self.state, self.result, self.error = state, result, error
+        self.finished_at = _now()
+        self._notify()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "state": self.state.value,
+            "params": self.params,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+Handler = Callable[[Job], Awaitable[Any]]
+
+
+class JobQueue:
+    """Bounded asyncio job queue with a fixed worker pool (see module docs)."""
+
+    def __init__(
+        self,
+        workers: int = JOB_WORKERS,
+        maxsize: int = JOB_QUEUE_SIZE,
+        history: int = JOB_HISTORY,
+    ) -> None:
+        self.workers = workers
+        self.maxsize = maxsize
+        self.history = history
+        self._handlers: Dict[str, Handler] = {}
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    # ------------------------------------------------------------ lifecycle
+    def register(self, kind: str, handler: Handler) -> None:
+        self._handlers[kind] = handler
+
+    def start(self) -> None:
+        """Start the workers on the running loop (``submit`` does it lazily)."""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(self.maxsize)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"chronos-job-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def aclose(self) -> None:
+        """Stop the workers; unfinished jobs end up ``cancelled``."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers, self._queue = [], None
+        for job in self._jobs.values():
+            if not job.done:
+                job._finish(JobState.CANCELLED, error="shut down")
+
+    # ---------------------------------------------------------------- jobs
+    def submit(self, kind: str, params: Optional[Dict[str, Any]] = None) -> Job:
+        """Queue a job; raises ``KeyError`` for unknown kinds, ``asyncio.QueueFull`` when full."""
+        if kind not in self._handlers:
+            raise KeyError(kind)
+        self.start()
+        job = Job(kind, dict(params or {}))
+        self._queue.put_nowait(job)
+        self._jobs[job.id] = job
+        self._evict()
+        return job
+
+    def get(self, job_id: str) -> Job:
+        return self._jobs[job_id]
+
+    def cancel(self, job_id: str) -> Job:
+        """Cancel a queued or running job (no‑op once it is done)."""
+        job = self._jobs[job_id]
+        if job._task is not None:
+            job._task.cancel()  # the worker records the cancellation
+        elif not job.done:
+            job._finish(JobState.CANCELLED)
+        return job
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> Job:
+        """Wait until the job is done (``asyncio.TimeoutError`` after *timeout*)."""
+
+        job = self._jobs[job_id]
+
+        async def until_done() -> Job:
+            async for _ in self.watch(job_id):
+                pass
+            return job
+
+        return await asyncio.wait_for(until_done(), timeout)
+
+    async def watch(self, job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the job's snapshot now and after every change until it is done."""
+        job = self._jobs[job_id]
+        while True:
+            changed = job._changed
+            yield job.to_dict()
+            if job.done:
+                return
+            await changed.wait()
+
+    def stats(self) -> Dict[str, Any]:
+        by_state: Dict[str, int] = {state.value: 0 for state in JobState}
+        for job in self._jobs.values():
+            by_state[job.state.value] += 1
+        return {
+            "workers": len(self._workers),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "jobs": by_state,
+        }
+
+    # ------------------------------------------------------------- workers
+    def _evict(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[: max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                if not job.done:
+                    await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.state, job.started_at = JobState.RUNNING, _now()
+        job._notify()
+        task = asyncio.create_task(self._handlers[job.kind](job))
+        job._task = task
+        try:
+            # wait() rather than await: a cancelled *job* must not stop the worker
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            job._task = None
+        if task.cancelled():
+            job._finish(JobState.CANCELLED)
+        elif task.exception() is not None:
+            exc = task.exception()
+            logger.warning("Job %s (%s) failed: %s", job.id, job.kind, exc)
+            job._finish(JobState.FAILED, error=f"{type(exc).__name__}: {exc}")
+        else:
+            job._finish(JobState.SUCCEEDED, result=task.result())
+
+
+# Process‑wide queue; handlers are registered by api.jobs
+jobs = JobQueue()
@@ -13,10 +13,60 @@ it can be unit‑tested without external dependencies or a database.
 
 from __future__ import annotations
 
-from typing import Dict, List
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .models import CorporateEntity, Status
 
+_TOKEN_RE = re.compile(r"\w+")
+
+# Legal‑form words shared by a large share of all names.  Indexes retrieve
+# candidates on the other query tokens and only verify these afterwards.
+LOW_SIGNAL_TOKENS = frozenset({
+    "the", "and", "of", "co", "company", "corp", "corporation", "inc",
+    "incorporated", "llc", "llp", "lp", "ltd", "limited", "plc", "gmbh",
+})
+
+
+def _fold(text: str) -> str:
+    """Lower‑case and strip diacritics (``Café`` → ``cafe``), as FTS5's ``remove_diacritics``."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def search_tokens(text: str) -> List[str]:
+    """Lower‑cased, diacritic‑free word tokens used by the name search indexes."""
+    return _TOKEN_RE.findall(_fold(text))
+
+
+def name_matches(name: str, tokens: List[str]) -> bool:
+    """True if every query token prefix‑matches some token of *name*."""
+    name_tokens = search_tokens(name)
+    return all(any(nt.startswith(tok) for nt in name_tokens) for tok in tokens)
+
+
+def rank_matches(
+    q: str, entities: Iterable[CorporateEntity], ranked: bool = False
+) -> List[CorporateEntity]:
+    """
+    Order hits: exact name, then name prefix, then shorter names first.
+
+    With ``ranked=True`` *entities* already come in relevance order (e.g.
+    BM25), which then replaces name length as the final key.
+    """
+    q_folded = _fold(q).strip()
+
+    def key(item: Tuple[int, CorporateEntity]):
+        pos, ent = item
+        name = _fold(ent.name)
+        tail = (pos,) if ranked else (len(name), name)
+        return (name != q_folded, not name.startswith(q_folded)) + tail
+
+    return [ent for _, ent in sorted(enumerate(entities), key=key)]
+
 
 class PortfolioManager:
     """
@@ -34,6 +84,10 @@ class PortfolioManager:
 
     def __init__(self) -> None:
         self._entities: Dict[str, CorporateEntity] = {}
+        # Inverted name index: token -> slugs.  The sorted token list used
+        # for prefix lookups is rebuilt lazily after the vocabulary changes.
+        self._postings: Dict[str, Set[str]] = {}
+        self._tokens: Optional[List[str]] = []
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -43,12 +97,54 @@ class PortfolioManager:
         """lower‑cased, dash‑separated key used as unique identifier."""
         return name.lower().replace(" ", "-")
 
+    def _index(self, slug: str, name: str) -> None:
+        for tok in set(search_tokens(name)):
+            slugs = self._postings.get(tok)
+            if slugs is None:
+                self._postings[tok] = {slug}
+                self._tokens = None
+            else:
+                slugs.add(slug)
+
+    def _unindex(self, slug: str, name: str) -> None:
+        for tok in set(search_tokens(name)):
+            slugs = self._postings.get(tok)
+            if slugs is None:
+                continue
+            slugs.discard(slug)
+            if not slugs:
+                del self._postings[tok]
+                self._tokens = None
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        """Indexed tokens starting with *prefix* (bisect on the sorted vocabulary)."""
+        if self._tokens is None:
+            self._tokens = sorted(self._postings)
+        tokens = self._tokens
+        lo = i = bisect_left(tokens, prefix)
+        while i < len(tokens) and tokens[i].startswith(prefix):
+            i += 1
+        return tokens[lo:i]
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def add(self, ent: CorporateEntity) -> None:
         """Insert or overwrite an entity in the portfolio."""
-        self._entities[self._slug(ent.name)] = ent
+        slug = self._slug(ent.name)
+        old = self._entities.get(slug)
+        if old is not None:
+            self._unindex(slug, old.name)
+        self._entities[slug] = ent
+        self._index(slug, ent.name)
+
+    def add_many(self, entities: Iterable[CorporateEntity]) -> int:
+        """Insert or overwrite several entities; returns how many were added."""
+        count = 0
+        for ent in entities:
+            self.add(ent)
+            count += 1
+        return count
 
     def get(self, slug: str) -> CorporateEntity:
         """Retrieve by slug (raise KeyError if not present)."""
@@ -58,6 +154,66 @@ class PortfolioManager:
         """Return all entities currently at the given Status."""
         return [e for e in self._entities.values() if e.status == status]
 
+    def search(self, q: str, state: Optional[str] = None, limit: int = 25) -> List[CorporateEntity]:
+        """
+        Token/prefix name search backed by the in‑memory inverted index.
+
+        Every query token must prefix‑match a token of the name
+        (``"acm hold"`` finds *Acme Holdings LLC*).  Optional *state*
+        filters on jurisdiction.
+        """
+        tokens = search_tokens(q)
+        if not tokens:
+            return []
+        # Pull candidates for the most selective token only, then verify
+        # the remaining tokens against each candidate's name.
+        postings = self._postings
+        best: Optional[Tuple[int, List[str]]] = None
+        for tok in tokens:
+            terms = self._prefix_terms(tok)
+            cost = sum(len(postings[t]) for t in terms)
+            if tok in LOW_SIGNAL_TOKENS and len(tokens) > 1:
+                cost += len(self._entities)
+            if best is None or cost < best[0]:
+                best = (cost, terms)
+        candidates: Set[str] = set()
+        for term in best[1]:
+            candidates |= postings[term]
+
+        state = state.upper() if state else None
+        hits = [
+            e for e in map(self._entities.__getitem__, candidates)
+            if (not state or e.jurisdiction.upper() == state) and name_matches(e.name, tokens)
+        ]
+        return rank_matches(q, hits)[:limit]
+
+    def status_counts(self) -> Dict[Status, int]:
+        """Return ``{Status: count}`` for the statuses present."""
+        return dict(Counter(e.status for e in self._entities.values()))
+
+    def iter_columns(
+        self,
+        *columns: str,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Tuple]:
+        """
+        Yield tuples of the requested attributes (``slug`` included).
+
+        Mirrors :meth:`DBPortfolioManager.iter_columns`; defaults to
+        ``("slug", "name", "status", "jurisdiction")``.  With *after* /
+        *limit* rows are produced in slug order.
+        """
+        columns = columns or ("slug", "name", "status", "jurisdiction")
+        items = self._entities.items()
+        if after is not None or limit is not None:
+            items = sorted(
+                (kv for kv in items if after is None or kv[0] > after),
+                key=lambda kv: kv[0],
+            )[:limit]
+        for slug, ent in items:
+            yield tuple(slug if c == "slug" else getattr(ent, c) for c in columns)
+
     # ------------------------------------------------------------------
     # Dunder helpers for convenience
     # ------------------------------------------------------------------
@@ -69,4 +225,6 @@ class PortfolioManager:
         
     def clear(self) -> None:
         """Clear all entities from the portfolio."""
-        self._entities.clear()
\ No newline at end of file
+        self._entities.clear()
+        self._postings.clear()
+        self._tokens = []
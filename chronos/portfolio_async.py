@@ -0,0 +1,219 @@
+"""
+chronos.portfolio_async
+=======================
+
+Non‑blocking counterpart of :class:`chronos.portfolio_db.DBPortfolioManager`
+for ``async def`` routes.
+
+Queries run on SQLAlchemy's ``AsyncSession`` over ``aiosqlite``, so a
+commit waits on a worker thread instead of stalling the event loop (and
+every outbound provider call sharing it).  The engine uses the same
+pragmas as :func:`chronos.db.make_engine` (WAL, ``busy_timeout`` …).
+
+``aiosqlite`` and ``greenlet`` (``SQLAlchemy[asyncio]``) are imported on
+first use; :data:`ASYNC_DB_AVAILABLE` tells whether they are installed.
+
+Example
+-------
+>>> async with async_session() as s:
+...     pm = AsyncDBPortfolioManager(s)
+...     await pm.add(entity)
+...     async for ent in pm:
+...         ...
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.engine import make_url
+from sqlmodel import select
+
+from chronos.db import (
+    STREAM_CHUNK_SIZE,
+    CorporateEntityDB,
+    _row_to_entity,
+    bulk_upsert_entities,
+    entity_columns_query,
+    install_pragmas,
+    iter_entity_columns,
+    search_entities,
+    status_counts,
+)
+from chronos.models import CorporateEntity, Status
+from chronos.settings import DB_MAX_OVERFLOW, DB_POOL_SIZE, DB_POOL_TIMEOUT, DB_URL, DB_ECHO
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+__all__ = [
+    "ASYNC_DB_AVAILABLE",
+    "AsyncDBPortfolioManager",
+    "async_url",
+    "make_async_engine",
+    "get_async_engine",
+    "async_session",
+    "dispose_async_engine",
+]
+
+ASYNC_DB_AVAILABLE = all(
+    importlib.util.find_spec(mod) is not None for mod in ("aiosqlite", "greenlet")
+)
+
+def async_url(url: str = DB_URL) -> str:
+    """``sqlite:///…`` → ``sqlite+aiosqlite:///…`` (other URLs unchanged)."""
+    parsed = make_url(url)
+    if parsed.drivername == "sqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
+def make_async_engine(url: str = DB_URL, *, echo: bool = DB_ECHO) -> "AsyncEngine":
+    """Async engine over *url* with the :func:`chronos.db.make_engine` pragmas."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = async_url(url)
+    file_based = make_url(url).database not in (None, "", ":memory:")
+    kwargs: dict = {"echo": echo}
+    if file_based:
+        kwargs.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+        )
+    eng = create_async_engine(url, **kwargs)
+    install_pragmas(eng.sync_engine, wal=file_based)
+    return eng
+
+
+@lru_cache
+def get_async_engine() -> "AsyncEngine":
+    """Process‑wide async engine on :data:`chronos.settings.DB_URL`."""
+    return make_async_engine(DB_URL)
+
+
+async def dispose_async_engine() -> None:
+    """Close the process‑wide async pool, if it was ever opened."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+        get_async_engine.cache_clear()
+
+
+def async_session(bind: Optional["AsyncEngine"] = None) -> "AsyncSession":
+    """
+    New ``AsyncSession`` (objects stay usable after commit).
+
+    SQLModel's subclass, so ``run_sync`` hands the :mod:`chronos.db`
+    helpers the ``Session.exec`` API they expect.
+    """
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    return AsyncSession(bind or get_async_engine(), expire_on_commit=False)
+
+
+class AsyncDBPortfolioManager:
+    """
+    Async mirror of :class:`~chronos.portfolio_db.DBPortfolioManager`.
+
+    * ``await add(ent)`` / ``await add_many(entities)``
+    * ``await get(slug)`` (``KeyError`` if missing)
+    * ``await find_by_status(status)`` / ``await status_counts()``
+    * ``await search(q, state=None, limit=25)``
+    * ``async for ent in pm`` / ``await count()`` / ``iter_columns(*columns)``
+    * ``async for row in pm.stream_columns(*columns)``
+
+    Writes, the FTS search and keyset column scans reuse the sync helpers
+    from :mod:`chronos.db` through ``AsyncSession.run_sync``.
+    """
+
+    def __init__(self, session: "AsyncSession") -> None:
+        self._session = session
+
+    # ------------------------------------------------------------------ CRUD
+    async def add(self, ent: CorporateEntity) -> None:
+        await self.add_many([ent])
+
+    async def add_many(self, entities: Iterable[CorporateEntity]) -> int:
+        """Upsert *entities* in one transaction; returns rows written."""
+        entities = list(entities)
+        return await self._session.run_sync(lambda s: bulk_upsert_entities(s, entities))
+
+    async def get(self, slug: str) -> CorporateEntity:
+        row = await self._session.get(CorporateEntityDB, slug)
+        if row is None:
+            raise KeyError(slug)
+        return row.to_entity()
+
+    async def find_by_status(self, status: Status) -> List[CorporateEntity]:
+        rows = await self._session.exec(
+            select(CorporateEntityDB).where(CorporateEntityDB.status == status)
+        )
+        return [row.to_entity() for row in rows]
+
+    async def status_counts(self) -> Dict[Status, int]:
+        """Entity count per Status, aggregated in SQL."""
+        return await self._session.run_sync(status_counts)
+
+    async def search(
+        self, q: str, state: Optional[str] = None, limit: int = 25
+    ) -> List[CorporateEntity]:
+        """Ranked token/prefix name search via the FTS5 index."""
+        return await self._session.run_sync(
+            lambda s: search_entities(s, q, state=state, limit=limit)
+        )
+
+    async def count(self) -> int:
+        result = await self._session.exec(select(func.count()).select_from(CorporateEntityDB))
+        return result.one()
+
+    # ------------------------------------------------------------ iteration
+    async def iter_columns(
+        self,
+        *columns: str,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple]:
+        """Plain tuples of *columns* (keyset page when *after*/*limit* given)."""
+        cols: Sequence[str] = columns or ("slug", "name", "status", "jurisdiction")
+        return await self._session.run_sync(
+            lambda s: list(iter_entity_columns(s, cols, after=after, limit=limit))
+        )
+
+    async def stream_columns(
+        self,
+        *columns: str,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Tuple]:
+        """
+        :meth:`iter_columns`, fetched *STREAM_CHUNK_SIZE* rows at a time.
+
+        Runs on a connection of its own so a ``StreamingResponse`` can keep
+        reading after the request's session has been closed.
+        """
+        cols: Sequence[str] = columns or ("slug", "name", "status", "jurisdiction")
+        stmt = entity_columns_query(cols, after=after, limit=limit)
+        async with self._session.bind.connect() as conn:
+            result = await conn.stream(stmt.execution_options(yield_per=STREAM_CHUNK_SIZE))
+            async for row in result:
+                yield tuple(row)
+
+    async def __aiter__(self) -> AsyncIterator[CorporateEntity]:
+        """Stream every entity, *STREAM_CHUNK_SIZE* rows per fetch."""
+        table = CorporateEntityDB.__table__
+        result = await self._session.stream(
+            table.select().execution_options(yield_per=STREAM_CHUNK_SIZE)
+        )
+        async for row in result:
+            yield _row_to_entity(row)
+
+    # ------------------------------------------------------------- context
+    async def __aenter__(self) -> "AsyncDBPortfolioManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._session.close()
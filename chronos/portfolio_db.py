@@ -11,11 +11,22 @@ persistent store without changing its API calls.
 
 from __future__ import annotations
 
-from typing import Iterator, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from sqlmodel import Session
 
-from chronos.db import SessionLocal, upsert_entity, get_entity, all_entities
+from chronos.db import (
+    SessionLocal,
+    upsert_entity,
+    bulk_upsert_entities,
+    get_entity,
+    iter_entities,
+    search_entities,
+    iter_entity_columns,
+    entities_by_status,
+    count_entities,
+    status_counts,
+)
 from chronos.models import CorporateEntity, Status
 
 
@@ -24,10 +35,11 @@ class DBPortfolioManager:
     Drop‑in replacement backed by SQLite.
 
     Methods mirror the in‑memory PortfolioManager:
-    * add(ent)
+    * add(ent) / add_many(entities)
     * get(slug)
-    * find_by_status(status)
-    * iteration / len()
+    * find_by_status(status) / status_counts()
+    * search(q, state=None, limit=25)
+    * iteration / len() / iter_columns(*columns)
     """
 
     def __init__(self, session: Session | None = None) -> None:
@@ -37,6 +49,10 @@ class DBPortfolioManager:
     def add(self, ent: CorporateEntity) -> None:
         upsert_entity(self._session, ent)
 
+    def add_many(self, entities: Iterable[CorporateEntity]) -> int:
+        """Upsert *entities* in one transaction; returns rows written."""
+        return bulk_upsert_entities(self._session, entities)
+
     def get(self, slug: str) -> CorporateEntity:
         ent = get_entity(self._session, slug)
         if ent is None:
@@ -44,14 +60,38 @@ class DBPortfolioManager:
         return ent
 
     def find_by_status(self, status: Status) -> List[CorporateEntity]:
-        return [e for e in all_entities(self._session) if e.status == status]
+        return entities_by_status(self._session, status)
+
+    def search(self, q: str, state: Optional[str] = None, limit: int = 25) -> List[CorporateEntity]:
+        """Ranked token/prefix name search via the FTS5 index."""
+        return search_entities(self._session, q, state=state, limit=limit)
+
+    def status_counts(self) -> Dict[Status, int]:
+        """Entity count per Status, aggregated in SQL."""
+        return status_counts(self._session)
+
+    def iter_columns(
+        self,
+        *columns: str,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Tuple]:
+        """
+        Stream plain tuples for hot paths that don't need full entities.
+
+        Defaults to ``("slug", "name", "status", "jurisdiction")``.  With
+        *after* / *limit* rows come back in slug order (keyset pagination).
+        """
+        columns = columns or ("slug", "name", "status", "jurisdiction")
+        return iter_entity_columns(self._session, columns, after=after, limit=limit)
 
     # ------------------------------------------------------ dunder helpers
     def __iter__(self) -> Iterator[CorporateEntity]:
-        yield from all_entities(self._session)
+        """Stream entities in fixed‑size chunks rather than one big list."""
+        return iter_entities(self._session)
 
     def __len__(self) -> int:
-        return len(all_entities(self._session))
+        return count_entities(self._session)
 
     # ----------------------------------------------------- context manager
     def __enter__(self) -> "DBPortfolioManager":
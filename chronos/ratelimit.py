@@ -0,0 +1,263 @@
+"""
+chronos.ratelimit
+=================
+
+Rate limiting for outbound provider calls.
+
+One limiter per provider is shared by every coroutine and thread in the
+process, so many concurrent callers together stay under the upstream's
+limit (SEC EDGAR's 10 req/s, OpenCorporates' public 10 req/hour …).
+The limiters are applied in the pooled client layer (:mod:`chronos.http`),
+so cache hits never consume a slot.
+
+:class:`SlidingWindowLimiter`
+    What ``"<n>/<period>"`` specs build: at most *n* requests in *any*
+    window of one period.  Up to *n* go out at once, later ones wait for
+    the request *n* places earlier to leave the window.
+:class:`TokenBucket`
+    Steady rate with a bounded burst.  Note that a bucket of capacity *c*
+    refilling at *n* per period admits *c + n* requests in one period, so
+    it only keeps a hard "*n* per period" policy with ``capacity=1``.
+
+A request whose slot would only come up after ``max_wait`` seconds fails
+fast with :class:`RateLimitExceeded` instead of queueing.
+
+Example
+-------
+>>> limiter = SlidingWindowLimiter.from_spec("10/s")
+>>> waited = await limiter.acquire()      # seconds spent queueing
+>>> limiter.stats()["avg_wait_ms"]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import httpx
+
+__all__ = ["RateLimiter", "SlidingWindowLimiter", "TokenBucket", "RateLimitExceeded", "parse_rate"]
+
+_PERIODS = {"s": 1.0, "sec": 1.0, "second": 1.0, "m": 60.0, "min": 60.0,
+            "minute": 60.0, "h": 3600.0, "hour": 3600.0, "d": 86400.0, "day": 86400.0}
+_SPEC = re.compile(r"^\s*(\d+)\s*/\s*([a-z]+)\s*$")
+
+
+def parse_rate(spec: str) -> Tuple[int, float]:
+    """Parse ``"<n>/<period>"`` (``10/s``, ``10/hour`` …) into (n, period in seconds)."""
+    m = _SPEC.match(spec.lower())
+    if not m or m.group(2) not in _PERIODS:
+        raise ValueError(f"Invalid rate limit {spec!r}; expected e.g. '10/s' or '10/hour'")
+    n = int(m.group(1))
+    if n <= 0:
+        raise ValueError(f"Rate limit must be positive: {spec!r}")
+    return n, _PERIODS[m.group(2)]
+
+
+class RateLimitExceeded(httpx.TransportError):
+    """The wait for a token would exceed the provider's ``max_wait``."""
+
+
+class RateLimiter(ABC):
+    """
+    Thread‑safe, event‑loop‑agnostic limiter base.
+
+    Slots are *reserved* under a lock and the caller then sleeps until its
+    slot comes up.  Reservations are therefore served in arrival order
+    without holding any lock while sleeping; a cancelled waiter hands its
+    slot back.  Subclasses implement :meth:`_take`, :meth:`_commit`,
+    :meth:`_give_back` and :meth:`_limits`.
+    """
+
+    def __init__(self, max_wait: Optional[float] = None) -> None:
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        # metrics
+        self.acquired = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.waiting = 0
+        self.total_wait = 0.0
+        self.max_seen_wait = 0.0
+
+    # ------------------------------------------------------------------
+    # Core
+    # ------------------------------------------------------------------
+    @abstractmethod
+    def _take(self, now: float) -> Tuple[float, Any]:
+        """``(wait, slot)`` for the next free slot, without booking it (lock held)."""
+
+    @abstractmethod
+    def _commit(self, token: Any) -> None:
+        """Book the slot returned by :meth:`_take` (lock held)."""
+
+    @abstractmethod
+    def _give_back(self, token: Any) -> None:
+        """Release a slot whose caller was cancelled (lock held)."""
+
+    def _reserve(self) -> Tuple[float, Any]:
+        """Take one slot; return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            wait, token = self._take(now)
+            if self.max_wait is not None and wait > self.max_wait:
+                self.rejected += 1
+                raise RateLimitExceeded(
+                    f"rate limit: next slot in {wait:.1f}s exceeds max_wait {self.max_wait:.1f}s"
+                )
+            self._commit(token)
+            self.acquired += 1
+            if wait:
+                self.delayed += 1
+                self.waiting += 1
+                self.total_wait += wait
+                self.max_seen_wait = max(self.max_seen_wait, wait)
+            return wait, token
+
+    def _refund(self, token: Any) -> None:
+        with self._lock:
+            self._give_back(token)
+            self.acquired -= 1
+
+    def _done_waiting(self) -> None:
+        with self._lock:
+            self.waiting -= 1
+
+    async def acquire(self) -> float:
+        """Wait for a slot without blocking the event loop; returns the wait."""
+        wait, token = self._reserve()
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._refund(token)
+                raise
+            finally:
+                self._done_waiting()
+        return wait
+
+    def acquire_sync(self) -> float:
+        """Blocking variant for the synchronous clients."""
+        wait, _ = self._reserve()
+        if wait:
+            try:
+                time.sleep(wait)
+            finally:
+                self._done_waiting()
+        return wait
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+    @abstractmethod
+    def _limits(self) -> Dict[str, Any]:
+        """Configured limits reported by :meth:`stats`."""
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._limits(),
+                "acquired": self.acquired,
+                "delayed": self.delayed,
+                "rejected": self.rejected,
+                "waiting": self.waiting,
+                "avg_wait_ms": round(self.total_wait / self.acquired * 1000, 2) if self.acquired else 0.0,
+                "max_wait_ms": round(self.max_seen_wait * 1000, 2),
+            }
+
+
+class SlidingWindowLimiter(RateLimiter):
+    """
+    At most ``limit`` requests in any ``period`` seconds.
+
+    Keeps the start times of the last ``limit`` reservations; a new request
+    starts no earlier than ``period`` after the one ``limit`` places before
+    it, so no window of that length ever holds more than ``limit``.
+    """
+
+    def __init__(self, limit: int, period: float, max_wait: Optional[float] = None) -> None:
+        if limit < 1 or period <= 0:
+            raise ValueError("limit must be >= 1 and period > 0")
+        super().__init__(max_wait)
+        self.limit = limit
+        self.period = period
+        self._starts: Deque[float] = deque()
+
+    @classmethod
+    def from_spec(cls, spec: str, max_wait: Optional[float] = None) -> "SlidingWindowLimiter":
+        limit, period = parse_rate(spec)
+        return cls(limit, period, max_wait)
+
+    def _take(self, now: float) -> Tuple[float, float]:
+        while self._starts and self._starts[0] <= now - self.period:
+            self._starts.popleft()
+        if len(self._starts) < self.limit:
+            return 0.0, now
+        start = self._starts[-self.limit] + self.period
+        return start - now, start
+
+    def _commit(self, start: float) -> None:
+        # Starts are handed out in order, so the deque stays sorted
+        self._starts.append(start)
+
+    def _give_back(self, start: float) -> None:
+        try:
+            self._starts.remove(start)
+        except ValueError:
+            pass  # already aged out of the window
+
+    def _limits(self) -> Dict[str, Any]:
+        return {"rate_per_s": round(self.limit / self.period, 6), "burst": self.limit,
+                "period_s": self.period}
+
+
+class TokenBucket(RateLimiter):
+    """
+    Token bucket: ``rate`` tokens per second, at most ``capacity`` banked.
+
+    The balance may go negative – a caller that finds the bucket empty
+    reserves a future token and sleeps until it has accrued.
+
+    Parameters
+    ----------
+    rate
+        Tokens added per second.
+    capacity
+        Bucket size (maximum burst).
+    max_wait
+        Longest acceptable queueing time in seconds; ``None`` waits forever.
+    """
+
+    def __init__(self, rate: float, capacity: float, max_wait: Optional[float] = None) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be > 0 and capacity >= 1")
+        super().__init__(max_wait)
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    @classmethod
+    def from_spec(cls, spec: str, burst: float = 1, max_wait: Optional[float] = None) -> "TokenBucket":
+        """Evenly spaced ``"<n>/<period>"``; raising *burst* above 1 lets a period exceed *n*."""
+        limit, period = parse_rate(spec)
+        return cls(limit / period, burst, max_wait)
+
+    def _take(self, now: float) -> Tuple[float, None]:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return (0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate), None
+
+    def _commit(self, token: None) -> None:
+        self._tokens -= 1
+
+    def _give_back(self, token: None) -> None:
+        self._tokens = min(self.capacity, self._tokens + 1)
+
+    def _limits(self) -> Dict[str, Any]:
+        return {"rate_per_s": round(self.rate, 6), "burst": self.capacity}
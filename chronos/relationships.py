@@ -3,12 +3,72 @@ chronos.relationships
 =====================
 
 Parent → subsidiary ownership graph built on NetworkX.
+
+Effective (indirect) ownership is computed on a sparse adjacency matrix;
+NumPy/SciPy are imported lazily so the plain graph works without them.
 """
 
 from __future__ import annotations
+import functools
+import hashlib
+import threading
+import uuid
+from collections import deque
 import networkx as nx
-from typing import Dict, List, Any, Optional
+from datetime import date
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from .models import CorporateEntity, Status
+from .serialization import dumps
+
+if TYPE_CHECKING:  # pragma: no cover
+    from scipy.sparse import csr_matrix
+
+# Entries below this fraction are dropped from ownership_matrix()
+OWNERSHIP_EPSILON = 1e-6
+
+# Shell‑risk factors: (label, weight).  A node's score is the sum of the
+# weights of the factors it matches; bit *i* of its cached mask ↔ factor *i*.
+# The first STRUCTURAL_FACTORS look at ownership edges and only apply to
+# nodes that have some; the rest are entity attributes.
+SHELL_FACTORS: Tuple[Tuple[str, float], ...] = (
+    ("Shell pattern: Owned but has no subsidiaries", 0.3),
+    ("Shell pattern: Sole subsidiary in a single-owner chain", 0.2),
+    ("Active entity with no subsidiaries", 0.1),
+    ("LLC structure with limited visibility", 0.3),
+    ("Delinquent filing status", 0.2),
+    ("Missing formation date", 0.1),
+    ("Registered in {jurisdiction}, a jurisdiction favored for secrecy", 0.15),
+    ("Shell pattern: Delaware LLC with limited transparency", 0.25),
+    ("Shell pattern: Holding company naming pattern", 0.15),
+)
+SECRECY_JURISDICTIONS = frozenset({"DE", "WY", "NV"})
+STRUCTURAL_FACTORS = 3
+_STRUCTURAL_MASK = (1 << STRUCTURAL_FACTORS) - 1
+
+# Node/edge change events kept for GET /relationships/changes
+CHANGELOG_SIZE = 10_000
+
+
+def _describe_shell_mask(
+    mask: int, threshold: float, cap: Optional[float]
+) -> Optional[Tuple[float, List[str]]]:
+    """``(score, factor labels)`` for a factor bitmask, or None below *threshold*."""
+    bits = [i for i in range(len(SHELL_FACTORS)) if mask >> i & 1]
+    score = round(sum(SHELL_FACTORS[i][1] for i in bits), 6)
+    if score < threshold:
+        return None
+    return (min(score, cap) if cap is not None else score, [SHELL_FACTORS[i][0] for i in bits])
+
+
+def _locked(method):
+    """Run *method* under the graph's lock, so reloads in another thread can't race it."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class RelationshipGraph:
@@ -26,7 +86,24 @@ class RelationshipGraph:
 
     def __init__(self) -> None:
         self.g = nx.DiGraph()
+        # Held by mutations and by readers that iterate the graph
+        self._lock = threading.RLock()
         self._entity_data: Dict[str, Dict[str, Any]] = {}  # Store entity details by slug
+        # Shell‑score cache: factor bitmask per node (None → full rescore),
+        # nodes whose inputs changed, and the last sorted report
+        self._shell_masks: Optional[Dict[str, int]] = None
+        self._shell_dirty: set[str] = set()
+        self._shell_report: Optional[Tuple[Tuple[float, Optional[float], bool], List[Dict[str, Any]]]] = None
+        # Bumped by every mutation; to_json() payloads are memoised per version
+        self.version = 0
+        self._json_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._bytes_cache: Optional[Tuple[int, bytes, str]] = None
+        # Ring buffer of (version, event).  Versions are only comparable
+        # within one epoch (per instance here; DBRelationshipGraph shares
+        # it between workers); ``since`` below the floor needs a resync.
+        self.epoch = uuid.uuid4().hex[:12]
+        self._changes: deque[Tuple[int, Dict[str, Any]]] = deque(maxlen=CHANGELOG_SIZE)
+        self._changes_floor = 0
 
     # ------------------------------------------------------------------
     # Public API
@@ -40,6 +117,10 @@ class RelationshipGraph:
         """
         if not (0.0 <= pct <= 100.0):
             raise ValueError("pct must be between 0 and 100")
+
+        new_nodes = [n for n in dict.fromkeys((parent, child)) if n not in self.g]
+        existed = self.g.has_edge(parent, child)
+        was_primary = child in self.g and self.g.in_degree(child) == 0
             
         # Ensure both nodes exist in the graph before creating edge
         if parent not in self.g:
@@ -51,6 +132,34 @@ class RelationshipGraph:
             print(f"Adding missing node: {child}")
             
         self.g.add_edge(parent, child, pct=pct)
+        self._touch_edge(parent, child)
+
+        for node in new_nodes:
+            self._record("add", "node", self._node_json(node))
+        if was_primary:  # child just became a SUBSIDIARY
+            self._record("update", "node", self._node_json(child))
+        self._record("update" if existed else "add", "edge",
+                     {"source": parent, "target": child, "value": pct})
+
+    def unlink(self, parent: str, child: str) -> None:
+        """Remove the parent → child edge (no‑op if it doesn't exist)."""
+        if self.g.has_edge(parent, child):
+            self.g.remove_edge(parent, child)
+            self._touch_edge(parent, child)
+            self._record("remove", "edge", {"source": parent, "target": child})
+            if self.g.in_degree(child) == 0:  # child is PRIMARY again
+                self._record("update", "node", self._node_json(child))
+
+    def clear_edges(self) -> None:
+        """Drop every ownership edge but keep nodes and their metadata."""
+        self.g.remove_edges_from(list(self.g.edges()))
+        self._touch_all()
+
+    def clear(self) -> None:
+        """Drop all nodes, edges and entity metadata."""
+        self.g.clear()
+        self._entity_data.clear()
+        self._touch_all()
 
     def subsidiaries(self, parent: str):
         """Return a list of direct subsidiaries for *parent*."""
@@ -64,39 +173,215 @@ class RelationshipGraph:
         """Return the stored percentage or raise KeyError if edge missing."""
         return self.g.edges[parent, child]["pct"]
     
+    # ------------------------------------------------------------------
+    # Effective ownership (sparse linear algebra)
+    # ------------------------------------------------------------------
+    def _adjacency(self, nodes: List[str]):
+        """
+        Sparse matrix ``A`` with ``A[i, j]`` = direct fraction of *j* held by *i*.
+
+        Only edges between *nodes* are included.
+        """
+        import numpy as np
+        from scipy import sparse
+
+        pos = {n: i for i, n in enumerate(nodes)}
+        edges = [
+            (pos[u], pos[v], pct)
+            for u, v, pct in self.g.subgraph(nodes).edges(data="pct", default=0.0)
+        ]
+        rows, cols, data = (np.array(col) for col in zip(*edges)) if edges else ([], [], [])
+        n = len(nodes)
+        return sparse.csr_matrix(
+            (np.asarray(data, dtype=float) / 100.0, (rows, cols)), shape=(n, n)
+        )
+
+    @staticmethod
+    def _solve(m, rhs):
+        """Solve ``m x = rhs``, turning a singular system into ValueError."""
+        import warnings
+
+        import numpy as np
+        from scipy.sparse.linalg import MatrixRankWarning, spsolve
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", MatrixRankWarning)
+            try:
+                x = spsolve(m.tocsc(), rhs)
+            except MatrixRankWarning:
+                x = None
+        if x is None or not np.all(np.isfinite(x)):
+            raise ValueError("ownership cycle with 100% retention; effective ownership is undefined")
+        return np.atleast_1d(x)
+
+    def effective_ownership(self, root: str) -> Dict[str, float]:
+        """
+        Effective % of every downstream entity held by *root* through all chains.
+
+        With ``A`` the direct‑ownership matrix, the total holding is
+        ``A + A² + … = (I − A)⁻¹ − I``, which also converges for circular
+        cross‑holdings.  Only *root*'s descendants take part, so one sparse
+        solve of ``(I − A)ᵀ x = e_root`` on that subgraph is enough.
+        """
+        import numpy as np
+        from scipy import sparse
+
+        if root not in self.g:
+            raise KeyError(root)
+        nodes = [root, *nx.descendants(self.g, root)]
+        if len(nodes) == 1:
+            return {}
+        a = self._adjacency(nodes)
+        rhs = np.zeros(len(nodes))
+        rhs[0] = 1.0
+        x = self._solve((sparse.identity(len(nodes), format="csr") - a).T, rhs)
+        return {
+            node: float(x[i]) * 100.0
+            for i, node in enumerate(nodes)
+            if i and x[i] > OWNERSHIP_EPSILON
+        }
+
+    def beneficial_owners(self, slug: str, threshold: float = 25.0) -> List[Dict[str, Any]]:
+        """
+        Upstream owners holding at least *threshold* % of *slug* in total.
+
+        Solves the column counterpart of :meth:`effective_ownership` over
+        *slug*'s ancestors.  ``ultimate`` marks owners nobody else owns.
+        """
+        import numpy as np
+        from scipy import sparse
+
+        if slug not in self.g:
+            raise KeyError(slug)
+        nodes = [slug, *nx.ancestors(self.g, slug)]
+        if len(nodes) == 1:
+            return []
+        a = self._adjacency(nodes)
+        rhs = np.zeros(len(nodes))
+        rhs[0] = 1.0
+        y = self._solve(sparse.identity(len(nodes), format="csr") - a, rhs)
+        owners = [
+            {
+                "slug": node,
+                "effective_pct": round(float(y[i]) * 100.0, 6),
+                "ultimate": self.g.in_degree(node) == 0,
+            }
+            for i, node in enumerate(nodes)
+            if i and y[i] * 100.0 >= threshold
+        ]
+        return sorted(owners, key=lambda o: o["effective_pct"], reverse=True)
+
+    def ownership_matrix(
+        self, epsilon: float = OWNERSHIP_EPSILON, max_iter: int = 1000
+    ) -> Tuple["csr_matrix", List[str]]:
+        """
+        All‑pairs effective ownership as a sparse matrix plus its node order.
+
+        ``E[i, j]`` is the fraction of ``nodes[j]`` held by ``nodes[i]``.
+        The dense inverse of ``I − A`` is out of reach for large graphs, so
+        ``(I − A)⁻¹ − I`` is accumulated as its Neumann series
+        ``A + A² + …`` in sparse form, dropping terms below *epsilon*.
+        Acyclic structures terminate after their depth; cross‑holdings
+        converge geometrically.
+        """
+        nodes = list(self.g.nodes())
+        a = self._adjacency(nodes)
+        total = a.copy()
+        term = a
+        for _ in range(max_iter):
+            term = term @ a
+            term.data[term.data < epsilon] = 0.0
+            term.eliminate_zeros()
+            if term.nnz == 0:
+                break
+            total = total + term
+        else:
+            raise ValueError("ownership matrix did not converge (100% ownership cycle?)")
+        return total.tocsr(), nodes
+
     def add_entity_data(self, entity: CorporateEntity) -> None:
         """Add or update entity metadata in the graph."""
-        slug = entity.name.lower().replace(" ", "-")
-        self._entity_data[slug] = {
-            "name": entity.name,
-            "jurisdiction": entity.jurisdiction,
-            "status": entity.status.name,
-            "formed": entity.formed.isoformat() if entity.formed else None,
-        }
+        self.add_node_data(
+            entity.name.lower().replace(" ", "-"),
+            entity.name,
+            entity.jurisdiction,
+            entity.status,
+            entity.formed,
+        )
+
+    def add_node_data(
+        self,
+        slug: str,
+        name: str,
+        jurisdiction: str,
+        status: Status,
+        formed: Optional[date] = None,
+    ) -> None:
+        """
+        Add or update node metadata from plain column values.
+
+        Lets callers feed ``iter_columns`` tuples straight in without
+        building a :class:`CorporateEntity` per row.
+        """
+        existed = slug in self.g
+        self._store_node_data(slug, name, jurisdiction, status, formed)
+        self._touch(slug)
+        self._record("update" if existed else "add", "node", self._node_json(slug))
+
+    def _store_node_data(
+        self,
+        slug: str,
+        name: str,
+        jurisdiction: str,
+        status: Status,
+        formed: Optional[date] = None,
+    ) -> None:
+        """Set node metadata without versioning (bulk loads call _touch_all)."""
+        self._entity_data[slug] = self._node_data(name, jurisdiction, status, formed)
         # Ensure node exists in graph
         if slug not in self.g:
             self.g.add_node(slug)
     
+    @staticmethod
+    def _node_data(
+        name: str, jurisdiction: str, status: Status, formed: Optional[date] = None
+    ) -> Dict[str, Any]:
+        return {
+            "name": name,
+            "jurisdiction": jurisdiction,
+            "status": status.name,
+            "formed": formed.isoformat() if formed else None,
+        }
+
     def get_entity_data(self, slug: str) -> Optional[Dict[str, Any]]:
         """Get entity metadata by slug."""
         return self._entity_data.get(slug)
     
+    def _node_json(self, node: str) -> Dict[str, Any]:
+        """One entry of the ``nodes`` array of :meth:`to_json`."""
+        node_data = self.get_entity_data(node) or {"name": node, "status": "UNKNOWN"}
+        return {
+            "id": node,
+            "name": node_data.get("name", node),
+            "status": node_data.get("status", "UNKNOWN"),
+            "jurisdiction": node_data.get("jurisdiction", ""),
+            # Calculate node type based on connections
+            "type": "PRIMARY" if self.g.in_degree(node) == 0 else "SUBSIDIARY"
+        }
+
+    @_locked
     def to_json(self) -> Dict[str, Any]:
         """
         Convert the graph to JSON format for visualization.
         Returns a dict with nodes and links arrays.
+
+        The result is memoised until the next mutation – treat it as
+        read‑only.
         """
-        nodes = []
-        for node in self.g.nodes():
-            node_data = self.get_entity_data(node) or {"name": node, "status": "UNKNOWN"}
-            nodes.append({
-                "id": node,
-                "name": node_data.get("name", node),
-                "status": node_data.get("status", "UNKNOWN"),
-                "jurisdiction": node_data.get("jurisdiction", ""),
-                # Calculate node type based on connections
-                "type": "PRIMARY" if self.parents(node) == [] else "SUBSIDIARY"
-            })
+        if self._json_cache is not None and self._json_cache[0] == self.version:
+            return self._json_cache[1]
+
+        nodes = [self._node_json(node) for node in self.g.nodes()]
         
         links = []
         for source, target, data in self.g.edges(data=True):
@@ -106,10 +391,59 @@ class RelationshipGraph:
                 "value": data.get("pct", 0)
             })
         
-        return {
+        payload = {
             "nodes": nodes,
             "links": links
         }
+        self._json_cache = (self.version, payload)
+        return payload
+
+    @_locked
+    def to_json_bytes(self) -> Tuple[bytes, str]:
+        """
+        Encoded :meth:`to_json` payload and its ETag, memoised per version.
+
+        The ETag is a content hash, so workers holding the same graph hand
+        out the same tag even though their version counters differ.
+        """
+        if self._bytes_cache is None or self._bytes_cache[0] != self.version:
+            body = dumps(self.to_json())
+            etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+            self._bytes_cache = (self.version, body, etag)
+        return self._bytes_cache[1], self._bytes_cache[2]
+
+    # ------------------------------------------------------------------
+    # Change feed
+    # ------------------------------------------------------------------
+    def _record(self, op: str, kind: str, data: Dict[str, Any]) -> None:
+        """Append one change event tagged with the current version."""
+        if len(self._changes) == self._changes.maxlen:
+            # The oldest event is about to fall off the ring buffer
+            self._changes_floor = max(self._changes_floor, self._changes[0][0])
+        self._changes.append(
+            (self.version, {"version": self.version, "op": op, "kind": kind, "data": data})
+        )
+
+    @_locked
+    def changes_since(self, since: int, epoch: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Node/edge events newer than version *since*, oldest first.
+
+        Returns ``{"epoch", "version", "changes": [...]}``, or
+        ``{"epoch", "version", "resync": True}`` when the events are no
+        longer in the ring buffer, the graph was bulk‑reset, or *epoch*
+        names a different graph instance (e.g. another API worker).
+        """
+        head = {"epoch": self.epoch, "version": self.version}
+        if (epoch is not None and epoch != self.epoch) or not (self._changes_floor <= since <= self.version):
+            return {**head, "resync": True}
+        newer = []
+        for version, event in reversed(self._changes):
+            if version <= since:
+                break
+            newer.append(event)
+        newer.reverse()
+        return {**head, "changes": newer}
     
     def identify_proxies(self) -> List[str]:
         """Find entities that appear to be acting as proxies."""
@@ -120,39 +454,151 @@ class RelationshipGraph:
                 proxies.append(node)
         return proxies
     
-    def identify_shell_companies(self) -> List[Dict[str, Any]]:
+    # ------------------------------------------------------------------
+    # Shell‑company scoring (cached, invalidated per touched node)
+    # ------------------------------------------------------------------
+    def _advance(self) -> None:
+        """Move to the next version (subclasses may derive it from shared state)."""
+        self.version += 1
+
+    def _touch(self, *nodes: str) -> None:
+        """Record a change to *nodes*: new version, rescore them."""
+        self._advance()
+        self._json_cache = self._bytes_cache = None
+        self._shell_report = None
+        if self._shell_masks is not None:
+            self._shell_dirty.update(nodes)
+
+    def _touch_edge(self, parent: str, child: str) -> None:
+        # parent's out‑degree feeds the chain factor of all its children
+        self._touch(parent, child, *self.g.successors(parent))
+
+    def _touch_all(self) -> None:
+        """Drop every cached score and the changelog (bulk reloads, clears)."""
+        self._advance()
+        self._json_cache = self._bytes_cache = None
+        self._shell_masks = None
+        self._shell_dirty.clear()
+        self._shell_report = None
+        self._changes.clear()
+        self._changes_floor = self.version
+
+    def _shell_mask_array(self, nodes: List[str], in_deg, out_deg, parent_out):
+        """Vectorised factor bitmasks for *nodes* given their degree arrays."""
+        import numpy as np
+
+        data = [self._entity_data.get(n) or {} for n in nodes]
+        status = np.array([d.get("status", "") for d in data])
+        name = [d.get("name", "").lower() for d in data]
+        juris = np.array([d.get("jurisdiction", "") for d in data])
+        is_llc = np.array(["llc" in n for n in name], dtype=bool)
+        active = status == "ACTIVE"
+
+        factors = (
+            (out_deg == 0) & (in_deg > 0),
+            (in_deg == 1) & (parent_out == 1),
+            active & (out_deg == 0) & (in_deg > 0),  # standalone entities aren't "structure"
+            active & is_llc,
+            status == "DELINQUENT",
+            np.array([d.get("formed") is None for d in data], dtype=bool),
+            np.isin(juris, list(SECRECY_JURISDICTIONS)),
+            is_llc & (juris == "DE"),
+            np.array(["holdings" in n or "group" in n for n in name], dtype=bool),
+        )
+        masks = np.zeros(len(nodes), dtype=np.int64)
+        for bit, hit in enumerate(factors):
+            masks |= hit.astype(np.int64) << bit
+        # Nodes without entity metadata are never reported
+        masks[np.array([not d for d in data], dtype=bool)] = 0
+        return masks
+
+    def _rescore_all(self) -> None:
+        import numpy as np
+
+        nodes = list(self.g.nodes())
+        n = len(nodes)
+        pos = {node: i for i, node in enumerate(nodes)}
+        edges = np.array([(pos[u], pos[v]) for u, v in self.g.edges()], dtype=np.int64).reshape(-1, 2)
+        out_deg = np.bincount(edges[:, 0], minlength=n)
+        in_deg = np.bincount(edges[:, 1], minlength=n)
+        parent = np.zeros(n, dtype=np.int64)
+        parent[edges[:, 1]] = edges[:, 0]  # only read where in_deg == 1
+        parent_out = np.where(in_deg == 1, out_deg[parent], 0)
+        masks = self._shell_mask_array(nodes, in_deg, out_deg, parent_out)
+        self._shell_masks = dict(zip(nodes, masks.tolist()))
+
+    def _rescore(self, nodes: List[str]) -> None:
+        import numpy as np
+
+        g = self.g
+        in_deg = np.array([len(g.pred[n]) for n in nodes], dtype=np.int64)
+        out_deg = np.array([len(g.succ[n]) for n in nodes], dtype=np.int64)
+        parent_out = np.array(
+            [len(g.succ[next(iter(g.pred[n]))]) if len(g.pred[n]) == 1 else 0 for n in nodes],
+            dtype=np.int64,
+        )
+        masks = self._shell_mask_array(nodes, in_deg, out_deg, parent_out)
+        self._shell_masks.update(zip(nodes, masks.tolist()))
+
+    @_locked
+    def shell_scores(self) -> Dict[str, int]:
+        """
+        Up‑to‑date factor bitmask per node (see :data:`SHELL_FACTORS`).
+
+        The first call scores every node in one vectorised pass over the
+        in/out‑degree arrays; afterwards only nodes touched by
+        ``link_parent`` / ``unlink`` / ``add_node_data`` are rescored.
         """
-        Identify potential shell companies based on graph structure.
-        Returns a list of entity slugs with their shell risk score.
+        if self._shell_masks is None:
+            self._rescore_all()
+        elif self._shell_dirty:
+            dirty = [n for n in self._shell_dirty if n in self.g]
+            for gone in self._shell_dirty.difference(dirty):
+                self._shell_masks.pop(gone, None)
+            self._shell_dirty.clear()
+            if dirty:
+                self._rescore(dirty)
+        return self._shell_masks
+
+    @_locked
+    def identify_shell_companies(
+        self, threshold: float = 0.3, cap: Optional[float] = None, attributes: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Identify potential shell companies from graph structure.
+
+        Returns ``slug``/``name``/``risk_score``/``factors`` dicts for every
+        entity scoring at least *threshold*, highest first; *cap* limits the
+        reported score.  With *attributes* the entity attribute factors
+        (LLC form, filing status, jurisdiction, naming) count as well.
+        Repeated calls on an unchanged graph return the cached list – treat
+        it as read‑only.
         """
+        key = (threshold, cap, attributes)
+        if self._shell_report is not None and self._shell_report[0] == key:
+            return self._shell_report[1]
+
+        # At most 2**len(SHELL_FACTORS) distinct masks: describe each once
+        described: Dict[int, Optional[Tuple[float, List[str]]]] = {}
         shells = []
-        
-        for node in self.g.nodes():
-            risk_score = 0.0
-            entity_data = self.get_entity_data(node)
-            
-            if not entity_data:
+        for node, mask in self.shell_scores().items():
+            if not attributes:
+                mask &= _STRUCTURAL_MASK
+            if not mask:
                 continue
-                
-            # Factor 1: No subsidiaries but is owned by others
-            if (len(self.subsidiaries(node)) == 0 and 
-                len(self.parents(node)) > 0):
-                risk_score += 0.3
-                
-            # Factor 2: Entity is in a chain of single-child owners
-            if (len(self.parents(node)) == 1 and 
-                len(self.subsidiaries(self.parents(node)[0])) == 1):
-                risk_score += 0.2
-                
-            # Factor 3: Status indicators
-            if entity_data.get("status") == "ACTIVE" and len(self.subsidiaries(node)) == 0:
-                risk_score += 0.1
-                
-            if risk_score >= 0.3:  # Threshold for reporting
+            if mask not in described:
+                described[mask] = _describe_shell_mask(mask, threshold, cap)
+            hit = described[mask]
+            if hit is not None:
+                risk_score, factors = hit
+                data = self._entity_data[node]
                 shells.append({
                     "slug": node,
-                    "name": entity_data.get("name", node),
-                    "risk_score": risk_score
+                    "name": data.get("name", node),
+                    "risk_score": risk_score,
+                    "factors": [f.format(jurisdiction=data.get("jurisdiction", "")) for f in factors],
                 })
-                
-        return sorted(shells, key=lambda x: x["risk_score"], reverse=True)
+
+        shells.sort(key=lambda x: x["risk_score"], reverse=True)
+        self._shell_report = (key, shells)
+        return shells
@@ -0,0 +1,296 @@
+"""
+chronos.relationships_db
+========================
+
+SQLite‑backed :class:`RelationshipGraph`.
+
+Edges are written through to the ``ownership_edges`` table and the
+in‑memory NetworkX graph is (re)loaded lazily.  Every API worker holds its
+own copy, so before serving a request the graph calls :meth:`sync`, which
+compares the trigger‑maintained counters in ``chronos_revisions`` with the
+revisions it last loaded and only reloads the part that changed – edges
+with one bulk query, node metadata for just the entities listed in the
+``chronos_entity_changes`` log (one streamed column scan if the log no
+longer reaches back far enough).
+
+Reloads are diffed against the in‑memory copy and recorded as per
+node/edge change events.  ``version`` is the sum of the shared counters
+and ``epoch`` is stored in the database, so a client can poll
+``changes_since`` on any worker.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import networkx as nx
+from sqlmodel import Session, select
+
+from chronos.db import (
+    EDGES_REVISION,
+    ENTITIES_REVISION,
+    STREAM_CHUNK_SIZE,
+    CorporateEntityDB,
+    engine,
+    delete_edges,
+    entity_changes_since,
+    get_graph_epoch,
+    get_revision,
+    get_revisions,
+    load_edges,
+    upsert_edge,
+)
+from chronos.relationships import RelationshipGraph
+
+NODE_COLUMNS = ("slug", "name", "jurisdiction", "status", "formed")
+# Slugs per ``IN (...)`` when fetching changed entities (SQLite variable limit)
+SLUG_BATCH = 500
+
+
+class DBRelationshipGraph(RelationshipGraph):
+    """
+    Ownership graph persisted in SQLite and shared by all worker processes.
+
+    * ``link_parent`` / ``unlink`` / ``clear_edges`` write through to the DB.
+    * ``sync()`` is cheap (one small query) when nothing changed elsewhere.
+    * Node metadata comes from the portfolio table, so ``GET /relationships``
+      no longer has to walk the whole portfolio on every call.
+    """
+
+    def __init__(self, bind=None) -> None:
+        super().__init__()
+        self._bind = bind or engine
+        # Revisions the in‑memory copy reflects; None forces a reload
+        self._edges_rev: Optional[int] = None
+        self._nodes_rev: Optional[int] = None
+
+    def _session(self) -> Session:
+        return Session(self._bind)
+
+    @contextmanager
+    def _snapshot(self) -> Iterator[Session]:
+        """Session whose reads all see one consistent database snapshot."""
+        with self._session() as s:
+            # pysqlite only opens transactions for writes; without this the
+            # revision read and the data reads could see different commits
+            s.connection().exec_driver_sql("BEGIN")
+            yield s
+
+    def _advance(self) -> None:
+        # Version = sum of the shared counters this copy reflects, so every
+        # worker holding the same data reports the same version
+        self.version = (self._edges_rev or 0) + (self._nodes_rev or 0)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def sync(self) -> bool:
+        """
+        Reload whatever another process changed since the last call.
+
+        Revisions and data are read in one snapshot.  The first load is a
+        bulk load; later ones diff the fresh rows against the in‑memory
+        copy and record per node/edge change events, so
+        :meth:`changes_since` keeps working across reloads (and across
+        workers).  Returns ``True`` if anything was reloaded.
+        """
+        with self._lock:
+            if self._edges_rev is None and self._nodes_rev is None:
+                with self._session() as s:
+                    self.epoch = get_graph_epoch(s)
+            with self._snapshot() as s:
+                revs = get_revisions(s)
+                edges_rev = revs.get(EDGES_REVISION, 0)
+                nodes_rev = revs.get(ENTITIES_REVISION, 0)
+                reload_nodes = nodes_rev != self._nodes_rev
+                reload_edges = edges_rev != self._edges_rev
+                if not (reload_nodes or reload_edges):
+                    return False
+                baseline = self._edges_rev is None or self._nodes_rev is None
+                slugs = None
+                if reload_nodes and not baseline:
+                    slugs = entity_changes_since(s, self._nodes_rev)
+                self._edges_rev, self._nodes_rev = edges_rev, nodes_rev
+                if baseline:
+                    self._load_all(s)
+                else:
+                    self._apply_diff(
+                        self._node_rows(s, slugs) if reload_nodes else None,
+                        load_edges(s) if reload_edges else None,
+                        slugs,
+                    )
+                return True
+
+    @staticmethod
+    def _node_rows(s: Session, slugs: Optional[Set[str]] = None) -> Iterable[tuple]:
+        """Node columns of every entity, or only of *slugs*."""
+        table = CorporateEntityDB.__table__
+        stmt = select(*(table.c[c] for c in NODE_COLUMNS))
+        if slugs is None:
+            return s.execute(stmt.execution_options(yield_per=STREAM_CHUNK_SIZE))
+        ordered = sorted(slugs)
+        return [
+            row
+            for i in range(0, len(ordered), SLUG_BATCH)
+            for row in s.execute(stmt.where(table.c.slug.in_(ordered[i:i + SLUG_BATCH])))
+        ]
+
+    def _load_all(self, s: Session) -> None:
+        """Bulk (re)load of nodes and edges; clients must resync."""
+        self._entity_data.clear()
+        g = nx.DiGraph()
+        for slug, *data in self._node_rows(s):
+            self._entity_data[slug] = self._node_data(*data)
+        g.add_nodes_from(self._entity_data)
+        g.add_weighted_edges_from(load_edges(s), weight="pct")
+        self.g = g
+        self._touch_all()
+
+    def _apply_diff(
+        self,
+        node_rows: Optional[Iterable[tuple]],
+        edge_rows: Optional[Iterable[tuple]],
+        node_slugs: Optional[Set[str]] = None,
+    ) -> None:
+        """
+        Apply changed rows in place and record one event per change.
+
+        *node_rows* cover every entity, or – with *node_slugs* – just those
+        slugs; a listed slug without a row was deleted.
+        """
+        g = self.g
+        added: Dict[str, None] = {}  # ordered set of new nodes
+        updated: Set[str] = set()
+        removed: List[str] = []
+        edge_events: List[Tuple[str, Dict]] = []
+        touched: Set[str] = set()
+
+        if edge_rows is not None:
+            fresh = {(p, c): pct for p, c, pct in edge_rows}
+            old = {(p, c): pct for p, c, pct in g.edges(data="pct")}
+            gone = [e for e in old if e not in fresh]
+            changed = [(e, pct) for e, pct in fresh.items() if old.get(e) != pct]
+            # PRIMARY/SUBSIDIARY of the children before the change
+            was_primary = {
+                c: g.in_degree(c) == 0
+                for _, c in gone + [e for e, _ in changed] if c in g
+            }
+            for p, c in gone:
+                touched.update((p, c, *g.successors(p)))
+                g.remove_edge(p, c)
+                edge_events.append(("remove", {"source": p, "target": c}))
+            for (p, c), pct in changed:
+                for node in (p, c):
+                    if node not in g:
+                        g.add_node(node)
+                        added[node] = None
+                g.add_edge(p, c, pct=pct)
+                touched.update((p, c, *g.successors(p)))
+                edge_events.append(("update" if (p, c) in old else "add",
+                                    {"source": p, "target": c, "value": pct}))
+            updated.update(
+                c for c, primary in was_primary.items() if (g.in_degree(c) == 0) != primary
+            )
+
+        if node_rows is not None:
+            seen: Set[str] = set()
+            for slug, *values in node_rows:
+                seen.add(slug)
+                data = self._node_data(*values)
+                if self._entity_data.get(slug) != data:
+                    self._entity_data[slug] = data
+                    if slug in g:
+                        updated.add(slug)
+                    else:
+                        g.add_node(slug)
+                        added[slug] = None
+            candidates = self._entity_data if node_slugs is None else sorted(node_slugs)
+            for slug in [s for s in candidates if s in self._entity_data and s not in seen]:
+                del self._entity_data[slug]
+                if g.degree(slug) == 0:
+                    g.remove_node(slug)
+                    removed.append(slug)
+                else:  # an edge still needs it; metadata falls back to UNKNOWN
+                    updated.add(slug)
+
+        updated.difference_update(added)
+        updated.intersection_update(g)
+        touched.update(added, updated, removed)
+        if not touched:
+            # Rows were rewritten unchanged (e.g. search hits stored again):
+            # new shared version, same payload – keep the encoded caches
+            self._advance()
+            if self._json_cache is not None:
+                self._json_cache = (self.version, self._json_cache[1])
+            if self._bytes_cache is not None:
+                self._bytes_cache = (self.version, *self._bytes_cache[1:])
+            return
+        self._touch(*touched)
+        for slug in added:
+            self._record("add", "node", self._node_json(slug))
+        for slug in sorted(updated):
+            self._record("update", "node", self._node_json(slug))
+        for slug in removed:
+            self._record("remove", "node", {"id": slug})
+        for op, data in edge_events:
+            self._record(op, "edge", data)
+
+    def _after_write(self, s: Session, bumps: int) -> bool:
+        """
+        Commit and update the tracked edge revision.
+
+        Our own statement bumped the counter *bumps* times.  If the value
+        before that isn't the one we last loaded, someone else wrote in
+        the meantime: pick up their change and ours with a diff reload and
+        return ``False`` (the caller must not apply its change again).
+        """
+        rev = get_revision(s, EDGES_REVISION)
+        s.commit()
+        if self._edges_rev is not None and rev - bumps == self._edges_rev:
+            self._edges_rev = rev
+            return True
+        self.sync()
+        return False
+
+    # ------------------------------------------------------------------
+    # Write‑through mutations
+    # ------------------------------------------------------------------
+    def link_parent(self, parent: str, child: str, pct: float, source: str = "api") -> None:
+        """Add or update parent → child and persist it."""
+        if not (0.0 <= pct <= 100.0):
+            raise ValueError("pct must be between 0 and 100")
+        with self._lock, self._session() as s:
+            upsert_edge(s, parent, child, pct, source=source)
+            if self._after_write(s, 1):
+                super().link_parent(parent, child, pct)
+
+    def unlink(self, parent: str, child: str) -> None:
+        with self._lock, self._session() as s:
+            if self._after_write(s, delete_edges(s, parent, child)):
+                super().unlink(parent, child)
+
+    def clear_edges(self) -> None:
+        with self._lock, self._session() as s:
+            if self._after_write(s, delete_edges(s)):
+                super().clear_edges()
+
+    def clear(self) -> None:
+        """Drop all persisted edges and reload node metadata from the portfolio."""
+        with self._lock:
+            self.clear_edges()
+            with self._snapshot() as s:
+                revs = get_revisions(s)
+                self._edges_rev = revs.get(EDGES_REVISION, 0)
+                self._nodes_rev = revs.get(ENTITIES_REVISION, 0)
+                self._load_all(s)
+
+    def add_node_data(self, slug: str, *args: Any, **kwargs: Any) -> None:
+        """
+        Node metadata comes from the portfolio table: sync with it.
+
+        Only an entity that was never stored is kept as local metadata.
+        """
+        self.sync()
+        if slug not in self._entity_data:
+            super().add_node_data(slug, *args, **kwargs)
@@ -15,6 +15,7 @@ from typing import Dict, List, Optional, Any, cast
 from httpx import AsyncClient, Response
 
 from chronos.models import CorporateEntity, Status
+from chronos.singleflight import coalesce
 from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,10 @@ STATUS_MAP = {
 DEFAULT_STATUS = Status.ACTIVE
 
 
+def _no_documents(data: Any) -> bool:
+    return not (data or {}).get("documents")
+
+
 class DataAxleScraper(BaseScraper):
     """
     Data Axle API scraper for business entity data.
@@ -45,15 +50,21 @@ class DataAxleScraper(BaseScraper):
     and normalizes it to the Chronos CorporateEntity model.
     """
     
-    def __init__(self, client: AsyncClient):
+    provider = "data_axle"
+
+    def __init__(self, client: Optional[AsyncClient] = None, use_cache: bool = True):
         """
         Initialize the Data Axle scraper.
         
         Args:
             client: AsyncClient configured with Data Axle API credentials
+                (defaults to the shared "data_axle" pool)
+            use_cache: Whether to use the shared response cache (defaults to True)
         """
-        self.client = client
+        self._client = client
+        self.use_cache = use_cache
     
+    @coalesce("data_axle")
     async def search(self, name: str, state: Optional[str] = None) -> List[CorporateEntity]:
         """
         Search for business entities by name and optional state.
@@ -87,16 +98,16 @@ class DataAxleScraper(BaseScraper):
         
         try:
             # Try the places search endpoint with JSON body as recommended
-            response = await self.client.post("/places/search", json=json_data)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._fetch_json(
+                "POST", "/places/search", json=json_data, negative_if=_no_documents
+            )
             
             # Check if we have documents in the response
             if not data or "documents" not in data or not data["documents"]:
                 # Try alternative search with URL params
-                response = await self.client.get("/places/search", params=params)
-                response.raise_for_status()
-                data = response.json()
+                data = await self._fetch_json(
+                    "GET", "/places/search", params=params, negative_if=_no_documents
+                )
                 
                 if not data or "documents" not in data or not data["documents"]:
                     logger.info(f"No results found for '{name}' in {state or 'all states'}")
@@ -123,9 +134,7 @@ class DataAxleScraper(BaseScraper):
         """
         try:
             # First try with the places endpoint
-            response = await self.client.get(f"/places/{business_id}")
-            response.raise_for_status()
-            data = response.json()
+            data = await self._fetch_json("GET", f"/places/{business_id}")
             
             if not data:
                 logger.info(f"No business found with ID '{business_id}'")
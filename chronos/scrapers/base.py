@@ -5,14 +5,26 @@ chronos.scrapers.base
 Shared abstract base class for all Secretary‑of‑State scrapers.
 
 Concrete subclasses must implement `.fetch(name: str) -> CorporateEntity | None`.
+
+API scrapers get their pooled ``httpx`` client from the process‑wide
+registry in :mod:`chronos.http` (one long‑lived client per provider), or
+from an explicitly injected client.  ``_fetch_json`` reads through the
+shared response cache in :mod:`chronos.cache`, namespaced by provider.
 """
 
 __all__ = ["SoSScraper", "BaseScraper"]
 
 from abc import ABC, abstractmethod
+from typing import Any, Callable, ClassVar, Dict, Optional
+
+import httpx
+
+from chronos.cache import cache, cache_key
+from chronos.http import pools
 from chronos.models import CorporateEntity
 from chronos.settings import SCRAPER_TIMEOUT, SCRAPER_USER_AGENT
 
+
 class BaseScraper(ABC):
     """
     Abstract base for all scrapers.
@@ -25,6 +37,56 @@ class BaseScraper(ABC):
         self.timeout = SCRAPER_TIMEOUT
         self.user_agent = SCRAPER_USER_AGENT
 
+    #: Provider name in :data:`chronos.http.pools`
+    provider: ClassVar[str] = ""
+    _client: Optional[httpx.AsyncClient] = None
+    #: Read through / write to :data:`chronos.cache.cache`
+    use_cache: bool = True
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Injected client, else the provider's shared pooled client."""
+        return self._client or pools.get(self.provider)
+
+    async def _fetch_json(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        store_if: Optional[Callable[[Any], bool]] = None,
+        negative_if: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Send a request and return the decoded JSON body, cached per provider.
+
+        The cache key is the method, URL, params and body (secrets such as
+        ``api_token`` excluded).  Stale entries are served while being
+        revalidated in the background.  ``store_if`` can veto caching a
+        response, e.g. a "still processing" answer; ``negative_if`` marks
+        an empty answer for the short negative TTL.  HTTP errors propagate
+        when there is nothing cached to serve.
+        """
+
+        async def fetch() -> Any:
+            response = await self.http.request(
+                method, url, params=params, json=json, headers=headers
+            )
+            response.raise_for_status()
+            return response.json()
+
+        if not self.use_cache:
+            return await fetch()
+        return await cache.get_or_fetch(
+            self.provider,
+            cache_key(method, url, params or {}, json),
+            fetch,
+            store_if=store_if,
+            negative_if=negative_if,
+        )
+
 class SoSScraper(BaseScraper):
     """
     Abstract base for secretary-of-state scrapers.
@@ -10,13 +10,16 @@ It normalizes the response data to match Chronos' internal data model.
 """
 
 import os
+import asyncio
 import logging
 import datetime
-import requests
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import httpx
 
 from chronos.models import CorporateEntity, Status
-from chronos.settings import settings
+from chronos.settings import COBALT_POLL_INTERVAL, COBALT_POLL_TIMEOUT, settings
+from chronos.singleflight import coalesce
 from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
@@ -45,6 +48,13 @@ STATUS_MAP = {
 DEFAULT_STATUS = Status.ACTIVE
 
 
+class CobaltPage(NamedTuple):
+    """One ``/search`` answer: parsed entities, or the ``retryId`` to poll."""
+
+    entities: List[CorporateEntity]
+    retry_id: Optional[str] = None
+
+
 class CobaltScraper(BaseScraper):
     """
     Cobalt Intelligence API scraper for business entity data.
@@ -53,17 +63,32 @@ class CobaltScraper(BaseScraper):
     and normalizes it to the Chronos CorporateEntity model.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    provider = "cobalt"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        use_cache: bool = True,
+    ):
         """
         Initialize the Cobalt Intelligence scraper.
         
         Args:
             api_key: Optional API key for Cobalt Intelligence API
+            base_url: Optional API base URL (defaults to settings.cobalt_base)
+            client: Optional AsyncClient (defaults to the shared "cobalt" pool)
+            use_cache: Whether to use the shared response cache (defaults to True)
         """
         self.api_key = api_key or API_KEY
+        self.base_url = (base_url or BASE_URL).rstrip("/")
+        self._client = client
+        self.use_cache = use_cache
         if not self.api_key:
             logger.warning("No Cobalt Intelligence API key provided. Set COBALT_API_KEY environment variable.")
     
+    @coalesce("cobalt")
     async def search(
         self, 
         name: Optional[str] = None, 
@@ -98,82 +123,164 @@ class CobaltScraper(BaseScraper):
             
         Returns:
             List of CorporateEntity objects matching the search criteria
+            (empty while a live search is still running – see search_page)
         """
         try:
-            # Prepare request headers
-            headers = {
-                "x-api-key": self.api_key,
-                "Accept": "application/json"
-            }
-            
-            # Prepare search parameters
-            params = {}
-            
-            # Add main search parameter (at least one is required)
-            if name:
-                params["searchQuery"] = name
-            elif sos_id:
-                params["sosId"] = sos_id
-            elif person_first_name and person_last_name:
-                params["searchByPersonFirstName"] = person_first_name
-                params["searchByPersonLastName"] = person_last_name
-            elif retry_id:
-                params["retryId"] = retry_id
-            else:
-                raise ValueError("Either name, sos_id, person name, or retry_id must be provided")
-            
-            # Add state filter if provided (required unless using retry_id)
-            if state:
-                params["state"] = state
-            elif not retry_id:
-                raise ValueError("State is required unless using retry_id")
-                
-            # Add optional filters
-            if street:
-                params["street"] = street
-            if city:
-                params["city"] = city
-            if zip_code:
-                params["zip"] = zip_code
-                
-            # Add data configuration options
-            params["liveData"] = str(live_data).lower()
-            if include_screenshot:
-                params["screenshot"] = "true"
-            if include_ucc_data:
-                params["uccData"] = "true"
-            
-            # Make the API call synchronously (can be updated to async)
-            search_type = name or sos_id or f"{person_first_name} {person_last_name}" or retry_id
-            logger.info(f"Searching Cobalt Intelligence for '{search_type}' in {state or 'based on retry_id'}")
-            response = requests.get(
-                f"{BASE_URL}/search", 
-                headers=headers,
-                params=params
+            page = await self.search_page(
+                name=name,
+                state=state,
+                sos_id=sos_id,
+                person_first_name=person_first_name,
+                person_last_name=person_last_name,
+                retry_id=retry_id,
+                street=street,
+                city=city,
+                zip_code=zip_code,
+                live_data=live_data,
+                include_screenshot=include_screenshot,
+                include_ucc_data=include_ucc_data,
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Check if we have results
-            if not data or "results" not in data:
-                logger.info(f"No results found for '{name}' in {state or 'all states'}")
-                return []
-            
-            # Parse results into CorporateEntity objects
-            entities = []
-            results = data.get("results", [])
-            
-            for result in results:
-                entity = self._parse_search_result(result)
-                if entity:
-                    entities.append(entity)
-            
-            logger.info(f"Found {len(entities)} entities matching '{name}' in {state or 'all states'}")
-            return entities
-            
+            return page.entities
         except Exception as e:
             logger.error(f"Error searching Cobalt Intelligence API: {e}")
             return []
+
+    async def search_page(
+        self,
+        name: Optional[str] = None,
+        state: Optional[str] = None,
+        sos_id: Optional[str] = None,
+        person_first_name: Optional[str] = None,
+        person_last_name: Optional[str] = None,
+        retry_id: Optional[str] = None,
+        street: Optional[str] = None,
+        city: Optional[str] = None,
+        zip_code: Optional[str] = None,
+        live_data: bool = True,
+        include_screenshot: bool = False,
+        include_ucc_data: bool = False
+    ) -> CobaltPage:
+        """
+        One call to ``/search``; same arguments as :meth:`search`.
+
+        Live searches that Cobalt has not finished yet come back without
+        results but with a ``retryId``, returned here as ``page.retry_id``
+        (``None`` once the answer is final).  Errors propagate.
+        """
+        # Prepare request headers
+        headers = {
+            "x-api-key": self.api_key,
+            "Accept": "application/json"
+        }
+        
+        # Prepare search parameters
+        params = {}
+        
+        # Add main search parameter (at least one is required)
+        if name:
+            params["searchQuery"] = name
+        elif sos_id:
+            params["sosId"] = sos_id
+        elif person_first_name and person_last_name:
+            params["searchByPersonFirstName"] = person_first_name
+            params["searchByPersonLastName"] = person_last_name
+        elif retry_id:
+            params["retryId"] = retry_id
+        else:
+            raise ValueError("Either name, sos_id, person name, or retry_id must be provided")
+        
+        # Add state filter if provided (required unless using retry_id)
+        if state:
+            params["state"] = state
+        elif not retry_id:
+            raise ValueError("State is required unless using retry_id")
+            
+        # Add optional filters
+        if street:
+            params["street"] = street
+        if city:
+            params["city"] = city
+        if zip_code:
+            params["zip"] = zip_code
+            
+        # Add data configuration options
+        params["liveData"] = str(live_data).lower()
+        if include_screenshot:
+            params["screenshot"] = "true"
+        if include_ucc_data:
+            params["uccData"] = "true"
+        
+        # Non-blocking call on the shared connection pool
+        search_type = name or sos_id or f"{person_first_name} {person_last_name}" or retry_id
+        logger.info(f"Searching Cobalt Intelligence for '{search_type}' in {state or 'based on retry_id'}")
+        data = await self._fetch_json(
+            "GET",
+            f"{self.base_url}/search", 
+            headers=headers,
+            params=params,
+            # Don't cache "still processing" answers; remember empty ones briefly
+            store_if=lambda d: not (d or {}).get("retryId"),
+            negative_if=lambda d: not (d or {}).get("results"),
+        )
+        
+        # Check if we have results
+        if not data or "results" not in data:
+            pending = (data or {}).get("retryId")
+            if pending:
+                logger.info(f"Cobalt search for '{search_type}' still running (retryId {pending})")
+            else:
+                logger.info(f"No results found for '{name}' in {state or 'all states'}")
+            return CobaltPage([], pending)
+        
+        # Parse results into CorporateEntity objects
+        entities = []
+        results = data.get("results", [])
+        
+        for result in results:
+            entity = self._parse_search_result(result)
+            if entity:
+                entities.append(entity)
+        
+        logger.info(f"Found {len(entities)} entities matching '{name}' in {state or 'all states'}")
+        return CobaltPage(entities)
+
+    async def search_until_complete(
+        self,
+        *,
+        poll_interval: float = COBALT_POLL_INTERVAL,
+        max_wait: float = COBALT_POLL_TIMEOUT,
+        on_pending: Optional[Callable[[str, int], None]] = None,
+        **kwargs: Any,
+    ) -> List[CorporateEntity]:
+        """
+        :meth:`search_page`, following ``retryId`` until the answer is final.
+
+        Polls back off from *poll_interval* (×1.5 per attempt, at most
+        15 s); ``on_pending(retry_id, polls)`` is called before each wait.
+        Raises ``TimeoutError`` after *max_wait* seconds, naming the last
+        ``retryId`` so the search can still be resumed by hand.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        page = await self.search_page(**kwargs)
+        polls, delay = 0, poll_interval
+        while page.retry_id:
+            polls += 1
+            if on_pending is not None:
+                on_pending(page.retry_id, polls)
+            if loop.time() + delay > deadline:
+                raise TimeoutError(
+                    f"Cobalt search still running after {max_wait:.0f}s (retryId {page.retry_id})"
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 15.0)
+            page = await self.search_page(
+                retry_id=page.retry_id,
+                live_data=kwargs.get("live_data", True),
+                include_screenshot=kwargs.get("include_screenshot", False),
+                include_ucc_data=kwargs.get("include_ucc_data", False),
+            )
+        return page.entities
     
     async def get_details(self, name: str, state: str) -> Optional[CorporateEntity]:
         """
@@ -195,15 +302,13 @@ class CobaltScraper(BaseScraper):
             
             # Make the API call
             logger.info(f"Fetching details for '{name}' in {state}")
-            url = f"{BASE_URL}/business-details"
+            url = f"{self.base_url}/business-details"
             params = {
                 "businessName": name,
                 "state": state
             }
             
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._fetch_json("GET", url, headers=headers, params=params)
             
             # Parse the business details into a CorporateEntity
             if data:
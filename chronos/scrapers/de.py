@@ -8,6 +8,9 @@ For classroom use we avoid the live captcha by parsing a static HTML file
 saved at ``static-assets/demo_de.html``.  The scraper exposes a single
 ``fetch(name)`` method that returns a :class:`chronos.models.CorporateEntity`
 or ``None`` if the company is not found in the demo file.
+
+The file is parsed once into a process‑wide :class:`StaticIndex` and only
+re‑parsed when its mtime changes.
 """
 
 from __future__ import annotations
@@ -15,11 +18,9 @@ from __future__ import annotations
 from datetime import date
 from pathlib import Path
 
-from bs4 import BeautifulSoup
-
 from chronos.models import CorporateEntity, Status
-from chronos.settings import SCRAPER_TIMEOUT, SCRAPER_USER_AGENT
 from .base import SoSScraper
+from .static_index import StaticIndex, html_table_rows
 
 # Try to find the HTML next to where the app is launched (project root during dev)
 _CWD_DEMO = Path("static-assets/demo_de.html")
@@ -29,6 +30,9 @@ else:
     # Fallback: resolve two levels up from this file ( …/chronos/ → project root )
     _DEMO_HTML = Path(__file__).resolve().parents[2] / "static-assets" / "demo_de.html"
 
+# Shared by every DelawareScraper instance (the API builds one per request)
+_INDEX: StaticIndex[list] = StaticIndex(_DEMO_HTML, html_table_rows)
+
 
 class DelawareScraper(SoSScraper):
     """Minimal parser against the demo HTML file."""
@@ -40,9 +44,9 @@ class DelawareScraper(SoSScraper):
     # ------------------------------------------------------------------
     def fetch(self, name: str) -> CorporateEntity | None:
         """
-        Return a :class:`~chronos.models.CorporateEntity` whose table‑row text
-        contains *name* (case‑insensitive).  The demo HTML must include a
-        `<tr>` like::
+        Return a :class:`~chronos.models.CorporateEntity` whose entity name
+        matches *name* (case‑insensitive; exact, then prefix, then substring).
+        The demo HTML must include a `<tr>` like::
 
             <tr>
               <td>Foo LLC</td>
@@ -53,38 +57,16 @@ class DelawareScraper(SoSScraper):
 
         ``None`` is returned if no matching row is found.
         """
-        if not _DEMO_HTML.exists():
+        if not _INDEX.path.exists():
             raise RuntimeError(
-                f"Demo HTML not found at {_DEMO_HTML!s} — "
+                f"Demo HTML not found at {_INDEX.path!s} — "
                 "the real DE site requires a captcha."
             )
 
-        html = _DEMO_HTML.read_text(encoding="utf‑8", errors="ignore")
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Normalise whitespace for robust matching
-        def _norm(text: str) -> str:
-            return " ".join(text.lower().split())  # collapse all whitespace
-
-        q_norm = _norm(name)
-
-        # DEBUG: show all rows for troubleshooting
-        print("DEBUG rows seen by scraper ->", [
-            _norm(tr.get_text(" ", strip=True)) for tr in soup.find_all("tr")
-        ])
-        row = next(
-            (
-                tr
-                for tr in soup.find_all("tr")
-                if q_norm in _norm(tr.get_text(" ", strip=True))
-            ),
-            None,
-        )
-        if row is None:
+        cells = _INDEX.lookup(name)
+        if cells is None:
             return None
 
-        cells = [td.get_text(strip=True) for td in row.find_all("td")]
-
         # Expected order: [Entity Name, File No, Date Formed, Status, ...]
         try:
             formed = date.fromisoformat(cells[2].replace("/", "-"))
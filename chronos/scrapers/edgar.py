@@ -13,8 +13,13 @@ This version uses the new SEC EDGAR Search API v2 endpoints and async HTTP clien
 
 Usage:
 ------
-edgar = EdgarClient(client)  # client is an httpx.AsyncClient
+edgar = EdgarClient()  # or EdgarClient(client) with your own httpx.AsyncClient
 filing_info = await edgar.enrich_entity(entity)  # Adds SEC info to entity.notes
+report = await edgar.enrich_many(entities, concurrency=8)  # batch, deduped lookups
+
+Enrich the whole stored portfolio (one bulk write at the end)::
+
+    python -m chronos.scrapers.edgar --enrich-portfolio --concurrency 8
 """
 
 from __future__ import annotations
@@ -23,27 +28,80 @@ import os
 import re
 import json
 import logging
-import sqlite3
 import time
 import asyncio
-from datetime import date, datetime, timedelta
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, cast
+import argparse
+import sys
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 from httpx import AsyncClient, Response
 
+from chronos.cache import cache
+from chronos.cik_index import CIKIndex, cik_index
+from chronos.http import pools
 from chronos.models import CorporateEntity
+from chronos.singleflight import coalesce
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Cache setup
-CACHE_DB_PATH = Path(os.environ.get("CHRONOS_CACHE_DIR", ".")) / "chronos_cache.db"
-CACHE_DURATION = timedelta(hours=24)
-
 # Common SEC form types of interest
 FORM_TYPES = ['10-K', '10-Q', '8-K', 'S-1', 'S-3', 'S-4', '13F']
 
+# Filings listed in an enriched entity's notes
+ENRICH_FORM_TYPES = ["10-K", "10-Q", "8-K"]
+ENRICH_FILINGS_LIMIT = 5
+# Marks the start of the SEC block in entity.notes (replaced on re-enrichment)
+SEC_NOTES_MARKER = "SEC CIK: "
+
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass
+class EnrichmentReport:
+    """Outcome of :meth:`EdgarClient.enrich_many`."""
+
+    total: int = 0           # entities passed in
+    unique_names: int = 0    # distinct CIK lookups performed
+    unique_ciks: int = 0     # distinct filings lookups performed
+    matched: int = 0         # entities with a CIK and filings (notes updated)
+    failed: int = 0          # lookups that raised
+    written: int = 0         # rows written back by enrich_portfolio
+    elapsed: float = 0.0
+
+
+def apply_sec_notes(
+    entity: CorporateEntity, cik: str, filings: List[Dict[str, Any]]
+) -> CorporateEntity:
+    """
+    Record *cik* and *filings* in ``entity.notes`` (and ``entity.metadata``).
+
+    A previous SEC block is replaced, so enriching twice does not
+    duplicate it.
+    """
+    if not hasattr(entity, "metadata"):
+        entity.metadata = {}
+    entity.metadata["sec_cik"] = cik
+    
+    # Add SEC information to entity notes
+    sec_notes = [f"{SEC_NOTES_MARKER}{cik}"]
+    
+    if filings:
+        sec_notes.append("\nLatest SEC Filings:")
+        for filing in filings:
+            form_type = filing.get("form", "Unknown")
+            filing_date = filing.get("filingDate", "Unknown")
+            filing_url = filing.get("fileUrl", "")
+            
+            sec_notes.append(f"- {form_type} ({filing_date}): {filing_url}")
+    
+    # Update entity notes, dropping an earlier SEC block
+    notes = (entity.notes or "").split(SEC_NOTES_MARKER, 1)[0].rstrip()
+    entity.notes = (notes + "\n\n" if notes else "") + "\n".join(sec_notes)
+    return entity
+
 
 class EdgarClient:
     """
@@ -53,107 +111,64 @@ class EdgarClient:
     and get information about recent filings.
     """
     
-    def __init__(self, client: AsyncClient, use_cache: bool = True, enabled: bool = True):
+    def __init__(
+        self,
+        client: Optional[AsyncClient] = None,
+        use_cache: bool = True,
+        enabled: bool = True,
+        index: Optional[CIKIndex] = None,
+    ):
         """
         Initialize the EDGAR client.
         
         Args:
             client: AsyncClient configured with SEC EDGAR API headers
+                (defaults to the shared "edgar" pool from chronos.http)
             use_cache: Whether to cache API responses (defaults to True)
             enabled: Whether the EDGAR integration is enabled
+            index: Offline CIK index consulted before the search API
+                (defaults to the shared index from chronos.cik_index)
         """
-        self.client = client
+        self._client = client
         self.use_cache = use_cache
         self.enabled = enabled
-        self._cik_cache: Dict[str, str] = {}  # In-memory CIK lookup cache
-        
-        # Setup database cache if needed
-        if self.use_cache:
-            self._setup_cache_if_needed()
-        
-    def _setup_cache_if_needed(self) -> None:
-        """Create the cache database and tables if they don't exist."""
-        if not CACHE_DB_PATH.parent.exists():
-            CACHE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-            
-        conn = sqlite3.connect(str(CACHE_DB_PATH))
-        cursor = conn.cursor()
+        self.index = index or cik_index
         
-        # Create cache table if it doesn't exist
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS edgar_cache (
-            query TEXT,
-            response TEXT,
-            timestamp TIMESTAMP,
-            PRIMARY KEY (query)
-        )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        
-    def _get_cached_response(self, query: str) -> Optional[Dict]:
+    @property
+    def client(self) -> AsyncClient:
+        """Injected client, else the process‑wide pooled EDGAR client."""
+        return self._client or pools.get("edgar")
+
+    async def _get_json(
+        self,
+        cache_key: str,
+        path: str,
+        params: Dict[str, Any],
+        negative_if: Optional[Callable[[Any], bool]] = None,
+    ) -> Dict[str, Any]:
         """
-        Retrieve a cached response if it exists and is not expired.
+        GET *path* and return the JSON body through the shared response cache.
+        
+        Stale entries are returned at once and refreshed in the background;
+        empty answers (``negative_if``) are kept for the short negative TTL.
         
         Args:
-            query: The search query or CIK
+            cache_key: Key within the "edgar" cache namespace
+            path: API path relative to the EDGAR base URL
+            params: Query parameters
+            negative_if: Predicate marking a response as "no results"
             
         Returns:
-            The cached response as a dict, or None if not found or expired
-        """
-        if not self.use_cache:
-            return None
-            
-        conn = sqlite3.connect(str(CACHE_DB_PATH))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-        SELECT response, timestamp FROM edgar_cache
-        WHERE query = ?
-        ''', (query,))
-        
-        result = cursor.fetchone()
-        conn.close()
-        
-        if not result:
-            return None
-            
-        response_str, timestamp_str = result
-        timestamp = datetime.fromisoformat(timestamp_str)
-        
-        # Check if cache entry is expired
-        if datetime.now() - timestamp > CACHE_DURATION:
-            return None
-            
-        return json.loads(response_str)
-        
-    def _cache_response(self, query: str, response: Dict) -> None:
-        """
-        Cache an API response.
-        
-        Args:
-            query: The search query or CIK
-            response: The API response to cache
+            The decoded response; HTTP errors propagate when nothing is cached
         """
+        async def fetch() -> Dict[str, Any]:
+            response = await self.client.get(path, params=params)
+            response.raise_for_status()
+            return response.json()
+
         if not self.use_cache:
-            return
-            
-        conn = sqlite3.connect(str(CACHE_DB_PATH))
-        cursor = conn.cursor()
-        
-        # Store with current timestamp
-        timestamp = datetime.now().isoformat()
-        response_str = json.dumps(response)
-        
-        cursor.execute('''
-        INSERT OR REPLACE INTO edgar_cache
-        (query, response, timestamp)
-        VALUES (?, ?, ?)
-        ''', (query, response_str, timestamp))
-        
-        conn.commit()
-        conn.close()
+            return await fetch()
+        return await cache.get_or_fetch("edgar", cache_key, fetch, negative_if=negative_if)
         
     async def search_companies(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -164,48 +179,41 @@ class EdgarClient:
             limit: Maximum number of results to return
             
         Returns:
-            List of company information dictionaries
+            List of company information dictionaries (empty on errors)
         """
         if not self.enabled:
             logger.info("EDGAR integration is disabled")
             return []
             
-        # Check cache first
-        cache_key = f"edgar_search_{query}_{limit}"
-        cached = self._get_cached_response(cache_key)
-        
-        if cached:
-            logger.info(f"Using cached EDGAR search results for '{query}'")
-            return cached.get("hits", {}).get("hits", [])
-            
-        # Add delay to respect SEC rate limits (10 req/sec)
-        await self._respect_rate_limit()
-        
+        try:
+            return await self._search_companies(query, limit)
+        except Exception as e:
+            logger.error(f"Error searching companies in EDGAR API: {e}")
+            return []
+
+    @coalesce("edgar", query="query", jurisdiction=None)
+    async def _search_companies(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """:meth:`search_companies` that lets request errors propagate."""
         params = {
             "keys": query,
             "limit": str(limit)
         }
         
-        try:
-            response = await self.client.get("/search-index", params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Cache the response
-            self._cache_response(cache_key, data)
-            
-            # Extract company information from the response
-            results = []
-            if "hits" in data and "hits" in data["hits"]:
-                for hit in data["hits"]["hits"][:limit]:
-                    if "_source" in hit:
-                        results.append(hit["_source"])
-            
-            return results
+        data = await self._get_json(
+            f"edgar_search_{query}_{limit}",
+            "/search-index",
+            params,
+            negative_if=lambda d: not d.get("hits", {}).get("hits"),
+        )
         
-        except Exception as e:
-            logger.error(f"Error searching companies in EDGAR API: {e}")
-            return []
+        # Extract company information from the response
+        results = []
+        if "hits" in data and "hits" in data["hits"]:
+            for hit in data["hits"]["hits"][:limit]:
+                if "_source" in hit:
+                    results.append(hit["_source"])
+        
+        return results
     
     async def get_company_filings(
         self, 
@@ -222,29 +230,32 @@ class EdgarClient:
             limit: Maximum number of results to return
             
         Returns:
-            List of filing information dictionaries
+            List of filing information dictionaries (empty on errors)
         """
         if not self.enabled:
             logger.info("EDGAR integration is disabled")
             return []
             
+        try:
+            return await self._company_filings(cik, form_types, limit)
+        except Exception as e:
+            logger.error(f"Error getting company filings from EDGAR API v2: {e}")
+            return []
+
+    @coalesce("edgar", query="cik", jurisdiction=None)
+    async def _company_filings(
+        self,
+        cik: str,
+        form_types: Optional[List[str]] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """:meth:`get_company_filings` that lets request errors propagate."""
         # Normalize CIK by removing leading zeros
-        cik_normalized = cik.strip("0")
+        cik_normalized = cik.lstrip("0")
         if not cik_normalized.isdigit():
             logger.error(f"Invalid CIK format: {cik}")
             return []
         
-        # Check cache first
-        cache_key = f"v2_filings_{cik_normalized}_{'-'.join(form_types or [])}_{limit}"
-        cached = self._get_cached_response(cache_key)
-        
-        if cached:
-            logger.info(f"Using cached EDGAR filings for CIK '{cik_normalized}'")
-            return cached.get("data", {}).get("hits", [])
-        
-        # Add delay to respect SEC rate limits (10 req/sec)
-        await self._respect_rate_limit()
-        
         params: Dict[str, Any] = {
             "ciks": cik_normalized,
             "limit": str(limit)
@@ -253,24 +264,21 @@ class EdgarClient:
         if form_types:
             params["forms"] = ",".join(form_types)
         
-        try:
-            response = await self.client.get("/filings", params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Cache the response
-            self._cache_response(cache_key, data)
-            
-            return data.get("data", {}).get("hits", [])
-        
-        except Exception as e:
-            logger.error(f"Error getting company filings from EDGAR API v2: {e}")
-            return []
+        data = await self._get_json(
+            f"v2_filings_{cik_normalized}_{'-'.join(form_types or [])}_{limit}",
+            "/filings",
+            params,
+            negative_if=lambda d: not d.get("data", {}).get("hits"),
+        )
+        return data.get("data", {}).get("hits", [])
     
     async def get_company_cik(self, company_name: str) -> Optional[str]:
         """
         Get a company's CIK by name.
         
+        The offline CIK index answers most names without a network call;
+        the EDGAR search API is only used for names it does not know.
+        
         Args:
             company_name: Company name to search for
             
@@ -281,24 +289,27 @@ class EdgarClient:
             logger.info("EDGAR integration is disabled")
             return None
             
-        # Check in-memory cache first
-        if company_name.lower() in self._cik_cache:
-            return self._cik_cache[company_name.lower()]
+        try:
+            return await self._company_cik(company_name)
+        except Exception as e:
+            logger.error(f"Error searching companies in EDGAR API: {e}")
+            return None
+
+    async def _company_cik(self, company_name: str) -> Optional[str]:
+        """:meth:`get_company_cik` that lets request errors propagate."""
+        cik = self.index.cik_for(company_name)
+        if cik:
+            return cik
         
-        # Search for the company
-        companies = await self.search_companies(company_name, limit=1)
+        # Fall back to the search API (responses go through the shared cache)
+        companies = await self._search_companies(company_name, limit=1)
         if not companies:
             logger.info(f"No company found in EDGAR for '{company_name}'")
             return None
         
         # Extract CIK from the first match
         cik = companies[0].get("cik")
-        if cik:
-            # Cache for future lookups
-            self._cik_cache[company_name.lower()] = cik
-            return cik
-        
-        return None
+        return cik or None
     
     async def enrich_entity(self, entity: CorporateEntity) -> CorporateEntity:
         """
@@ -318,43 +329,153 @@ class EdgarClient:
         
         try:
             # Get company CIK
-            cik = await self.get_company_cik(entity.name)
+            cik = await self._company_cik(entity.name)
             if not cik:
                 logger.info(f"No CIK found for '{entity.name}'")
                 return entity
             
-            # Store CIK in entity metadata
-            if not hasattr(entity, "metadata"):
-                entity.metadata = {}
-            entity.metadata["sec_cik"] = cik
-            
-            # Get recent filings
-            filings = await self.get_company_filings(cik, form_types=["10-K", "10-Q", "8-K"], limit=5)
-            
-            # Add SEC information to entity notes
-            sec_notes = [f"SEC CIK: {cik}"]
-            
-            if filings:
-                sec_notes.append("\nLatest SEC Filings:")
-                for filing in filings:
-                    form_type = filing.get("form", "Unknown")
-                    filing_date = filing.get("filingDate", "Unknown")
-                    filing_url = filing.get("fileUrl", "")
-                    
-                    sec_notes.append(f"- {form_type} ({filing_date}): {filing_url}")
-            
-            # Update entity notes
-            if entity.notes:
-                entity.notes += "\n\n" + "\n".join(sec_notes)
-            else:
-                entity.notes = "\n".join(sec_notes)
-            
-            return entity
+            # Get recent filings (a failed lookup leaves the notes alone)
+            filings = await self._company_filings(
+                cik, form_types=ENRICH_FORM_TYPES, limit=ENRICH_FILINGS_LIMIT
+            )
+            return apply_sec_notes(entity, cik, filings)
             
         except Exception as e:
             logger.error(f"Error enriching entity with SEC data: {e}")
             return entity
+
+    async def enrich_many(
+        self,
+        entities: List[CorporateEntity],
+        concurrency: int = 8,
+        progress: Optional[ProgressCallback] = None,
+    ) -> EnrichmentReport:
+        """
+        Enrich many entities in place, concurrently.
+        
+        CIK lookups are deduplicated by (case‑insensitive) name and filings
+        lookups by CIK, then fanned out with at most *concurrency* requests
+        in flight.  Throughput is bounded by the "edgar" rate limiter in
+        :mod:`chronos.http`, not by per‑call sleeps.
+        
+        Args:
+            entities: Entities to enrich (modified in place)
+            concurrency: Maximum concurrent lookups
+            progress: Optional ``callback(done, total)`` over all lookups
+            
+        Returns:
+            EnrichmentReport with counts and elapsed time
+        """
+        start = time.perf_counter()
+        report = EnrichmentReport(total=len(entities))
+        if not self.enabled or not entities:
+            return report
+            
+        names: Dict[str, str] = {}  # normalised → first spelling seen
+        for e in entities:
+            names.setdefault(" ".join(e.name.lower().split()), e.name)
+        report.unique_names = len(names)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        done = 0
+        total = len(names)  # grows once the CIKs are known
+        
+        async def bounded(coro_fn, *args):
+            nonlocal done
+            async with semaphore:
+                try:
+                    return await coro_fn(*args)
+                except Exception as e:
+                    report.failed += 1
+                    logger.error(f"EDGAR lookup failed for {args[0]!r}: {e}")
+                    return None
+                finally:
+                    done += 1
+                    if progress:
+                        progress(done, total)
+        
+        ciks = dict(zip(
+            names,
+            await asyncio.gather(*(bounded(self._company_cik, n) for n in names.values())),
+        ))
+        unique_ciks = {c for c in ciks.values() if c}
+        report.unique_ciks = len(unique_ciks)
+        total += len(unique_ciks)
+        
+        async def filings_for(cik: str) -> List[Dict[str, Any]]:
+            return await self._company_filings(
+                cik, form_types=ENRICH_FORM_TYPES, limit=ENRICH_FILINGS_LIMIT
+            )
+        
+        filings = dict(zip(
+            unique_ciks,
+            await asyncio.gather(*(bounded(filings_for, c) for c in unique_ciks)),
+        ))
+        
+        for entity in entities:
+            cik = ciks.get(" ".join(entity.name.lower().split()))
+            # None: the filings lookup failed – keep the stored SEC block
+            if cik and filings.get(cik) is not None:
+                apply_sec_notes(entity, cik, filings[cik])
+                report.matched += 1
+        
+        report.elapsed = time.perf_counter() - start
+        return report
+
+
+async def enrich_portfolio(
+    portfolio=None,
+    client: Optional[EdgarClient] = None,
+    concurrency: int = 8,
+    progress: Optional[ProgressCallback] = None,
+) -> EnrichmentReport:
+    """
+    Enrich every stored entity and write the matches back in one transaction.
+    
+    Args:
+        portfolio: DBPortfolioManager (defaults to one on the global engine)
+        client: EdgarClient (defaults to the pooled one)
+        concurrency: Maximum concurrent EDGAR lookups
+        progress: Optional ``callback(done, total)``
+        
+    Returns:
+        EnrichmentReport, with ``written`` rows updated
+    """
+    from chronos.portfolio_db import DBPortfolioManager  # keep the scraper import light
     
-    async def _respect_rate_limit(self):
-        """Add a small delay to respect SEC's rate limit of 10 req/s."""
-        await asyncio.sleep(0.1)
\ No newline at end of file
+    pm = portfolio or DBPortfolioManager()
+    entities = list(pm)
+    client = client or EdgarClient()
+    report = await client.enrich_many(entities, concurrency=concurrency, progress=progress)
+    enriched = [e for e in entities if getattr(e, "metadata", {}).get("sec_cik")]
+    report.written = pm.add_many(enriched) if enriched else 0
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chronos.scrapers.edgar")
+    parser.add_argument("--enrich-portfolio", action="store_true",
+                        help="enrich every stored entity with SEC EDGAR data")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent lookups")
+    args = parser.parse_args(argv)
+    if not args.enrich_portfolio:
+        parser.print_help()
+        return 1
+    
+    def progress(done: int, total: int) -> None:
+        print(f"\r{done}/{total} lookups", end="", file=sys.stderr, flush=True)
+    
+    async def run() -> EnrichmentReport:
+        try:
+            return await enrich_portfolio(concurrency=args.concurrency, progress=progress)
+        finally:
+            await pools.aclose()
+    
+    report = asyncio.run(run())
+    print(file=sys.stderr)
+    for field_name, value in asdict(report).items():
+        print(f"{field_name:>13}: {round(value, 2) if isinstance(value, float) else value}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -26,12 +26,13 @@ import os
 import re
 import json
 import logging
-import sqlite3
-import requests
-from datetime import date, datetime, timedelta
-from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import httpx
+
+from chronos.cache import cache, cache_key
+from chronos.http import pools
 from chronos.models import CorporateEntity, Status
 from .base import SoSScraper
 
@@ -41,7 +42,6 @@ logger = logging.getLogger(__name__)
 # API Constants
 OC_API_BASE = "https://api.opencorporates.com/v0.4"
 OC_API_TOKEN = os.environ.get("OPENCORP_API_TOKEN")
-CACHE_DURATION = timedelta(hours=24)
 
 # Mapping from OpenCorporates status to Chronos Status enum
 STATUS_MAPPING = {
@@ -56,9 +56,6 @@ STATUS_MAPPING = {
     "active": Status.ACTIVE,
 }
 
-# Cache setup
-CACHE_DB_PATH = Path(os.environ.get("CHRONOS_CACHE_DIR", ".")) / "chronos_cache.db"
-
 
 class OpenCorporatesScraper(SoSScraper):
     """
@@ -68,129 +65,47 @@ class OpenCorporatesScraper(SoSScraper):
     by OpenCorporates, with optional caching to reduce API calls.
     """
     
-    def __init__(self, use_cache: bool = True):
+    def __init__(self, use_cache: bool = True, client: Optional[httpx.Client] = None):
         """
         Initialize the OpenCorporates scraper.
         
         Args:
             use_cache: Whether to cache API responses (defaults to True)
+            client: Optional blocking httpx.Client (defaults to the shared
+                "opencorporates" pool)
         """
         self.use_cache = use_cache
-        self._setup_cache_if_needed()
-        
-    def _setup_cache_if_needed(self) -> None:
-        """Create the cache database and tables if they don't exist."""
-        if not self.use_cache:
-            return
-            
-        if not CACHE_DB_PATH.parent.exists():
-            CACHE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-            
-        conn = sqlite3.connect(str(CACHE_DB_PATH))
-        cursor = conn.cursor()
-        
-        # Create cache tables if they don't exist
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS oc_search_cache (
-            query TEXT,
-            jurisdiction TEXT,
-            response TEXT,
-            timestamp TIMESTAMP,
-            PRIMARY KEY (query, jurisdiction)
-        )
-        ''')
-        
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS oc_entity_cache (
-            company_number TEXT,
-            jurisdiction TEXT,
-            response TEXT,
-            timestamp TIMESTAMP,
-            PRIMARY KEY (company_number, jurisdiction)
-        )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        
-    def _get_cached_response(self, cache_type: str, key1: str, key2: str = '') -> Optional[Dict]:
+        self._client = client
+        
+    def _cached(
+        self,
+        cache_type: str,
+        key1: str,
+        key2: str,
+        fetch: Callable[[], Dict],
+        negative_if: Optional[Callable[[Dict], bool]] = None,
+    ) -> Dict:
         """
-        Retrieve a cached response if it exists and is not expired.
+        Return a response through the shared cache, calling *fetch* on a miss.
+        
+        Stale entries are returned at once and refreshed on a worker thread;
+        answers matching *negative_if* are kept for the short negative TTL.
         
         Args:
             cache_type: Either 'search' or 'entity'
             key1: Query or company_number
             key2: Jurisdiction code
+            fetch: Performs the API request
+            negative_if: Predicate marking a response as "no results"
             
         Returns:
-            The cached response as a dict, or None if not found or expired
-        """
-        if not self.use_cache:
-            return None
-            
-        table = f"oc_{cache_type}_cache"
-        key_field = "query" if cache_type == "search" else "company_number"
-        
-        conn = sqlite3.connect(str(CACHE_DB_PATH))
-        cursor = conn.cursor()
-        
-        # Convert empty string to None for SQL query
-        key2_sql = key2 if key2 else None
-        
-        cursor.execute(f'''
-        SELECT response, timestamp FROM {table}
-        WHERE {key_field} = ? AND jurisdiction = ?
-        ''', (key1, key2_sql))
-        
-        result = cursor.fetchone()
-        conn.close()
-        
-        if not result:
-            return None
-            
-        response_str, timestamp_str = result
-        timestamp = datetime.fromisoformat(timestamp_str)
-        
-        # Check if cache entry is expired
-        if datetime.now() - timestamp > CACHE_DURATION:
-            return None
-            
-        return json.loads(response_str)
-        
-    def _cache_response(self, cache_type: str, key1: str, key2: str, response: Dict) -> None:
-        """
-        Cache an API response.
-        
-        Args:
-            cache_type: Either 'search' or 'entity'
-            key1: Query or company_number
-            key2: Jurisdiction code
-            response: The API response to cache
+            The (possibly cached) API response
         """
         if not self.use_cache:
-            return
-            
-        table = f"oc_{cache_type}_cache"
-        key_field = "query" if cache_type == "search" else "company_number"
-        
-        conn = sqlite3.connect(str(CACHE_DB_PATH))
-        cursor = conn.cursor()
-        
-        # Convert empty string to None for SQL storage
-        key2_sql = key2 if key2 else None
-        
-        # Store with current timestamp
-        timestamp = datetime.now().isoformat()
-        response_str = json.dumps(response)
-        
-        cursor.execute(f'''
-        INSERT OR REPLACE INTO {table}
-        ({key_field}, jurisdiction, response, timestamp)
-        VALUES (?, ?, ?, ?)
-        ''', (key1, key2_sql, response_str, timestamp))
-        
-        conn.commit()
-        conn.close()
+            return fetch()
+        return cache.get_or_fetch_sync(
+            "opencorporates", cache_key(cache_type, key1, key2), fetch, negative_if=negative_if
+        )
         
     def _make_api_request(self, endpoint: str, params: Dict = None) -> Dict:
         """
@@ -215,10 +130,11 @@ class OpenCorporatesScraper(SoSScraper):
             request_params["api_token"] = OC_API_TOKEN
             
         try:
-            response = requests.get(url, headers=headers, params=request_params, timeout=10)
+            client = self._client or pools.get_sync("opencorporates")
+            response = client.get(url, headers=headers, params=request_params, timeout=10)
             response.raise_for_status()
             return response.json()
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"OpenCorporates API error: {e}")
             raise ValueError(f"Error fetching data from OpenCorporates: {e}")
             
@@ -347,26 +263,19 @@ class OpenCorporatesScraper(SoSScraper):
             if len(jurisdiction) == 2:
                 oc_jurisdiction = f"us_{jurisdiction.lower()}"
                 
-        # Check cache first
-        cache_jurisdiction = oc_jurisdiction or ""
-        cached = self._get_cached_response("search", query, cache_jurisdiction)
-        
-        if cached:
-            logger.info(f"Using cached search results for '{query}' in jurisdiction '{jurisdiction}'")
-            results = cached
-        else:
-            # Prepare API request parameters
-            params = {"q": query}
-            if oc_jurisdiction:
-                params["jurisdiction_code"] = oc_jurisdiction
-                
-            # Make the API request
+        # Prepare API request parameters
+        params = {"q": query}
+        if oc_jurisdiction:
+            params["jurisdiction_code"] = oc_jurisdiction
+            
+        def request() -> Dict:
             logger.info(f"Searching OpenCorporates for '{query}' in jurisdiction '{jurisdiction}'")
-            response = self._make_api_request("companies/search", params)
+            return self._make_api_request("companies/search", params)
             
-            # Cache the response
-            self._cache_response("search", query, cache_jurisdiction, response)
-            results = response
+        results = self._cached(
+            "search", query, oc_jurisdiction or "", request,
+            negative_if=lambda r: not r.get("results", {}).get("companies"),
+        )
             
         # Extract companies from response
         companies = []
@@ -439,24 +348,17 @@ class OpenCorporatesScraper(SoSScraper):
         if len(jurisdiction) == 2:
             oc_jurisdiction = f"us_{jurisdiction.lower()}"
             
-        # Check cache first
-        cached = self._get_cached_response("entity", company_number, oc_jurisdiction)
+        endpoint = f"companies/{oc_jurisdiction}/{company_number}"
         
-        if cached:
-            logger.info(f"Using cached entity data for '{company_number}' in jurisdiction '{jurisdiction}'")
-            response = cached
-        else:
-            # Make the API request
-            endpoint = f"companies/{oc_jurisdiction}/{company_number}"
+        def request() -> Dict:
             logger.info(f"Fetching company '{company_number}' from jurisdiction '{jurisdiction}'")
+            return self._make_api_request(endpoint)
             
-            try:
-                response = self._make_api_request(endpoint)
-                # Cache the response
-                self._cache_response("entity", company_number, oc_jurisdiction, response)
-            except ValueError:
-                logger.error(f"Company not found: {company_number} in {jurisdiction}")
-                return None
+        try:
+            response = self._cached("entity", company_number, oc_jurisdiction, request)
+        except ValueError:
+            logger.error(f"Company not found: {company_number} in {jurisdiction}")
+            return None
                 
         # Extract company data from response
         try:
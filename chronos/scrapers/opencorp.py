@@ -12,11 +12,13 @@ It normalizes the response data to match Chronos' internal data model.
 import os
 import logging
 import datetime
-import requests
 from typing import List, Optional, Dict, Any
 
+import httpx
+
 from chronos.models import CorporateEntity, Status
 from chronos.settings import settings
+from chronos.singleflight import coalesce
 from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
@@ -51,17 +53,32 @@ class OpenCorporatesScraper(BaseScraper):
     and normalizes it to the Chronos CorporateEntity model.
     """
     
-    def __init__(self, api_token: Optional[str] = None):
+    provider = "opencorporates"
+
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        use_cache: bool = True,
+    ):
         """
         Initialize the OpenCorporates scraper.
         
         Args:
             api_token: Optional API token for OpenCorporates API
+            base_url: Optional API base URL (defaults to settings.opencorp_base)
+            client: Optional AsyncClient (defaults to the shared "opencorporates" pool)
+            use_cache: Whether to use the shared response cache (defaults to True)
         """
         self.api_token = api_token or API_TOKEN
+        self.base_url = (base_url or BASE_URL).rstrip("/")
+        self._client = client
+        self.use_cache = use_cache
         if not self.api_token:
             logger.warning("No OpenCorporates API token provided. Set OPENCORP_API_TOKEN environment variable.")
     
+    @coalesce("opencorporates")
     async def search(self, name: str, state: Optional[str] = None) -> List[CorporateEntity]:
         """
         Search for business entities by name and optional state.
@@ -87,11 +104,14 @@ class OpenCorporatesScraper(BaseScraper):
                 jurisdiction = f"us_{state.lower()}"
                 params["jurisdiction_code"] = jurisdiction
             
-            # Make the API call synchronously (can be updated to async)
+            # Non-blocking call on the shared connection pool
             logger.info(f"Searching OpenCorporates for '{name}' in {state or 'all jurisdictions'}")
-            response = requests.get(f"{BASE_URL}/companies/search", params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._fetch_json(
+                "GET",
+                f"{self.base_url}/companies/search",
+                params=params,
+                negative_if=lambda d: not (d or {}).get("results", {}).get("companies"),
+            )
             
             # Extract companies from the response
             if not data or "results" not in data or "companies" not in data["results"]:
@@ -128,10 +148,8 @@ class OpenCorporatesScraper(BaseScraper):
         try:
             # Make the API call
             logger.info(f"Fetching company with ID: {company_id} in {jurisdiction}")
-            url = f"{BASE_URL}/companies/{jurisdiction}/{company_id}"
-            response = requests.get(url, params={"api_token": self.api_token})
-            response.raise_for_status()
-            data = response.json()
+            url = f"{self.base_url}/companies/{jurisdiction}/{company_id}"
+            data = await self._fetch_json("GET", url, params={"api_token": self.api_token})
             
             # Extract and parse the company data
             if not data or "results" not in data or "company" not in data["results"]:
@@ -159,10 +177,8 @@ class OpenCorporatesScraper(BaseScraper):
         try:
             # Make the API call
             logger.info(f"Fetching officers for company ID: {company_id} in {jurisdiction}")
-            url = f"{BASE_URL}/companies/{jurisdiction}/{company_id}/officers"
-            response = requests.get(url, params={"api_token": self.api_token})
-            response.raise_for_status()
-            data = response.json()
+            url = f"{self.base_url}/companies/{jurisdiction}/{company_id}/officers"
+            data = await self._fetch_json("GET", url, params={"api_token": self.api_token})
             
             # Extract officers from the response
             officers = []
@@ -0,0 +1,134 @@
+"""
+chronos.scrapers.static_index
+=============================
+
+Parse‑once name index over a static bulk file (saved SoS HTML, CSV dumps).
+
+The file is parsed on first use and again only when its mtime changes;
+lookups are then dictionary / bisect operations on normalised names:
+
+1. exact match,
+2. prefix match (shortest name first, e.g. "foo" → "Foo LLC"),
+3. substring match (first row in file order).
+
+Example
+-------
+>>> index = StaticIndex(Path("static-assets/demo_de.html"), html_table_rows)
+>>> index.lookup("foo llc")
+['Foo LLC', '1234567', '01/01/2024', 'Active']
+"""
+
+from __future__ import annotations
+
+import bisect
+import csv
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from bs4 import BeautifulSoup
+
+__all__ = ["StaticIndex", "normalise_name", "html_table_rows", "csv_rows"]
+
+T = TypeVar("T")
+
+
+def normalise_name(text: str) -> str:
+    """Lower‑case *text* and collapse all whitespace."""
+    return " ".join(text.lower().split())
+
+
+def html_table_rows(path: Path) -> Iterable[List[str]]:
+    """Cell texts of every ``<tr>`` with at least one ``<td>``."""
+    soup = BeautifulSoup(path.read_text(encoding="utf-8", errors="ignore"), "html.parser")
+    for tr in soup.find_all("tr"):
+        cells = [td.get_text(strip=True) for td in tr.find_all("td")]
+        if cells:
+            yield cells
+
+
+def csv_rows(path: Path) -> Iterable[List[str]]:
+    """Rows of a CSV file, header included."""
+    with path.open(newline="", encoding="utf-8", errors="ignore") as fh:
+        yield from csv.reader(fh)
+
+
+class StaticIndex(Generic[T]):
+    """
+    Normalised‑name index over the rows of a file, rebuilt on mtime change.
+
+    Parameters
+    ----------
+    path
+        Source file.
+    rows
+        ``path -> iterable of rows``, e.g. :func:`html_table_rows`.
+    key
+        Extracts the name to index from a row (default: first column).
+        Rows with an empty name are skipped.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        rows: Callable[[Path], Iterable[T]],
+        key: Callable[[T], str] = lambda row: row[0] if row else "",  # type: ignore[index]
+    ) -> None:
+        self.path = Path(path)
+        self._rows = rows
+        self._key = key
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        # (exact name → row, sorted names, (name, row) in file order),
+        # swapped as one tuple so readers never mix two generations
+        self._state: Tuple[Dict[str, T], List[str], Sequence[Tuple[str, T]]] = ({}, [], ())
+        self.loads = 0
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        """(Re)parse the file if it changed since the last load."""
+        mtime = self.path.stat().st_mtime  # FileNotFoundError if missing
+        if mtime == self._mtime:
+            return
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            ordered: List[Tuple[str, T]] = []
+            exact: Dict[str, T] = {}
+            for row in self._rows(self.path):
+                name = normalise_name(self._key(row) or "")
+                if name:
+                    ordered.append((name, row))
+                    exact.setdefault(name, row)
+            self._state = (exact, sorted(exact), tuple(ordered))
+            self._mtime = mtime
+            self.loads += 1
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._state[2])
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def lookup(self, name: str) -> Optional[T]:
+        """Best row for *name* (exact, then prefix, then substring) or ``None``."""
+        self._load()
+        q = normalise_name(name)
+        if not q:
+            return None
+        exact, keys, ordered = self._state
+        if q in exact:
+            return exact[q]
+
+        i = bisect.bisect_left(keys, q)
+        prefixed = []
+        while i < len(keys) and keys[i].startswith(q):
+            prefixed.append(keys[i])
+            i += 1
+        if prefixed:
+            return exact[min(prefixed, key=len)]
+
+        return next((row for key, row in ordered if q in key), None)
@@ -0,0 +1,100 @@
+"""
+chronos.serialization
+=====================
+
+Fast JSON encoding for API payloads.
+
+:func:`dumps` goes straight to bytes with ``orjson`` (dates, enums and
+numpy arrays handled natively, in C); without ``orjson`` it falls back
+to the standard library with the same output shape.
+
+:func:`encode_entities` turns :class:`~chronos.models.CorporateEntity`
+objects into the API's JSON shape in one pass – one flat dict per entity,
+``Status`` as its name, ``formed`` left for the encoder – instead of
+FastAPI's recursive ``jsonable_encoder`` walk followed by ``json.dumps``.
+
+Example
+-------
+>>> encode_entities([CorporateEntity("Acme LLC", "DE", date(2020, 1, 1))], summary=True)
+b'[{"slug":"acme-llc","name":"Acme LLC","jurisdiction":"DE","status":"PENDING","formed":"2020-01-01"}]'
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Iterable
+
+from chronos.models import CorporateEntity, Status
+
+__all__ = [
+    "ORJSON_AVAILABLE",
+    "dumps",
+    "entity_dict",
+    "summary_dict",
+    "encode_entities",
+]
+
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+
+if ORJSON_AVAILABLE:
+    import orjson
+
+    # Dataclasses go through _default so CorporateEntity gets its API shape
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _default(obj: Any) -> Any:
+    """Types neither encoder handles on its own."""
+    if isinstance(obj, CorporateEntity):
+        return entity_dict(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if not ORJSON_AVAILABLE:
+        # Mirror orjson's native handling in the stdlib fallback
+        if isinstance(obj, (date, datetime)):
+            return obj.isoformat()
+        if isinstance(obj, Enum):
+            return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Compact UTF‑8 JSON bytes for *obj*."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        obj, default=_default, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def summary_dict(ent: CorporateEntity) -> Dict[str, Any]:
+    """``slug, name, jurisdiction, status, formed`` – the search‑result shape."""
+    return {
+        "slug": ent.name.lower().replace(" ", "-"),
+        "name": ent.name,
+        "jurisdiction": ent.jurisdiction,
+        "status": ent.status.name if isinstance(ent.status, Status) else ent.status,
+        "formed": ent.formed,
+    }
+
+
+def entity_dict(ent: CorporateEntity) -> Dict[str, Any]:
+    """Full entity shape: the summary plus ``officers`` and ``notes``."""
+    out = summary_dict(ent)
+    out["officers"] = ent.officers
+    out["notes"] = ent.notes
+    return out
+
+
+def encode_entities(entities: Iterable[CorporateEntity], summary: bool = False) -> bytes:
+    """JSON array of *entities* (summary or full shape) as bytes."""
+    shape = summary_dict if summary else entity_dict
+    return dumps([shape(ent) for ent in entities])
@@ -27,6 +27,15 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DB_FILE = os.environ.get("CHRONOS_DB_FILE", BASE_DIR / "chronos.db")
 DB_URL = f"sqlite:///{DB_FILE}"
 DB_ECHO = os.environ.get("CHRONOS_DB_ECHO", "False").lower() == "true"
+# Connection pools (see chronos.db.make_engine); readers use a separate pool
+DB_POOL_SIZE = int(os.environ.get("CHRONOS_DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("CHRONOS_DB_MAX_OVERFLOW", "10"))
+DB_READ_POOL_SIZE = int(os.environ.get("CHRONOS_DB_READ_POOL_SIZE", "10"))
+DB_POOL_TIMEOUT = float(os.environ.get("CHRONOS_DB_POOL_TIMEOUT", "30"))
+# SQLite pragmas applied to every connection
+DB_BUSY_TIMEOUT_MS = int(os.environ.get("CHRONOS_DB_BUSY_TIMEOUT_MS", "5000"))
+DB_MMAP_SIZE = int(os.environ.get("CHRONOS_DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+DB_CACHE_SIZE_KB = int(os.environ.get("CHRONOS_DB_CACHE_SIZE_KB", "16384"))
 
 # API settings
 # ---------------------------------------------------------------------------
@@ -34,10 +43,48 @@ API_HOST = os.environ.get("CHRONOS_API_HOST", "127.0.0.1")
 API_PORT = int(os.environ.get("CHRONOS_API_PORT", "8000"))
 API_WORKERS = int(os.environ.get("CHRONOS_API_WORKERS", "1"))
 API_DEBUG = os.environ.get("CHRONOS_API_DEBUG", "False").lower() == "true"
+# Response compression (see api.middleware); brotli is used when installed
+COMPRESSION_MIN_SIZE = int(os.environ.get("CHRONOS_COMPRESSION_MIN_SIZE", "1024"))  # bytes
+COMPRESSION_GZIP_LEVEL = int(os.environ.get("CHRONOS_COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get("CHRONOS_COMPRESSION_BROTLI_QUALITY", "4"))
 
 # Scraper settings
 # ---------------------------------------------------------------------------
 SCRAPER_TIMEOUT = int(os.environ.get("CHRONOS_SCRAPER_TIMEOUT", "30"))
+SCRAPER_CONNECT_TIMEOUT = float(os.environ.get("CHRONOS_SCRAPER_CONNECT_TIMEOUT", "5"))
+
+# Federated search (see chronos.federated)
+# ---------------------------------------------------------------------------
+SEARCH_STRATEGY = os.environ.get("CHRONOS_SEARCH_STRATEGY", "first")  # first | all | hedged
+SEARCH_DEADLINE = float(os.environ.get("CHRONOS_SEARCH_DEADLINE", "8"))  # per provider
+SEARCH_HEDGE_DELAY = float(os.environ.get("CHRONOS_SEARCH_HEDGE_DELAY", "0.5"))  # until p95 is known
+
+# Background jobs (see chronos.jobs / POST /jobs/search)
+# ---------------------------------------------------------------------------
+JOB_WORKERS = int(os.environ.get("CHRONOS_JOB_WORKERS", "4"))  # concurrent provider calls
+JOB_QUEUE_SIZE = int(os.environ.get("CHRONOS_JOB_QUEUE_SIZE", "1000"))  # queued jobs before 503
+JOB_HISTORY = int(os.environ.get("CHRONOS_JOB_HISTORY", "500"))  # finished jobs kept for GET
+# Cobalt live searches answer with a retryId until done
+COBALT_POLL_INTERVAL = float(os.environ.get("CHRONOS_COBALT_POLL_INTERVAL", "2"))
+COBALT_POLL_TIMEOUT = float(os.environ.get("CHRONOS_COBALT_POLL_TIMEOUT", "180"))
+
+# Outbound HTTP pool settings (per provider / host, see chronos.http)
+# ---------------------------------------------------------------------------
+HTTP_MAX_CONNECTIONS = int(os.environ.get("CHRONOS_HTTP_MAX_CONNECTIONS", "50"))
+HTTP_MAX_KEEPALIVE = int(os.environ.get("CHRONOS_HTTP_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("CHRONOS_HTTP_KEEPALIVE_EXPIRY", "30"))
+
+# Outbound rate limits per provider, "<requests>/<s|min|hour|day>" (see chronos.ratelimit)
+# ---------------------------------------------------------------------------
+RATE_LIMIT_EDGAR = os.environ.get("CHRONOS_RATE_LIMIT_EDGAR", "10/s")  # SEC fair-access policy
+RATE_LIMIT_COBALT = os.environ.get("CHRONOS_RATE_LIMIT_COBALT", "10/s")
+RATE_LIMIT_DATA_AXLE = os.environ.get("CHRONOS_RATE_LIMIT_DATA_AXLE", "10/s")
+# Unauthenticated OpenCorporates calls get 10 per hour; with a token use the plan's limit
+RATE_LIMIT_OPENCORP = os.environ.get(
+    "CHRONOS_RATE_LIMIT_OPENCORP",
+    "5/s" if os.environ.get("OPENCORP_API_TOKEN") else "10/hour",
+)
+RATE_LIMIT_MAX_WAIT = float(os.environ.get("CHRONOS_RATE_LIMIT_MAX_WAIT", "30"))  # fail fast beyond
 SCRAPER_USER_AGENT = os.environ.get(
     "CHRONOS_SCRAPER_USER_AGENT", 
     "Chronos/0.1.0 Corporate Entity Research Tool"
@@ -47,6 +94,14 @@ SCRAPER_USER_AGENT = os.environ.get(
 # ---------------------------------------------------------------------------
 CACHE_ENABLED = os.environ.get("CHRONOS_CACHE_ENABLED", "True").lower() == "true"
 CACHE_TTL = int(os.environ.get("CHRONOS_CACHE_TTL", "3600"))  # 1 hour
+# Stale entries are served (and refreshed in the background) up to this age
+CACHE_HARD_TTL = int(os.environ.get("CHRONOS_CACHE_HARD_TTL", str(7 * 86400)))  # 1 week
+CACHE_NEGATIVE_TTL = int(os.environ.get("CHRONOS_CACHE_NEGATIVE_TTL", "900"))  # "no results"
+CACHE_DIR = Path(os.environ.get("CHRONOS_CACHE_DIR", "."))
+CACHE_DB_PATH = CACHE_DIR / "chronos_cache.db"
+CACHE_MEMORY_ITEMS = int(os.environ.get("CHRONOS_CACHE_MEMORY_ITEMS", "2048"))
+# Offline SEC name ↔ CIK index (python -m chronos.cik_index build <file>)
+CIK_INDEX_PATH = Path(os.environ.get("CHRONOS_CIK_INDEX", str(CACHE_DIR / "cik_index.db")))
 
 # ---------------------------------------------------------------------------
 # Pydantic settings model for API integrations
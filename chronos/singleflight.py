@@ -0,0 +1,175 @@
+"""
+chronos.singleflight
+====================
+
+Request coalescing for identical in‑flight provider lookups.
+
+When several requests ask a provider the same question at the same time
+(the dashboard and a couple of analysts searching one company), only the
+first one – the *leader* – goes upstream; the others await the leader's
+``asyncio`` task and get the same answer.  Nothing is remembered once the
+call finishes; that is :mod:`chronos.cache`'s job.
+
+* ``await flights.do(key, fn)`` – run ``fn()`` once per concurrent *key*
+* ``@coalesce("cobalt")``      – decorate an ``async search(name, state)``
+  method; the key is (provider, method, normalised query, jurisdiction,
+  other args)
+* ``flights.stats()``          – per‑provider request / upstream / coalesced
+  counters
+
+Example
+-------
+>>> class Scraper:
+...     @coalesce("cobalt")
+...     async def search(self, name, state=None): ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+__all__ = ["SingleFlight", "flights", "coalesce", "normalise_query"]
+
+
+def normalise_query(query: Optional[str]) -> str:
+    """Case‑ and whitespace‑insensitive form of a search term."""
+    return " ".join((query or "").lower().split())
+
+
+@dataclass
+class _Counters:
+    requests: int = 0   # calls to do()
+    upstream: int = 0   # calls that actually ran fn()
+    coalesced: int = 0  # calls that joined an in‑flight leader
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls by key.
+
+    Keys are scoped to the running event loop.  If every caller waiting on
+    a flight is cancelled (e.g. a federated search dropping a straggler),
+    the upstream call is cancelled too; otherwise a cancelled follower
+    leaves the shared call running for the others.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _Flight] = {}
+        self._counters: Dict[str, _Counters] = {}
+
+    def _counter(self, key: Hashable) -> _Counters:
+        name = str(key[0]) if isinstance(key, tuple) and key else "default"
+        return self._counters.setdefault(name, _Counters())
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return ``await fn()``, sharing one execution among concurrent callers."""
+        loop = asyncio.get_running_loop()
+        fkey = (loop, key)
+        counters = self._counter(key)
+        counters.requests += 1
+
+        flight = self._flights.get(fkey)
+        if flight is None:
+            flight = _Flight(loop.create_task(fn()))
+            self._flights[fkey] = flight
+
+            def _done(_task: asyncio.Task, fkey=fkey, flight=flight) -> None:
+                if self._flights.get(fkey) is flight:
+                    del self._flights[fkey]
+
+            flight.task.add_done_callback(_done)
+            counters.upstream += 1
+        else:
+            counters.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()  # nobody else is waiting for it
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Counters per provider plus the share of calls that were coalesced."""
+        out: Dict[str, Dict[str, Any]] = {}
+        for name, c in self._counters.items():
+            out[name] = {
+                **asdict(c),
+                "saved_ratio": round(c.coalesced / c.requests, 4) if c.requests else 0.0,
+            }
+        return out
+
+    def reset_stats(self) -> None:
+        self._counters.clear()
+
+
+# Process‑wide instance used by the provider clients
+flights = SingleFlight()
+
+
+def coalesce(
+    provider: str,
+    query: str = "name",
+    jurisdiction: Optional[str] = "state",
+    group: Optional[SingleFlight] = None,
+):
+    """
+    Coalesce concurrent calls of an async scraper method.
+
+    Parameters
+    ----------
+    provider
+        First element of the flight key (and the stats bucket).
+    query, jurisdiction
+        Argument names normalised into the key; ``jurisdiction=None`` if
+        the method has none.  Remaining arguments are part of the key
+        verbatim, as is the instance's ``base_url`` so differently
+        configured clients never share answers.
+    group
+        :class:`SingleFlight` to use (defaults to :data:`flights`).
+    """
+
+    def decorator(fn):
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            bound = sig.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            params.pop("self", None)
+            q = normalise_query(params.pop(query, None))
+            j = (params.pop(jurisdiction, None) or "").upper() if jurisdiction else ""
+            key = (
+                provider,
+                fn.__qualname__,
+                getattr(self, "base_url", ""),
+                q,
+                j,
+                tuple(sorted((k, repr(v)) for k, v in params.items())),
+            )
+            result = await (group or flights).do(key, lambda: fn(self, *args, **kwargs))
+            # Followers get their own list so nobody mutates a shared one
+            return list(result) if isinstance(result, list) else result
+
+        return wrapper
+
+    return decorator
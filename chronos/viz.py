@@ -12,7 +12,6 @@ needed).  Filenames can be overridden via keyword argument.
 from __future__ import annotations
 
 import os
-from collections import Counter
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -49,7 +48,7 @@ def status_summary(
     pathlib.Path
         Final image path for convenience.
     """
-    counts = Counter(ent.status for ent in pm)
+    counts = pm.status_counts()
     xs, ys = zip(*sorted(counts.items(), key=lambda t: t[0].value))
 
     plt.figure()
@@ -123,9 +123,9 @@ def seed_database():
     """Add sample entities to the database."""
     pm = DBPortfolioManager()
     
-    # Add all sample entities
+    # Add all sample entities in a single transaction
+    pm.add_many(SAMPLE_ENTITIES)
     for entity in SAMPLE_ENTITIES:
-        pm.add(entity)
         print(f"Added: {entity.name} ({entity.status.name})")
     
     print(f"\nAdded {len(SAMPLE_ENTITIES)} entities to the database!")
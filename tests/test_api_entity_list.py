@@ -0,0 +1,98 @@
+"""
+Tests for the /entities/all endpoint.
+
+The router is mounted on a bare FastAPI app with ``get_async_portfolio``
+overridden to a throw‑away SQLite portfolio.
+"""
+
+import asyncio
+import json
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from api.deps import get_async_portfolio
+from api.entity_list import router
+from chronos.db import create_all, make_engine
+from chronos.models import CorporateEntity, Status
+from chronos.portfolio_async import AsyncDBPortfolioManager
+from chronos.portfolio_db import DBPortfolioManager
+
+
+@pytest.fixture
+def client(tmp_path):
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("greenlet")
+    from chronos.portfolio_async import async_session, make_async_engine
+
+    url = f"sqlite:///{tmp_path / 'entities.db'}"
+    engine = make_engine(url)
+    create_all(engine)
+    DBPortfolioManager(Session(engine)).add_many(
+        CorporateEntity(f"Entity {i:02d} LLC", "DE", date(2024, 1, 1), status=Status.ACTIVE)
+        for i in range(5)
+    )
+    async_engine = make_async_engine(url)
+
+    async def portfolio():
+        async with async_session(async_engine) as s:
+            yield AsyncDBPortfolioManager(s)
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_async_portfolio] = portfolio
+    yield TestClient(app)
+    asyncio.run(async_engine.dispose())
+    engine.dispose()
+
+
+def test_full_list_keeps_original_shape(client):
+    resp = client.get("/entities/all")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert len(body) == 5
+    assert set(body[0]) == {"slug", "name", "jurisdiction", "status", "formed"}
+    assert "X-Next-After" not in resp.headers
+
+
+def test_keyset_pagination_walks_all_pages(client):
+    slugs, after = [], None
+    while True:
+        params = {"limit": 2, "fields": "name"}
+        if after:
+            params["after"] = after
+        resp = client.get("/entities/all", params=params)
+        page = resp.json()
+        assert all(set(row) == {"name"} for row in page)
+        slugs.extend(row["name"] for row in page)
+        after = resp.headers.get("X-Next-After")
+        if not after:
+            break
+    assert slugs == [f"Entity {i:02d} LLC" for i in range(5)]
+
+
+def test_ndjson_stream(client):
+    resp = client.get(
+        "/entities/all",
+        params={"fields": "slug,status", "after": "entity-02-llc"},
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert rows == [
+        {"slug": "entity-03-llc", "status": "ACTIVE"},
+        {"slug": "entity-04-llc", "status": "ACTIVE"},
+    ]
+
+
+def test_unknown_field_rejected(client):
+    assert client.get("/entities/all", params={"fields": "bogus"}).status_code == 400
+
+
+def test_openapi_documents_both_media_types(client):
+    schema = client.app.openapi()["paths"]["/entities/all"]["get"]["responses"]["200"]
+    assert set(schema["content"]) == {"application/json", "application/x-ndjson"}
+    assert "X-Next-After" in schema["headers"]
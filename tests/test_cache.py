@@ -0,0 +1,199 @@
+"""
+tests/test_cache.py
+===================
+
+Tiered provider response cache: LRU memory tier, SQLite tier, TTL,
+namespaces, and scrapers reading through it.
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from chronos.cache import ResponseCache, cache_key
+from chronos.scrapers import base
+from chronos.scrapers.opencorp import OpenCorporatesScraper
+
+
+@pytest.fixture
+def rc(tmp_path):
+    rc = ResponseCache(tmp_path / "cache.db", ttl=60, max_items=2, memory_ttl=60, enabled=True)
+    yield rc
+    rc.close()
+
+
+def test_round_trip_and_namespaces(rc):
+    rc.set("cobalt", "k", {"results": [1, 2]})
+    assert rc.get("cobalt", "k") == {"results": [1, 2]}
+    assert rc.get("edgar", "k") is None
+    assert rc.stats()["hits"]["memory"] == 1
+
+
+def test_disk_tier_survives_memory_eviction_and_restart(rc, tmp_path):
+    for i in range(3):
+        rc.set("p", f"k{i}", i)
+    assert rc.stats()["memory_items"] == 2
+    assert rc.get("p", "k0") == 0  # evicted from the LRU, read back from SQLite
+    assert rc.stats()["hits"]["disk"] == 1
+
+    other = ResponseCache(tmp_path / "cache.db", enabled=True)
+    assert other.get("p", "k2") == 2
+    other.close()
+
+
+def test_ttl_expiry(rc):
+    rc.set("p", "k", "v", ttl=0.05)
+    time.sleep(0.1)
+    assert rc.get("p", "k") is None
+
+
+def test_clear_namespace(rc):
+    rc.set("a", "k", 1)
+    rc.set("b", "k", 2)
+    rc.clear("a")
+    assert rc.get("a", "k") is None and rc.get("b", "k") == 2
+
+
+def test_key_ignores_secrets_and_param_order():
+    assert cache_key("/s", {"q": "x", "api_token": "t1", "n": 1}) == cache_key("/s", {"n": 1, "q": "x"})
+
+
+def test_scraper_repeated_search_skips_network(rc, monkeypatch):
+    monkeypatch.setattr(base, "cache", rc)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"results": {"companies": [
+            {"company": {"name": "Acme LLC", "jurisdiction_code": "us_de",
+                         "incorporation_date": "2020-01-01", "current_status": "Active"}},
+        ]}})
+
+    scraper = OpenCorporatesScraper(
+        api_token="t", base_url="https://oc.test",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    first = asyncio.run(scraper.search("Acme", "DE"))
+    second = asyncio.run(scraper.search("Acme", "DE"))
+    assert [e.name for e in first] == [e.name for e in second] == ["Acme LLC"]
+    assert len(calls) == 1
+
+
+def test_disabled_cache_is_inert(tmp_path):
+    rc = ResponseCache(tmp_path / "off.db", enabled=False)
+    rc.set("p", "k", 1)
+    assert rc.get("p", "k") is None
+    assert not (tmp_path / "off.db").exists()
+
+
+# ---------------------------------------------------------------------------
+# Soft/hard TTL and negative caching
+# ---------------------------------------------------------------------------
+def test_stale_value_served_while_refreshing(rc):
+    rc.ttl = 0.05
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"n": len(calls)}
+
+    async def run():
+        first = await rc.get_or_fetch("p", "k", fetch)
+        await asyncio.sleep(0.06)  # now stale, still within the hard TTL
+        start = time.perf_counter()
+        stale = await rc.get_or_fetch("p", "k", fetch)
+        again = await rc.get_or_fetch("p", "k", fetch)  # refresh already running
+        served_in = time.perf_counter() - start
+        await rc.drain()
+        return first, stale, again, served_in
+
+    first, stale, again, served_in = asyncio.run(run())
+    assert first == stale == again == {"n": 1}
+    assert served_in < 0.04  # did not wait for the upstream
+    assert len(calls) == 2
+    assert rc.lookup("p", "k").value == {"n": 2}
+    assert rc.stats()["refreshes"] == {"ok": 1, "failed": 0}
+
+
+def test_async_path_keeps_sqlite_off_the_event_loop(rc, monkeypatch):
+    db_threads = []
+    real_db = rc._db
+
+    def spy():
+        db_threads.append(threading.current_thread())
+        return real_db()
+
+    monkeypatch.setattr(rc, "_db", spy)
+
+    async def fetch():
+        return {"n": 1}
+
+    async def run():
+        first = await rc.get_or_fetch("p", "k", fetch)  # disk miss + store
+        again = await rc.get_or_fetch("p", "k", fetch)  # memory hit
+        return first, again
+
+    assert asyncio.run(run()) == ({"n": 1}, {"n": 1})
+    assert len(db_threads) == 2
+    assert threading.main_thread() not in db_threads
+
+
+def test_failed_refresh_keeps_stale_value(rc):
+    rc.ttl = 0.01
+    rc.set("p", "k", "old")
+    time.sleep(0.02)
+
+    async def boom():
+        raise RuntimeError("upstream down")
+
+    async def run():
+        value = await rc.get_or_fetch("p", "k", boom)
+        await rc.drain()
+        return value
+
+    assert asyncio.run(run()) == "old"
+    assert rc.lookup("p", "k").value == "old"
+    assert rc.stats()["refreshes"]["failed"] == 1
+
+
+def test_negative_answers_use_short_ttl(rc):
+    rc.negative_ttl = 0.05
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"results": []}
+
+    empty = lambda r: not r["results"]
+    rc.get_or_fetch_sync("p", "nothing", fetch, negative_if=empty)
+    rc.get_or_fetch_sync("p", "nothing", fetch, negative_if=empty)
+    assert len(calls) == 1
+    time.sleep(0.06)
+    assert rc.lookup("p", "nothing") is None  # no stale window for negatives
+    rc.get_or_fetch_sync("p", "nothing", fetch, negative_if=empty)
+    assert len(calls) == 2
+
+
+def test_store_if_vetoes_caching(rc):
+    rc.get_or_fetch_sync("p", "k", lambda: {"retryId": "x"}, store_if=lambda d: "retryId" not in d)
+    assert rc.lookup("p", "k") is None
+
+
+def test_old_cache_file_is_migrated(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE response_cache (namespace TEXT NOT NULL, key TEXT NOT NULL, "
+        "payload BLOB NOT NULL, expires_at REAL NOT NULL, PRIMARY KEY (namespace, key)) WITHOUT ROWID"
+    )
+    conn.close()
+    rc = ResponseCache(path, enabled=True)
+    rc.set("p", "k", 1)
+    assert rc.get("p", "k") == 1
+    rc.close()
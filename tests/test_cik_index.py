@@ -0,0 +1,98 @@
+"""
+tests/test_cik_index.py
+=======================
+
+Offline CIK index: building from the SEC bulk formats, lookups in both
+directions, atomic rebuilds and the EdgarClient network fallback.
+"""
+
+import asyncio
+import json
+import zipfile
+
+import httpx
+
+from chronos.cik_index import CIKIndex, normalise_company_name
+from chronos.scrapers.edgar import EdgarClient
+
+TICKERS = {
+    "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    "1": {"cik_str": 789019, "ticker": "MSFT", "title": "MICROSOFT CORP"},
+}
+
+
+def _index(tmp_path, data=TICKERS, name="company_tickers.json"):
+    src = tmp_path / name
+    src.write_text(json.dumps(data))
+    index = CIKIndex(tmp_path / "cik_index.db")
+    assert index.build(src) == 2
+    return index
+
+
+def test_normalise_company_name():
+    assert normalise_company_name("Microsoft Corporation") == "microsoft corp"
+    assert normalise_company_name("  APPLE, Inc. ") == "apple inc"
+
+
+def test_lookups_from_company_tickers(tmp_path):
+    index = _index(tmp_path)
+    assert index.cik_for("apple inc") == "0000320193"
+    assert index.cik_for("Microsoft Corporation") == "0000789019"
+    assert index.name_for("0000320193") == "Apple Inc."
+    assert index.ticker_for(789019) == "MSFT"
+    assert index.cik_for("Globex") is None
+    assert len(index) == 2
+
+
+def test_exchange_and_submissions_formats(tmp_path):
+    exchange = {"fields": ["cik", "name", "ticker", "exchange"],
+                "data": [[320193, "Apple Inc.", "AAPL", "Nasdaq"],
+                         [789019, "MICROSOFT CORP", "MSFT", "Nasdaq"]]}
+    assert _index(tmp_path, exchange, "exchange.json").cik_for("Apple Inc") == "0000320193"
+
+    archive = tmp_path / "submissions.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("CIK0000320193.json", json.dumps({
+            "cik": "320193", "name": "Apple Inc.", "tickers": ["AAPL"],
+            "formerNames": [{"name": "APPLE COMPUTER INC"}],
+        }))
+        zf.writestr("CIK0000320193-submissions-001.json", json.dumps({"filings": []}))
+    index = CIKIndex(tmp_path / "subs.db")
+    assert index.build(archive) == 1
+    assert index.cik_for("Apple Computer, Inc.") == "0000320193"
+
+
+def test_rebuild_replaces_index(tmp_path):
+    index = _index(tmp_path)
+    assert index.cik_for("Apple Inc") == "0000320193"
+    renamed = {"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Pear Inc."},
+               "1": TICKERS["1"]}
+    (tmp_path / "renamed.json").write_text(json.dumps(renamed))
+    index.build(tmp_path / "renamed.json")
+    assert index.cik_for("Apple Inc") is None
+    assert index.name_for(320193) == "Pear Inc."
+
+
+def test_missing_index_is_empty(tmp_path):
+    index = CIKIndex(tmp_path / "absent.db")
+    assert not index.available
+    assert index.cik_for("Apple Inc") is None
+    assert not (tmp_path / "absent.db").exists()
+
+
+def test_edgar_client_uses_index_before_network(tmp_path):
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params.get("keys"))
+        return httpx.Response(200, json={"hits": {"hits": [{"_source": {"cik": "0000000123"}}]}})
+
+    client = EdgarClient(
+        httpx.AsyncClient(base_url="https://sec.test", transport=httpx.MockTransport(handler)),
+        use_cache=False,
+        index=_index(tmp_path),
+    )
+    assert asyncio.run(client.get_company_cik("Apple Inc.")) == "0000320193"
+    assert calls == []
+    assert asyncio.run(client.get_company_cik("Acme Corp")) == "0000000123"
+    assert calls == ["Acme Corp"]
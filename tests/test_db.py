@@ -0,0 +1,117 @@
+"""
+tests/test_db.py
+================
+
+Engine tuning (WAL and pragmas, read‑only reader pool) and the
+request‑scoped session dependency.
+"""
+
+import threading
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session
+
+from api.deps import get_portfolio, get_session
+from chronos.db import (
+    ENTITIES_REVISION,
+    bulk_upsert_entities,
+    create_all,
+    entity_changes_since,
+    get_revision_stamps,
+    get_revisions,
+    make_engine,
+)
+from chronos.models import CorporateEntity
+from chronos.portfolio_db import DBPortfolioManager
+
+
+@pytest.fixture
+def engines(tmp_path):
+    url = f"sqlite:///{tmp_path / 'chronos.db'}"
+    writer = make_engine(url)
+    reader = make_engine(url, readonly=True)
+    create_all(writer)
+    yield writer, reader
+    writer.dispose()
+    reader.dispose()
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_pragmas_applied(engines):
+    writer, reader = engines
+    assert _pragma(writer, "journal_mode") == "wal"
+    assert _pragma(writer, "synchronous") == 1  # NORMAL
+    assert _pragma(writer, "busy_timeout") > 0
+    assert _pragma(reader, "query_only") == 1
+
+
+def test_reader_pool_rejects_writes(engines):
+    writer, reader = engines
+    DBPortfolioManager(Session(writer)).add(CorporateEntity("Acme LLC", "DE", date(2020, 1, 1)))
+    with DBPortfolioManager(Session(reader)) as pm:
+        assert pm.get("acme-llc").name == "Acme LLC"
+        with pytest.raises(OperationalError):
+            pm.add(CorporateEntity("Globex LLC", "DE", date(2020, 1, 1)))
+
+
+def test_revision_stamps_are_utc(engines):
+    writer, reader = engines
+    DBPortfolioManager(Session(writer)).add(CorporateEntity("Acme LLC", "DE", date(2020, 1, 1)))
+    with Session(reader) as s:
+        rev, updated_at = get_revision_stamps(s)[ENTITIES_REVISION]
+    assert rev >= 1
+    assert updated_at.utcoffset().total_seconds() == 0
+
+
+def test_unchanged_upserts_do_not_bump_the_revision(engines):
+    writer, _ = engines
+    acme = CorporateEntity("Acme LLC", "DE", date(2020, 1, 1))
+    with Session(writer) as s:
+        bulk_upsert_entities(s, [acme, CorporateEntity("Globex", "DE", date(2020, 1, 1))])
+        rev = get_revisions(s)[ENTITIES_REVISION]
+        bulk_upsert_entities(s, [acme])  # the same search hit stored again
+        s.execute(text("UPDATE corporateentitydb SET notes = notes"))
+        s.commit()
+        assert get_revisions(s)[ENTITIES_REVISION] == rev
+
+        acme.notes = "enriched"
+        bulk_upsert_entities(s, [acme])
+        assert get_revisions(s)[ENTITIES_REVISION] == rev + 1
+        assert entity_changes_since(s, rev) == {"acme-llc"}
+        assert entity_changes_since(s, 0) == {"acme-llc", "globex"}
+
+
+def test_concurrent_writers_with_session_per_thread(engines):
+    writer, _ = engines
+    errors = []
+
+    def work(i):
+        try:
+            with Session(writer) as s:
+                DBPortfolioManager(s).add(CorporateEntity(f"Entity {i}", "DE", date(2020, 1, 1)))
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(DBPortfolioManager(Session(writer))) == 16
+
+
+def test_get_session_is_request_scoped():
+    first, second = get_session(), get_session()
+    s1, s2 = next(first), next(second)
+    assert s1 is not s2
+    assert get_portfolio(s1)._session is s1
+    for gen in (first, second):
+        gen.close()
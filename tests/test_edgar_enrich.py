@@ -0,0 +1,94 @@
+"""
+tests/test_edgar_enrich.py
+==========================
+
+Batch SEC EDGAR enrichment: deduplicated lookups, bounded concurrency,
+idempotent notes and the bulk write‑back of the stored portfolio.
+"""
+
+import asyncio
+from datetime import date
+
+import httpx
+from sqlmodel import Session, create_engine
+
+from chronos.db import create_all
+from chronos.models import CorporateEntity
+from chronos.portfolio_db import DBPortfolioManager
+from chronos.scrapers.edgar import EdgarClient, enrich_portfolio
+
+CIKS = {"acme corp": "0000000123", "globex": "0000000456"}
+
+
+def _client(log, down=()):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        log.append(request.url.path)
+        await asyncio.sleep(0.01)
+        if set(request.url.params.values()) & set(down):
+            return httpx.Response(503)
+        if request.url.path == "/search-index":
+            cik = CIKS.get(request.url.params["keys"].lower())
+            hits = [{"_source": {"cik": cik}}] if cik else []
+            return httpx.Response(200, json={"hits": {"hits": hits}})
+        return httpx.Response(200, json={"data": {"hits": [
+            {"form": "10-K", "filingDate": "2024-02-01", "fileUrl": "https://sec.test/10k"},
+        ]}})
+
+    return EdgarClient(httpx.AsyncClient(base_url="https://sec.test",
+                                         transport=httpx.MockTransport(handler)),
+                       use_cache=False)
+
+
+def _ent(name):
+    return CorporateEntity(name, "DE", date(2020, 1, 1))
+
+
+def test_enrich_many_dedupes_lookups():
+    log, seen = [], []
+    entities = [_ent("Acme Corp"), _ent("ACME  corp"), _ent("Globex"), _ent("Nobody LLC")]
+    report = asyncio.run(_client(log).enrich_many(
+        entities, concurrency=4, progress=lambda done, total: seen.append((done, total)),
+    ))
+
+    assert log.count("/search-index") == 3  # one per distinct name
+    assert log.count("/filings") == 2       # one per distinct CIK
+    assert (report.total, report.unique_names, report.unique_ciks, report.matched) == (4, 3, 2, 3)
+    assert entities[1].notes.startswith("SEC CIK: 0000000123")
+    assert entities[3].notes is None
+    assert seen[-1] == (5, 5)
+
+
+def test_enrichment_is_idempotent():
+    entity = _ent("Globex")
+    entity.notes = "Analyst note"
+    client = _client([])
+    asyncio.run(client.enrich_many([entity]))
+    first = entity.notes
+    asyncio.run(client.enrich_many([entity]))
+    assert entity.notes == first
+    assert first.startswith("Analyst note\n\nSEC CIK: 0000000456")
+
+
+def test_failed_lookups_are_counted_and_keep_stored_notes():
+    acme, globex = _ent("Acme Corp"), _ent("Globex")
+    asyncio.run(_client([]).enrich_many([acme]))
+    stored = acme.notes
+
+    # Filings for Acme's CIK and the name search for Globex both fail
+    report = asyncio.run(_client([], down=("123", "Globex")).enrich_many([acme, globex]))
+    assert report.failed == 2 and report.matched == 0
+    assert acme.notes == stored and "10-K" in stored
+    assert globex.notes is None
+
+
+def test_enrich_portfolio_writes_back(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'p.db'}")
+    create_all(engine)
+    pm = DBPortfolioManager(Session(engine))
+    pm.add_many([_ent("Acme Corp"), _ent("Nobody LLC")])
+
+    report = asyncio.run(enrich_portfolio(pm, client=_client([])))
+    assert report.written == 1
+    assert "10-K (2024-02-01)" in pm.get("acme-corp").notes
+    assert pm.get("nobody-llc").notes is None
+    engine.dispose()
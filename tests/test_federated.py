@@ -0,0 +1,154 @@
+"""
+tests/test_federated.py
+=======================
+
+Federated search strategies: first‑good‑result, wait‑all merge, hedging,
+deadlines, cancellation and slug de‑duplication.
+"""
+
+import asyncio
+import time
+from datetime import date
+
+import pytest
+
+from chronos.federated import MIN_LATENCY_SAMPLES, FederatedSearch, Provider, dedupe
+from chronos.models import CorporateEntity
+
+
+def _ent(name: str) -> CorporateEntity:
+    return CorporateEntity(name, "DE", date(2020, 1, 1))
+
+
+def _provider(name, delay, names=(), fail=False, log=None, **kw) -> Provider:
+    async def search(q, state):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(name)
+            raise
+        if fail:
+            raise RuntimeError("upstream down")
+        return [_ent(n) for n in names]
+
+    return Provider(name, search, **kw)
+
+
+def test_first_returns_fastest_non_empty_and_cancels_rest():
+    cancelled = []
+    fs = FederatedSearch([
+        _provider("slow", 1.0, ["Slow Co"], log=cancelled),
+        _provider("empty", 0.01),
+        _provider("fast", 0.05, ["Fast Co"]),
+    ])
+    start = time.perf_counter()
+    result = asyncio.run(fs.search("co", strategy="first"))
+
+    assert time.perf_counter() - start < 0.5
+    assert result.winner == "fast"
+    assert [e.name for e in result.entities] == ["Fast Co"]
+    assert cancelled == ["slow"]
+    assert {o.name: o.status for o in result.outcomes} == {
+        "slow": "cancelled", "empty": "empty", "fast": "ok",
+    }
+
+
+def test_first_holds_scarce_providers_until_those_ahead_have_nothing():
+    calls = []
+
+    def scarce(name, names=()):
+        async def search(q, state):
+            calls.append(name)
+            return [_ent(n) for n in names]
+
+        return Provider(name, search, scarce=True)
+
+    fs = FederatedSearch([_provider("primary", 0.05, ["Acme LLC"]), scarce("quota", ["Acme LLC"]),
+                          _provider("local", 0.2)])
+    result = asyncio.run(fs.search("acme", strategy="first"))
+    assert result.winner == "primary" and calls == []
+    assert {o.name: o.status for o in result.outcomes}["quota"] == "skipped"
+
+    fs = FederatedSearch([_provider("primary", 0.05, fail=True), scarce("quota", ["Acme LLC"]),
+                          _provider("local", 0.2)])
+    result = asyncio.run(fs.search("acme", strategy="first"))
+    assert result.winner == "quota" and calls == ["quota"]
+    assert {o.name: o.status for o in result.outcomes} == {
+        "primary": "error", "quota": "ok", "local": "cancelled",
+    }
+
+
+def test_all_merges_and_dedupes_in_priority_order():
+    fs = FederatedSearch([
+        _provider("a", 0.05, ["Acme LLC", "Beta Inc"]),
+        _provider("b", 0.01, ["acme  llc", "Gamma"]),
+        _provider("broken", 0.01, fail=True),
+    ])
+    result = asyncio.run(fs.search("co", strategy="all"))
+    assert [e.name for e in result.entities] == ["Acme LLC", "Beta Inc", "Gamma"]
+    assert result.outcomes[2].status == "error"
+
+
+def test_deadline_bounds_latency():
+    fs = FederatedSearch([_provider("hung", 5.0, ["X"], deadline=0.05)])
+    start = time.perf_counter()
+    result = asyncio.run(fs.search("co", strategy="all"))
+    assert time.perf_counter() - start < 1.0
+    assert result.entities == []
+    assert result.outcomes[0].status == "timeout"
+
+
+def test_timeouts_and_errors_count_toward_p95():
+    fs = FederatedSearch([
+        _provider("hung", 5.0, ["X"], deadline=0.01),
+        _provider("broken", 0.0, fail=True),
+    ])
+
+    async def run():
+        for _ in range(MIN_LATENCY_SAMPLES):
+            await fs.search("co", strategy="all")
+
+    asyncio.run(run())
+    assert fs.p95("hung") == 0.01
+    assert fs.p95("broken") is not None
+
+
+def test_hedged_launches_backup_only_when_primary_is_slow():
+    fs = FederatedSearch([
+        _provider("primary", 0.01, ["P"]),
+        _provider("backup", 0.01, ["B"]),
+    ], hedge_delay=0.1)
+    result = asyncio.run(fs.search("co", strategy="hedged"))
+    assert result.winner == "primary"
+    assert [o.status for o in result.outcomes] == ["ok", "skipped"]
+
+    fs = FederatedSearch([
+        _provider("primary", 1.0, ["P"]),
+        _provider("backup", 0.01, ["B"]),
+    ], hedge_delay=0.05)
+    start = time.perf_counter()
+    result = asyncio.run(fs.search("co", strategy="hedged"))
+    assert time.perf_counter() - start < 0.5
+    assert result.winner == "backup"
+
+
+def test_state_restricted_provider_and_filter():
+    fs = FederatedSearch([
+        _provider("any", 0.01, ["Any"]),
+        _provider("de", 0.01, ["Del"], states=frozenset({"DE"})),
+    ])
+    assert [o.name for o in asyncio.run(fs.search("co", "CA")).outcomes] == ["any"]
+    result = asyncio.run(fs.search("co", "de", providers=["de"]))
+    assert result.winner == "de"
+
+
+def test_dedupe_normalises_whitespace_and_case():
+    assert [e.name for e in dedupe([_ent("Foo Bar"), _ent(" foo   BAR "), _ent("Baz")])] == [
+        "Foo Bar", "Baz",
+    ]
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        FederatedSearch([], strategy="fastest")
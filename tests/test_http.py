@@ -0,0 +1,62 @@
+"""
+tests/test_http.py
+==================
+
+Process‑wide HTTP pool registry: client reuse, per‑loop binding and stats.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from chronos.http import HTTPPools, ProviderConfig
+
+
+@pytest.fixture
+def stub_pools(monkeypatch):
+    """Registry whose transports answer locally instead of opening sockets."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200 if request.url.path != "/boom" else 500, json={})
+
+    def transport(*args, **kwargs):
+        return httpx.MockTransport(handler)
+
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport", transport)
+    return HTTPPools({"stub": ProviderConfig(base_url="https://stub.test", http2=False)})
+
+
+def test_client_reused_within_a_loop(stub_pools):
+    async def twice():
+        return stub_pools.get("stub"), stub_pools.get("stub")
+
+    first, second = asyncio.run(twice())
+    assert first is second
+    assert str(first.base_url) == "https://stub.test"
+
+
+def test_new_loop_gets_new_client(stub_pools):
+    async def grab():
+        return stub_pools.get("stub")
+
+    assert asyncio.run(grab()) is not asyncio.run(grab())
+
+
+def test_stats_count_requests(stub_pools):
+    async def calls():
+        client = stub_pools.get("stub")
+        await asyncio.gather(*(client.get("/ok") for _ in range(5)))
+        await client.get("/boom")
+        await stub_pools.aclose()
+
+    asyncio.run(calls())
+    stats = stub_pools.stats()["stub"]
+    assert stats["requests"] == 6
+    assert stats["in_flight"] == 0
+    assert stats["limits"]["max_connections"] > 0
+
+
+def test_unknown_provider():
+    with pytest.raises(KeyError):
+        HTTPPools().config("nope")
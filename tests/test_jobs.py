@@ -0,0 +1,176 @@
+"""
+tests/test_jobs.py
+==================
+
+The in‑process job queue (bounded workers, failure, cancellation, watch)
+and the ``/jobs`` router with a Cobalt mock that answers ``retryId``
+before its results.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+import api.jobs
+from chronos.db import create_all, make_engine
+from chronos.jobs import JobQueue, JobState
+from chronos.portfolio_db import DBPortfolioManager
+from chronos.scrapers.cobalt import CobaltScraper
+
+
+def test_workers_bound_concurrency_and_record_results():
+    async def scenario():
+        queue = JobQueue(workers=2)
+        running, peak = 0, 0
+
+        async def work(job):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            if job.params["n"] == 3:
+                raise ValueError("boom")
+            return job.params["n"] * 2
+
+        queue.register("work", work)
+        submitted = [queue.submit("work", {"n": n}) for n in range(6)]
+        done = [await queue.wait(job.id, timeout=2) for job in submitted]
+        await queue.aclose()
+        return peak, done
+
+    peak, done = asyncio.run(scenario())
+    assert peak == 2
+    assert [job.result for job in done if job.state is JobState.SUCCEEDED] == [0, 2, 4, 8, 10]
+    assert done[3].state is JobState.FAILED and done[3].error == "ValueError: boom"
+
+
+def test_watch_and_cancel():
+    async def scenario():
+        queue = JobQueue(workers=1)
+        release = asyncio.Event()
+
+        async def slow(job):
+            job.update(step="started")
+            await release.wait()
+            return "finished"
+
+        queue.register("slow", slow)
+        first, second = queue.submit("slow"), queue.submit("slow")
+        queued = queue.cancel(second.id)  # never reaches a worker
+
+        states = []
+
+        async def watch():
+            async for snap in queue.watch(first.id):
+                states.append((snap["state"], snap["progress"].get("step")))
+
+        watcher = asyncio.create_task(watch())
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.wait_for(watcher, 1)
+
+        third = queue.submit("slow")
+        release.clear()
+        await asyncio.sleep(0.05)
+        queue.cancel(third.id)
+        await queue.wait(third.id, timeout=1)
+        await queue.aclose()
+        return states, queued, third
+
+    states, queued, third = asyncio.run(scenario())
+    assert states[-1] == ("succeeded", "started")
+    assert ("running", "started") in states
+    assert queued.state is JobState.CANCELLED
+    assert third.state is JobState.CANCELLED
+
+
+def test_unknown_kind_and_full_queue():
+    async def scenario():
+        queue = JobQueue(workers=1, maxsize=1)
+
+        async def never(job):
+            await asyncio.Event().wait()
+
+        queue.register("never", never)
+        with pytest.raises(KeyError):
+            queue.submit("missing")
+        queue.submit("never")
+        await asyncio.sleep(0.01)  # first job leaves the queue for the worker
+        queue.submit("never")
+        with pytest.raises(asyncio.QueueFull):
+            queue.submit("never")
+        await queue.aclose()
+
+    asyncio.run(scenario())
+
+
+@pytest.fixture
+def cobalt():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(dict(request.url.params))
+        if "retryId" not in request.url.params:
+            return httpx.Response(200, json={"status": "Incomplete", "retryId": "r-1"})
+        return httpx.Response(200, json={"results": [
+            {"title": "Acme LLC", "state": "DE", "status": "Active", "filingDate": "2020-01-01"},
+        ]})
+
+    scraper = CobaltScraper(api_key="k", base_url="https://cobalt.test/v1",
+                            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                            use_cache=False)
+    return scraper, calls
+
+
+def test_cobalt_search_until_complete_follows_retry_id(cobalt):
+    scraper, calls = cobalt
+    pending = []
+    entities = asyncio.run(scraper.search_until_complete(
+        name="Acme", state="DE", poll_interval=0.01, on_pending=lambda *a: pending.append(a),
+    ))
+    assert [e.name for e in entities] == ["Acme LLC"]
+    assert pending == [("r-1", 1)]
+    assert calls[1]["retryId"] == "r-1"
+
+
+def test_search_job_endpoint(cobalt, monkeypatch, tmp_path):
+    pytest.importorskip("aiosqlite")
+    from chronos.portfolio_async import async_session, make_async_engine
+
+    url = f"sqlite:///{tmp_path / 'chronos.db'}"
+    create_all(make_engine(url))
+    engine = make_async_engine(url)
+    queue = JobQueue(workers=2)
+    queue.register("search", api.jobs.search_handler(
+        cobalt=cobalt[0], session_factory=lambda: async_session(engine), poll_interval=0.01,
+    ))
+    monkeypatch.setattr(api.jobs, "jobs", queue)
+
+    app = FastAPI()
+    app.include_router(api.jobs.router)
+    with TestClient(app) as client:
+        assert client.post("/jobs/search", json={"q": "Acme"}).status_code == 400
+        resp = client.post("/jobs/search", json={"q": "Acme", "state": "DE"})
+        assert resp.status_code == 202
+        job_id = resp.json()["id"]
+        assert resp.headers["location"] == f"/jobs/{job_id}"
+
+        body = client.get(f"/jobs/{job_id}", params={"wait": 5}).json()
+        assert body["state"] == "succeeded"
+        assert body["progress"]["retry_id"] == "r-1"
+        assert body["result"]["count"] == 1
+        assert body["result"]["entities"][0]["slug"] == "acme-llc"
+
+        events = client.get(f"/jobs/{job_id}/events").text
+        assert events.startswith("event: succeeded\ndata: ")
+        assert client.get("/jobs/missing").status_code == 404
+        client.portal.call(queue.aclose)
+        client.portal.call(engine.dispose)
+
+    with Session(make_engine(url)) as s:
+        assert DBPortfolioManager(s).get("acme-llc").name == "Acme LLC"
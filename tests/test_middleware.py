@@ -0,0 +1,152 @@
+"""
+tests/test_middleware.py
+========================
+
+Response compression thresholds / streaming and revision‑driven
+conditional GETs, on a bare FastAPI app with injected revision stamps.
+"""
+
+import gzip
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from api.middleware import CompressionMiddleware, ConditionalGetMiddleware, choose_encoding
+
+
+def _app(stamps):
+    app = FastAPI()
+    calls = {"status": 0}
+
+    @app.get("/status")
+    def status():
+        calls["status"] += 1
+        return {"total": 3, "pad": "x" * 2000}
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/image")
+    def image():
+        return PlainTextResponse("y" * 4000, media_type="image/png")
+
+    @app.get("/stream")
+    def stream():
+        lines = (f'{{"n":{i}}}\n'.encode() for i in range(500))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    app.add_middleware(
+        ConditionalGetMiddleware,
+        routes={"/status": ("corporateentitydb",)},
+        bypass_params=("refresh",),
+        stamps=lambda: stamps,
+    )
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    return TestClient(app), calls
+
+
+def _stamps(rev, ago=60):
+    return {"corporateentitydb": (rev, datetime.now(timezone.utc) - timedelta(seconds=ago))}
+
+
+def test_choose_encoding_honours_q_zero():
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding("") is None
+
+
+def test_compresses_only_large_compressible_bodies():
+    client, _ = _app(_stamps(1))
+    big = client.get("/status", headers={"Accept-Encoding": "gzip"})
+    assert big.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in big.headers["vary"]
+    assert big.json()["total"] == 3  # httpx decodes transparently
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    image = client.get("/image", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in image.headers
+
+
+def test_streaming_body_is_gzipped_incrementally():
+    client, _ = _app(_stamps(1))
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as resp:
+        assert resp.headers["content-encoding"] == "gzip"
+        raw = b"".join(resp.iter_raw())
+    lines = gzip.decompress(raw).splitlines()
+    assert len(lines) == 500 and lines[-1] == b'{"n":499}'
+
+
+def test_if_none_match_returns_304_without_running_endpoint():
+    stamps = _stamps(7)
+    client, calls = _app(stamps)
+    first = client.get("/status")
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"r7-') and first.headers["cache-control"] == "no-cache"
+    assert "last-modified" in first.headers
+
+    again = client.get("/status", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b""
+    assert calls["status"] == 1
+
+    stamps["corporateentitydb"] = (8, datetime.now(timezone.utc) - timedelta(seconds=5))
+    changed = client.get("/status", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert calls["status"] == 2
+
+
+def test_if_modified_since_and_bypass():
+    client, calls = _app(_stamps(3))
+    last_modified = client.get("/status").headers["last-modified"]
+    assert client.get("/status", headers={"If-Modified-Since": last_modified}).status_code == 304
+
+    # Side‑effecting query parameters always reach the endpoint
+    etag = client.get("/status").headers["etag"]
+    bypassed = client.get("/status?refresh=1", headers={"If-None-Match": etag})
+    assert bypassed.status_code == 200
+
+
+def test_if_modified_since_without_zone_is_utc():
+    client, calls = _app(_stamps(3, ago=3600))
+    since = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S -0000")
+    assert client.get("/status", headers={"If-Modified-Since": since}).status_code == 304
+    old = "Mon, 01 Jan 2024 00:00:00 -0000"
+    assert client.get("/status", headers={"If-Modified-Since": old}).status_code == 200
+    assert client.get("/status", headers={"If-Modified-Since": "garbage"}).status_code == 200
+
+
+def test_fresh_last_modified_is_not_sent_or_trusted():
+    stamps = _stamps(3, ago=0)
+    client, calls = _app(stamps)
+    assert "last-modified" not in client.get("/status").headers
+
+    # A second write within the same second keeps updated_at's second
+    now = datetime.now(timezone.utc)
+    stamps["corporateentitydb"] = (4, now)
+    since = format_datetime(now, usegmt=True)
+    assert client.get("/status", headers={"If-Modified-Since": since}).status_code == 200
+    assert calls["status"] == 2
+
+
+def test_stamps_are_read_off_the_event_loop():
+    threads = []
+
+    def stamps():
+        threads.append(threading.get_ident())
+        return _stamps(1)
+
+    app = FastAPI()
+
+    @app.get("/status")
+    async def status():
+        return {"loop": threading.get_ident()}
+
+    app.add_middleware(ConditionalGetMiddleware, routes={"/status": ("corporateentitydb",)},
+                       stamps=stamps)
+    loop_thread = TestClient(app).get("/status").json()["loop"]
+    assert threads and threads[0] != loop_thread
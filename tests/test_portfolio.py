@@ -39,4 +39,36 @@ def test_len_and_iter():
     pm = _demo_portfolio()
     assert len(pm) == 3
     names = {e.name for e in pm}
-    assert names == {"Foo LLC", "Bar Inc", "Baz GmbH"}
\ No newline at end of file
+    assert names == {"Foo LLC", "Bar Inc", "Baz GmbH"}
+
+def test_iter_columns():
+    pm = _demo_portfolio()
+    rows = set(pm.iter_columns("slug", "status"))
+    assert ("baz-gmbh", Status.DELINQUENT) in rows
+    assert len(rows) == 3
+
+
+def test_search_prefix_tokens_and_state():
+    pm = _demo_portfolio()
+    pm.add(CorporateEntity("Foo Holdings Inc", "NY", date(2020, 1, 1)))
+
+    assert [e.name for e in pm.search("foo")] == ["Foo LLC", "Foo Holdings Inc"]
+    assert [e.name for e in pm.search("fo hold")] == ["Foo Holdings Inc"]
+    assert [e.name for e in pm.search("foo", state="de")] == ["Foo LLC"]
+    assert pm.search("nomatch") == []
+
+
+def test_search_ignores_diacritics():
+    pm = PortfolioManager()
+    pm.add(CorporateEntity("Société Générale SA", "FR", date(2020, 1, 1)))
+    assert [e.name for e in pm.search("societe gen")] == ["Société Générale SA"]
+    assert [e.name for e in pm.search("Société")] == ["Société Générale SA"]
+
+
+def test_search_index_tracks_overwrites():
+    pm = PortfolioManager()
+    pm.add(CorporateEntity("Acme Corp", "CA", date(2024, 4, 1)))
+    pm.add(CorporateEntity("ACME CORP", "DE", date(2024, 4, 1)))  # same slug
+    assert [e.jurisdiction for e in pm.search("acme")] == ["DE"]
+    pm.clear()
+    assert pm.search("acme") == []
@@ -0,0 +1,56 @@
+"""
+tests/test_portfolio_async.py
+=============================
+
+AsyncDBPortfolioManager over aiosqlite: CRUD, status filters, search,
+async iteration, column streaming and count.  Skipped when the async driver is missing.
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from chronos.db import create_all, make_engine
+from chronos.models import CorporateEntity, Status
+from chronos.portfolio_async import AsyncDBPortfolioManager, async_url
+
+
+def test_async_url():
+    assert async_url("sqlite:////tmp/chronos.db") == "sqlite+aiosqlite:////tmp/chronos.db"
+    assert async_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+
+
+def test_async_portfolio_roundtrip(tmp_path):
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("greenlet")
+    from chronos.portfolio_async import async_session, make_async_engine
+
+    url = f"sqlite:///{tmp_path / 'chronos.db'}"
+    create_all(make_engine(url))
+    entities = [
+        CorporateEntity(f"Async {i} LLC", "DE", date(2024, 1, 1),
+                        status=Status.ACTIVE if i % 2 else Status.PENDING)
+        for i in range(6)
+    ]
+
+    async def scenario():
+        engine = make_async_engine(url)
+        try:
+            async with AsyncDBPortfolioManager(async_session(engine)) as pm:
+                assert await pm.add_many(entities) == 6
+                await pm.add(CorporateEntity("Async 0 LLC", "NY", date(2024, 1, 1)))
+                assert (await pm.get("async-0-llc")).jurisdiction == "NY"
+                with pytest.raises(KeyError):
+                    await pm.get("missing")
+                assert len(await pm.find_by_status(Status.ACTIVE)) == 3
+                assert await pm.count() == 6
+                assert [e.name async for e in pm][:1] == ["Async 0 LLC"]
+                assert [e.name for e in await pm.search("async 3")] == ["Async 3 LLC"]
+                page = await pm.iter_columns("slug", after="async-3-llc")
+                assert [row async for row in pm.stream_columns("slug", after="async-3-llc")] == page
+                assert page == [("async-4-llc",), ("async-5-llc",)]
+        finally:
+            await engine.dispose()
+
+    asyncio.run(scenario())
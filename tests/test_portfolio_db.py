@@ -12,6 +12,8 @@ ensure persistence and API parity with the in‑memory version.
 
 from datetime import date
 
+from sqlmodel import Session, create_engine
+
 from chronos.db import create_all
 from chronos.models import CorporateEntity, Status
 from chronos.portfolio_db import DBPortfolioManager
@@ -50,4 +52,87 @@ def test_persistence_across_sessions():
         fetched = pm2.get(slug)
 
     assert fetched.name == "Gamma LLC"
-    assert fetched.status == Status.PENDING
\ No newline at end of file
+    assert fetched.status == Status.PENDING
+
+def _temp_manager(tmp_path) -> DBPortfolioManager:
+    """DBPortfolioManager bound to a throw‑away SQLite file."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'chronos_test.db'}")
+    create_all(engine)
+    return DBPortfolioManager(Session(engine))
+
+
+def test_add_many_upserts_in_one_batch(tmp_path):
+    pm = _temp_manager(tmp_path)
+    written = pm.add_many([
+        CorporateEntity("Delta LLC", "DE", date(2024, 1, 1)),
+        CorporateEntity("Epsilon Inc", "NY", date(2023, 1, 1), status=Status.ACTIVE),
+    ])
+    assert written == 2
+    assert len(pm) == 2
+
+    # second batch overwrites the existing slug instead of duplicating it
+    pm.add_many([CorporateEntity("Delta LLC", "CA", date(2024, 1, 1), officers=["Ann"])])
+    delta = pm.get("delta-llc")
+    assert delta.jurisdiction == "CA"
+    assert delta.officers == ["Ann"]
+    assert len(pm) == 2
+
+
+def test_sql_side_status_queries(tmp_path):
+    pm = _temp_manager(tmp_path)
+    pm.add_many([
+        CorporateEntity("Zeta LLC", "DE", date(2024, 1, 1)),
+        CorporateEntity("Eta Inc", "NY", date(2023, 1, 1), status=Status.ACTIVE),
+        CorporateEntity("Theta GmbH", "DE", date(2022, 1, 1), status=Status.ACTIVE),
+    ])
+
+    assert len(pm) == 3
+    assert {e.name for e in pm.find_by_status(Status.ACTIVE)} == {"Eta Inc", "Theta GmbH"}
+    assert pm.find_by_status(Status.DISSOLVED) == []
+    assert pm.status_counts() == {Status.PENDING: 1, Status.ACTIVE: 2}
+
+
+def test_streaming_iteration_and_iter_columns(tmp_path):
+    pm = _temp_manager(tmp_path)
+    pm.add_many(CorporateEntity(f"Iota {i} LLC", "WY", date(2020, 1, 1)) for i in range(2500))
+
+    it = iter(pm)
+    assert next(it).name.startswith("Iota ")
+    assert sum(1 for _ in it) == 2499
+
+    pm.add(CorporateEntity("Kappa LLC", "DE", date(2021, 1, 1)))
+    rows = list(pm.iter_columns("slug", "status"))
+    assert ("kappa-llc", Status.PENDING) in rows
+    assert len(rows) == 2501
+    assert next(pm.iter_columns())[0].startswith("iota-")
+
+
+def test_fts_search_ranked_and_synced(tmp_path):
+    pm = _temp_manager(tmp_path)
+    pm.add_many([
+        CorporateEntity("Acme Holdings LLC", "DE", date(2020, 1, 1)),
+        CorporateEntity("Acme", "NY", date(2020, 1, 1)),
+        CorporateEntity("Pinnacle Acme Partners", "DE", date(2020, 1, 1)),
+    ])
+    pm.add(CorporateEntity("Acmeco Inc", "CA", date(2020, 1, 1)))  # ORM path
+
+    assert pm.search("acme")[0].name == "Acme"
+    assert {e.name for e in pm.search("acm", state="DE")} == {
+        "Acme Holdings LLC", "Pinnacle Acme Partners",
+    }
+    assert [e.name for e in pm.search("acme hold")] == ["Acme Holdings LLC"]
+    assert "Acmeco Inc" in {e.name for e in pm.search("acme")}
+    assert pm.search("zzz") == []
+
+
+def test_fts_search_folds_diacritics_and_keeps_bm25_order(tmp_path):
+    pm = _temp_manager(tmp_path)
+    pm.add_many([
+        CorporateEntity("Café Holdings LLC", "DE", date(2020, 1, 1)),
+        CorporateEntity("Zed Acme Co", "DE", date(2020, 1, 1)),
+        CorporateEntity("Northwind Acme Acme Partners", "DE", date(2020, 1, 1)),
+    ])
+    assert [e.name for e in pm.search("cafe")] == ["Café Holdings LLC"]
+    assert [e.name for e in pm.search("CAFÉ holdings llc")] == ["Café Holdings LLC"]
+    # Neither is an exact or prefix match: BM25 (two hits) beats the shorter name
+    assert [e.name for e in pm.search("acme")] == ["Northwind Acme Acme Partners", "Zed Acme Co"]
@@ -0,0 +1,116 @@
+"""
+tests/test_ratelimit.py
+=======================
+
+Per‑provider rate limiters and their use in the pooled HTTP clients.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from chronos.http import HTTPPools, ProviderConfig
+from chronos.ratelimit import (
+    RateLimiter,
+    RateLimitExceeded,
+    SlidingWindowLimiter,
+    TokenBucket,
+    parse_rate,
+)
+
+
+def test_parse_rate():
+    assert parse_rate("10/s") == (10, 1.0)
+    assert parse_rate("10/hour") == (10, 3600.0)
+    with pytest.raises(ValueError):
+        parse_rate("ten per second")
+
+
+def test_base_limiter_is_abstract():
+    with pytest.raises(TypeError):
+        RateLimiter()
+
+
+def test_sliding_window_never_exceeds_the_limit_in_any_second():
+    limiter = SlidingWindowLimiter.from_spec("10/s")
+    starts = []
+
+    async def call():
+        # Scheduled start: not skewed by how late the event loop wakes us
+        requested = time.monotonic()
+        starts.append(requested + await limiter.acquire())
+
+    async def burst():
+        await asyncio.gather(*(call() for _ in range(25)))
+
+    asyncio.run(burst())
+    starts.sort()
+    assert starts[9] - starts[0] < 0.05  # a full window's allowance goes out at once
+    # Any 11 consecutive requests span at least a second
+    assert all(starts[i + 10] - starts[i] >= 0.999 for i in range(len(starts) - 10))
+    assert limiter.stats()["delayed"] == 15
+
+
+def test_token_bucket_spec_spaces_requests_evenly():
+    bucket = TokenBucket.from_spec("10/s")
+    assert bucket.capacity == 1
+    assert bucket.acquire_sync() == 0.0
+    assert bucket.acquire_sync() == pytest.approx(0.1, abs=0.01)
+
+
+def test_concurrent_callers_share_the_budget():
+    bucket = TokenBucket(rate=20, capacity=2)
+
+    async def burst():
+        start = time.perf_counter()
+        await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(burst())
+    assert 0.18 <= elapsed < 0.5  # 2 immediately, then one every 50 ms
+    stats = bucket.stats()
+    assert stats["acquired"] == 6 and stats["delayed"] == 4 and stats["waiting"] == 0
+    assert stats["max_wait_ms"] == pytest.approx(200, abs=5)
+
+
+def test_max_wait_fails_fast():
+    bucket = TokenBucket(rate=1 / 3600, capacity=1, max_wait=1.0)
+    assert bucket.acquire_sync() == 0.0
+    with pytest.raises(RateLimitExceeded):
+        bucket.acquire_sync()
+    assert bucket.stats()["rejected"] == 1
+
+
+def test_cancelled_waiter_returns_its_token():
+    bucket = TokenBucket(rate=10, capacity=1)
+
+    async def run():
+        await bucket.acquire()
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+    asyncio.run(run())
+    assert bucket.stats()["acquired"] == 1
+
+
+def test_pool_requests_pass_through_the_bucket(monkeypatch):
+    monkeypatch.setattr(
+        httpx, "AsyncHTTPTransport",
+        lambda *a, **kw: httpx.MockTransport(lambda request: httpx.Response(200)),
+    )
+    pools = HTTPPools({"sec": ProviderConfig(base_url="https://sec.test", http2=False,
+                                             rate_limit="20/s")})
+
+    async def calls():
+        client = pools.get("sec")
+        await asyncio.gather(*(client.get("/x") for _ in range(25)))
+        await pools.aclose()
+
+    start = time.perf_counter()
+    asyncio.run(calls())
+    assert time.perf_counter() - start >= 0.99  # 20 at once, 5 more a second later
+    assert pools.stats()["sec"]["rate_limit"]["acquired"] == 25
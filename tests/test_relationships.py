@@ -0,0 +1,377 @@
+"""
+tests/test_relationships.py
+===========================
+
+Ownership graph tests: the in‑memory RelationshipGraph and the
+SQLite‑backed DBRelationshipGraph shared between worker processes.
+"""
+
+import json
+import threading
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from chronos.db import create_all
+from chronos.models import CorporateEntity, Status
+from chronos.portfolio_db import DBPortfolioManager
+from chronos.relationships import RelationshipGraph
+from chronos.relationships_db import DBRelationshipGraph
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'graph.db'}")
+    create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_unlink_and_clear_edges_keep_nodes():
+    rg = RelationshipGraph()
+    rg.link_parent("holdco", "opco1", 100.0)
+    rg.link_parent("holdco", "opco2", 75.0)
+    rg.unlink("holdco", "opco1")
+    assert rg.subsidiaries("holdco") == ["opco2"]
+    rg.clear_edges()
+    assert rg.g.number_of_edges() == 0
+    assert set(rg.g.nodes()) == {"holdco", "opco1", "opco2"}
+
+
+def test_edges_survive_restart(engine):
+    rg = DBRelationshipGraph(engine)
+    rg.sync()
+    rg.link_parent("holdco", "opco", 60.0)
+
+    fresh = DBRelationshipGraph(engine)
+    assert fresh.sync() is True
+    assert fresh.ownership_pct("holdco", "opco") == 60.0
+
+
+def test_sync_picks_up_other_workers_writes(engine):
+    a, b = DBRelationshipGraph(engine), DBRelationshipGraph(engine)
+    a.sync()
+    b.sync()
+    assert a.sync() is False  # nothing changed
+
+    b.link_parent("holdco", "opco", 51.0)
+    assert a.sync() is True
+    assert a.ownership_pct("holdco", "opco") == 51.0
+
+    a.unlink("holdco", "opco")
+    b.sync()
+    assert b.g.number_of_edges() == 0
+
+
+def test_own_write_does_not_force_reload(engine):
+    rg = DBRelationshipGraph(engine)
+    rg.sync()
+    rg.link_parent("holdco", "opco", 10.0)
+    assert rg.sync() is False
+
+
+def test_node_metadata_follows_portfolio(engine):
+    rg = DBRelationshipGraph(engine)
+    rg.sync()
+    pm = DBPortfolioManager(Session(engine))
+    pm.add(CorporateEntity("Acme LLC", "DE", date(2024, 1, 1), status=Status.ACTIVE))
+
+    assert rg.sync() is True
+    assert rg.get_entity_data("acme-llc")["status"] == "ACTIVE"
+    assert "acme-llc" in rg.g
+
+
+def test_entity_writes_are_diffed_not_resynced(engine):
+    rg = DBRelationshipGraph(engine)
+    rg.sync()
+    rg.link_parent("holdco", "opco", 60.0)
+    since = rg.version
+    pm = DBPortfolioManager(Session(engine))
+    acme = CorporateEntity("Acme LLC", "DE", date(2024, 1, 1), status=Status.ACTIVE)
+    pm.add(acme)
+
+    assert rg.sync() is True
+    feed = rg.changes_since(since, rg.epoch)
+    assert [(c["op"], c["kind"], c["data"]["id"]) for c in feed["changes"]] == [
+        ("add", "node", "acme-llc"),
+    ]
+
+    # Columns the graph doesn't show change the version but emit nothing
+    since = rg.version
+    acme.notes = "refreshed by a later search"
+    pm.add(acme)
+    assert rg.sync() is True
+    assert rg.changes_since(since, rg.epoch)["changes"] == []
+    assert rg.ownership_pct("holdco", "opco") == 60.0
+
+
+def test_sync_reads_only_changed_entities(engine, monkeypatch):
+    pm = DBPortfolioManager(Session(engine))
+    pm.add_many([CorporateEntity(f"Co {i}", "DE", date(2024, 1, 1)) for i in range(50)])
+    rg = DBRelationshipGraph(engine)
+    rg.sync()
+
+    fetched = []
+    node_rows = DBRelationshipGraph._node_rows
+    monkeypatch.setattr(DBRelationshipGraph, "_node_rows", staticmethod(
+        lambda s, slugs=None: fetched.append(slugs) or node_rows(s, slugs)
+    ))
+    pm.add_many([CorporateEntity("Co 1", "DE", date(2024, 1, 1))])  # unchanged
+    assert rg.sync() is False
+
+    pm.add(CorporateEntity("Co 2", "DE", date(2024, 1, 1), status=Status.ACTIVE))
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM corporateentitydb WHERE slug = 'co-3'"))
+    assert rg.sync() is True
+    assert fetched == [{"co-2", "co-3"}]
+    assert rg.get_entity_data("co-2")["status"] == "ACTIVE"
+    assert "co-3" not in rg.g and len(rg.g) == 49
+
+
+def test_readers_wait_for_a_reload_in_progress(engine):
+    rg = DBRelationshipGraph(engine)
+    rg.sync()
+    readers = [
+        threading.Thread(target=rg.to_json_bytes),
+        threading.Thread(target=rg.identify_shell_companies),
+        threading.Thread(target=rg.changes_since, args=(0,)),
+    ]
+    with rg._lock:  # e.g. sync() applying another worker's writes
+        for t in readers:
+            t.start()
+            t.join(0.05)
+            assert t.is_alive()
+    for t in readers:
+        t.join(1)
+        assert not t.is_alive()
+
+
+def test_versions_and_epoch_are_shared_between_workers(engine):
+    a, b = DBRelationshipGraph(engine), DBRelationshipGraph(engine)
+    a.sync()
+    b.sync()
+    assert a.epoch == b.epoch and a.version == b.version
+
+    since = a.version
+    a.link_parent("holdco", "opco", 51.0)
+    a.link_parent("holdco", "opco", 75.0)
+    b.sync()
+    assert b.version == a.version
+    feed = b.changes_since(since, a.epoch)
+    assert "resync" not in feed
+    assert feed["changes"][-1]["data"] == {"source": "holdco", "target": "opco", "value": 75.0}
+
+    b.unlink("holdco", "opco")
+    a.sync()
+    ops = [(c["op"], c["kind"]) for c in a.changes_since(b.version - 1, b.epoch)["changes"]]
+    assert ("remove", "edge") in ops
+
+
+# ---------------------------------------------------------------------------
+# Effective ownership
+# ---------------------------------------------------------------------------
+def _chain() -> RelationshipGraph:
+    rg = RelationshipGraph()
+    rg.link_parent("a", "b", 60.0)
+    rg.link_parent("b", "c", 50.0)
+    rg.link_parent("a", "c", 10.0)
+    rg.link_parent("c", "d", 100.0)
+    return rg
+
+
+def test_effective_ownership_sums_all_chains():
+    eff = _chain().effective_ownership("a")
+    assert eff["b"] == pytest.approx(60.0)
+    assert eff["c"] == pytest.approx(40.0)  # 60% × 50% + 10%
+    assert eff["d"] == pytest.approx(40.0)
+
+
+def test_effective_ownership_handles_cross_holdings():
+    rg = _chain()
+    rg.link_parent("c", "b", 20.0)
+    eff = rg.effective_ownership("a")
+    # b = 0.6 + 0.2·c, c = 0.1 + 0.5·b
+    assert eff["b"] == pytest.approx(62 / 0.9)
+    assert eff["c"] == pytest.approx(40 / 0.9)
+
+
+def test_full_cycle_is_rejected():
+    rg = RelationshipGraph()
+    rg.link_parent("x", "y", 100.0)
+    rg.link_parent("y", "x", 100.0)
+    with pytest.raises(ValueError):
+        rg.effective_ownership("x")
+
+
+def test_beneficial_owners_threshold():
+    owners = _chain().beneficial_owners("d", threshold=45.0)
+    assert [(o["slug"], o["ultimate"]) for o in owners] == [("c", False), ("b", False)]
+    assert [o["slug"] for o in _chain().beneficial_owners("d", 25.0)][-1] == "a"
+
+
+def test_ownership_matrix_matches_single_root():
+    rg = _chain()
+    matrix, nodes = rg.ownership_matrix()
+    row = matrix[nodes.index("a")].toarray().ravel() * 100.0
+    eff = rg.effective_ownership("a")
+    for node, pct in eff.items():
+        assert row[nodes.index(node)] == pytest.approx(pct)
+
+
+# ---------------------------------------------------------------------------
+# Shell scoring
+# ---------------------------------------------------------------------------
+def _shell_graph() -> RelationshipGraph:
+    rg = RelationshipGraph()
+    rg.add_node_data("central-holdings", "Central Holdings", "WY", Status.ACTIVE, date(2019, 7, 1))
+    rg.add_node_data("op-llc", "Op LLC", "DE", Status.ACTIVE)
+    rg.add_node_data("pacific", "Pacific", "CA", Status.DELINQUENT, date(2017, 9, 22))
+    rg.link_parent("central-holdings", "op-llc", 100.0)
+    return rg
+
+
+def test_shell_scores_combine_structure_and_metadata():
+    shells = {s["slug"]: s for s in _shell_graph().identify_shell_companies(threshold=0.2, attributes=True)}
+    assert shells["op-llc"]["risk_score"] == pytest.approx(1.4)
+    assert "Shell pattern: Sole subsidiary in a single-owner chain" in shells["op-llc"]["factors"]
+    assert shells["pacific"]["factors"] == ["Delinquent filing status"]
+
+
+def _old_shell_detection(entities):
+    """The per‑request /shell-detection heuristic the graph scorer replaced."""
+    shells = {}
+    for entity in entities:
+        name = entity.name.lower()
+        risk_score, factors = 0.0, []
+        if entity.status == Status.ACTIVE and "llc" in name:
+            risk_score += 0.3
+            factors.append("LLC structure with limited visibility")
+        if entity.status == Status.DELINQUENT:
+            risk_score += 0.2
+            factors.append("Delinquent filing status")
+        if not entity.formed:
+            risk_score += 0.1
+            factors.append("Missing formation date")
+        if entity.jurisdiction in ["DE", "WY", "NV"]:
+            risk_score += 0.15
+            factors.append(f"Registered in {entity.jurisdiction}, a jurisdiction favored for secrecy")
+        if "llc" in name and entity.jurisdiction == "DE":
+            risk_score += 0.25
+            factors.append("Shell pattern: Delaware LLC with limited transparency")
+        if "holdings" in name or "group" in name:
+            risk_score += 0.15
+            factors.append("Shell pattern: Holding company naming pattern")
+        if risk_score >= 0.2:
+            shells[name.replace(" ", "-")] = (pytest.approx(min(risk_score, 0.95)), factors)
+    return shells
+
+
+def test_shell_detection_matches_old_heuristic_for_sample_portfolio(engine):
+    sample = json.loads((Path(__file__).parents[1] / "sample_portfolio.json").read_text())
+    entities = [
+        CorporateEntity(e["name"], e["jurisdiction"], date.fromisoformat(e["formed"]),
+                        status=Status[e.get("status", "PENDING")])
+        for e in sample
+    ] + [
+        CorporateEntity("TechStart LLC", "DE", date(2020, 1, 1), status=Status.ACTIVE),
+        CorporateEntity("Widget Industries", "NV", date(2016, 5, 2), status=Status.DELINQUENT),
+        CorporateEntity("Global Services Inc", "CA", date(2018, 3, 15), status=Status.ACTIVE),
+        CorporateEntity("Acme Corporation", "DE", date(2005, 11, 20), status=Status.ACTIVE),
+        CorporateEntity("Central Holdings", "WY", date(2019, 7, 1), status=Status.ACTIVE),
+        CorporateEntity("Pacific Group", "CA", date(2017, 9, 22), status=Status.ACTIVE),
+    ]
+    DBPortfolioManager(Session(engine)).add_many(entities)
+    rg = DBRelationshipGraph(engine)
+    rg.sync()
+
+    # What GET /shell-detection returns (no ownership edges in the sample)
+    shells = rg.identify_shell_companies(threshold=0.2, cap=0.95, attributes=True)
+    assert {s["slug"]: (s["risk_score"], s["factors"]) for s in shells} == _old_shell_detection(entities)
+    assert "acme-corporation" not in {s["slug"] for s in shells}  # plain active DE corp: 0.15
+    # Structure only (the default) reports nothing for standalone entities
+    assert rg.identify_shell_companies() == []
+
+
+def test_shell_report_cached_until_graph_changes():
+    rg = _shell_graph()
+    first = rg.identify_shell_companies(threshold=0.2, cap=0.95, attributes=True)
+    assert rg.identify_shell_companies(threshold=0.2, cap=0.95, attributes=True) is first
+    assert max(s["risk_score"] for s in first) == 0.95
+
+    # A second subsidiary breaks op-llc's single-owner chain
+    rg.link_parent("central-holdings", "pacific", 50.0)
+    shells = {s["slug"]: s for s in rg.identify_shell_companies(threshold=0.2, attributes=True)}
+    assert "Shell pattern: Sole subsidiary in a single-owner chain" not in shells["op-llc"]["factors"]
+    assert shells["pacific"]["risk_score"] == pytest.approx(0.5)
+
+
+def test_incremental_scores_match_full_rescore():
+    rg = _shell_graph()
+    rg.shell_scores()
+    rg.link_parent("central-holdings", "pacific", 50.0)
+    rg.unlink("central-holdings", "op-llc")
+    incremental = dict(rg.shell_scores())
+    rg._touch_all()
+    assert rg.shell_scores() == incremental
+
+
+# ---------------------------------------------------------------------------
+# Versioned JSON payload
+# ---------------------------------------------------------------------------
+def test_to_json_memoised_per_version():
+    rg = _chain()
+    payload, (body, etag) = rg.to_json(), rg.to_json_bytes()
+    assert rg.to_json() is payload
+    assert rg.to_json_bytes()[0] is body
+
+    version = rg.version
+    rg.link_parent("a", "b", 70.0)
+    assert rg.version > version
+    new_body, new_etag = rg.to_json_bytes()
+    assert new_etag != etag
+    assert {n["id"]: n["type"] for n in rg.to_json()["nodes"]}["a"] == "PRIMARY"
+
+
+def test_etag_is_content_based():
+    assert _chain().to_json_bytes()[1] == _chain().to_json_bytes()[1]
+
+
+# ---------------------------------------------------------------------------
+# Change feed
+# ---------------------------------------------------------------------------
+def test_changes_since_returns_only_the_diff():
+    rg = _chain()
+    since = rg.version
+    rg.link_parent("a", "b", 70.0)
+    rg.unlink("c", "d")
+
+    feed = rg.changes_since(since, rg.epoch)
+    assert feed["version"] == rg.version
+    assert [(c["op"], c["kind"]) for c in feed["changes"]] == [
+        ("update", "edge"), ("remove", "edge"), ("update", "node"),
+    ]
+    assert feed["changes"][-1]["data"]["type"] == "PRIMARY"
+    assert rg.changes_since(rg.version)["changes"] == []
+
+
+def test_changes_since_requests_resync():
+    rg = _chain()
+    assert rg.changes_since(0, "another-worker")["resync"] is True
+    assert rg.changes_since(rg.version + 1)["resync"] is True
+
+    since = rg.version
+    rg.clear_edges()
+    assert rg.changes_since(since)["resync"] is True
+
+
+def test_changelog_is_bounded(monkeypatch):
+    monkeypatch.setattr("chronos.relationships.CHANGELOG_SIZE", 4)
+    rg = RelationshipGraph()
+    for i in range(10):
+        rg.link_parent("root", f"c{i}", 10.0)
+    assert len(rg._changes) == 4
+    assert rg.changes_since(1)["resync"] is True
+    assert [c["kind"] for c in rg.changes_since(rg.version - 1)["changes"]] == ["node", "edge"]
@@ -0,0 +1,60 @@
+"""
+tests/test_scraper_cobalt.py
+============================
+
+Unit tests for the async Cobalt Intelligence client.
+
+Requests go through an injected client with an ``httpx.MockTransport``,
+so nothing leaves the process.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from chronos.models import Status
+from chronos.scrapers.cobalt import CobaltScraper
+
+
+@pytest.fixture
+def mock_http():
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        await asyncio.sleep(0.05)
+        q = request.url.params["searchQuery"]
+        return httpx.Response(200, json={"results": [
+            {"title": q, "state": "DE", "status": "Active", "filingDate": "2020-01-01"},
+        ]})
+
+    return seen, httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_search_parses_results(mock_http):
+    seen, client = mock_http
+    scraper = CobaltScraper(api_key="k", base_url="https://cobalt.test/v1/", client=client,
+                            use_cache=False)
+    entities = asyncio.run(scraper.search("Acme LLC", "DE"))
+
+    assert [e.name for e in entities] == ["Acme LLC"]
+    assert entities[0].status == Status.ACTIVE
+    assert str(seen[0].url).startswith("https://cobalt.test/v1/search?")
+    assert seen[0].headers["x-api-key"] == "k"
+
+
+def test_searches_run_concurrently(mock_http):
+    scraper = CobaltScraper(api_key="k", base_url="https://cobalt.test/v1", client=mock_http[1],
+                            use_cache=False)
+
+    async def many():
+        return await asyncio.gather(*(scraper.search(f"Co {i}", "DE") for i in range(20)))
+
+    start = time.perf_counter()
+    results = asyncio.run(many())
+    elapsed = time.perf_counter() - start
+
+    assert all(len(r) == 1 for r in results)
+    assert elapsed < 20 * 0.05 / 2  # would be ≥ 1 s if the calls serialised
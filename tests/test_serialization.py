@@ -0,0 +1,49 @@
+"""
+tests/test_serialization.py
+===========================
+
+orjson‑backed encoding: entity shapes, native dates/Status names and the
+response class used as the API default.
+"""
+
+import json
+from datetime import date
+
+from chronos.models import CorporateEntity, Status
+from chronos.serialization import dumps, encode_entities, entity_dict
+from api.responses import FastJSONResponse, entities_response
+
+
+def _ent():
+    return CorporateEntity("Acme  Widgets LLC", "DE", date(2020, 5, 17),
+                           officers=["Jane Roe"], status=Status.ACTIVE, notes="ñ")
+
+
+def test_encode_entities_matches_legacy_shape():
+    ent = _ent()
+    legacy = {
+        "slug": ent.name.lower().replace(" ", "-"),
+        "name": ent.name,
+        "jurisdiction": "DE",
+        "status": "ACTIVE",
+        "formed": "2020-05-17",
+        "officers": ["Jane Roe"],
+        "notes": "ñ",
+    }
+    assert json.loads(encode_entities([ent])) == [legacy]
+    summary = json.loads(encode_entities([ent], summary=True))[0]
+    assert set(summary) == {"slug", "name", "jurisdiction", "status", "formed"}
+
+
+def test_dumps_handles_entities_sets_and_int_keys():
+    out = json.loads(dumps({"entity": _ent(), "tags": {"a"}, 1: date(2021, 1, 2)}))
+    assert out["entity"] == json.loads(dumps(entity_dict(_ent())))
+    assert out["tags"] == ["a"] and out["1"] == "2021-01-02"
+
+
+def test_response_classes():
+    assert json.loads(FastJSONResponse({"d": date(2020, 1, 1)}).body) == {"d": "2020-01-01"}
+    assert FastJSONResponse(b'{"pre":1}').body == b'{"pre":1}'
+    resp = entities_response([_ent()], summary=True, headers={"X-Test": "1"})
+    assert resp.media_type == "application/json" and resp.headers["x-test"] == "1"
+    assert json.loads(resp.body)[0]["status"] == "ACTIVE"
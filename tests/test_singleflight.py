@@ -0,0 +1,100 @@
+"""
+tests/test_singleflight.py
+==========================
+
+Coalescing of identical in‑flight lookups.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from chronos.scrapers.cobalt import CobaltScraper
+from chronos.singleflight import SingleFlight, coalesce
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    sf = SingleFlight()
+    calls = 0
+
+    async def upstream():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return ["Acme LLC"]
+
+    async def many():
+        return await asyncio.gather(*(sf.do(("cobalt", "acme"), upstream) for _ in range(10)))
+
+    results = asyncio.run(many())
+    assert calls == 1
+    assert all(r == ["Acme LLC"] for r in results)
+    assert sf.stats()["cobalt"] == {
+        "requests": 10, "upstream": 1, "coalesced": 9, "saved_ratio": 0.9,
+    }
+    assert sf.in_flight() == 0
+
+
+def test_errors_reach_every_waiter_and_are_not_remembered():
+    sf = SingleFlight()
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def run():
+        return await asyncio.gather(*(sf.do("k", boom) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(run()))
+    assert sf.stats()["default"]["upstream"] == 1
+    asyncio.run(run())
+    assert sf.stats()["default"]["upstream"] == 2
+
+
+def test_cancelled_follower_does_not_cancel_leader():
+    sf = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return 42
+
+    async def run():
+        leader = asyncio.create_task(sf.do("k", slow))
+        follower = asyncio.create_task(sf.do("k", slow))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        return await leader
+
+    assert asyncio.run(run()) == 42
+
+
+def test_scraper_search_normalises_key():
+    sf = SingleFlight()
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"results": [
+            {"title": "Acme LLC", "state": "DE", "status": "Active", "filingDate": "2020-01-01"},
+        ]})
+
+    class Scraper(CobaltScraper):
+        search = coalesce("cobalt", group=sf)(CobaltScraper.search.__wrapped__)
+
+    scraper = Scraper(api_key="k", base_url="https://cobalt.test",
+                      client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                      use_cache=False)
+
+    async def many():
+        return await asyncio.gather(
+            scraper.search("Acme LLC", "DE"),
+            scraper.search("  acme   llc", "de"),
+            scraper.search(name="ACME LLC", state="DE"),
+            scraper.search("Acme LLC", "CA"),
+        )
+
+    results = asyncio.run(many())
+    assert len(calls) == 2  # DE queries coalesced, CA separate
+    assert results[0] is not results[1] and results[0] == results[1]
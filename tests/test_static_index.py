@@ -0,0 +1,46 @@
+"""
+tests/test_static_index.py
+==========================
+
+Parse‑once static file index: exact / prefix / substring lookups and
+re‑parsing only after the source file changes.
+"""
+
+import os
+
+from chronos.scrapers.static_index import StaticIndex, csv_rows, html_table_rows
+
+HTML = """<table>
+  <tr><th>Name</th></tr>
+  <tr><td>Foo Holdings LLC</td><td>1</td></tr>
+  <tr><td>Foo  LLC</td><td>2</td></tr>
+  <tr><td>Barfoo Inc</td><td>3</td></tr>
+</table>"""
+
+
+def test_lookup_order(tmp_path):
+    src = tmp_path / "de.html"
+    src.write_text(HTML)
+    index = StaticIndex(src, html_table_rows)
+
+    assert index.lookup("FOO llc")[1] == "2"           # exact, whitespace‑insensitive
+    assert index.lookup("foo")[1] == "2"               # shortest prefix match
+    assert index.lookup("holdings")[1] == "1"          # substring, file order
+    assert index.lookup("nobody") is None
+    assert len(index) == 3 and index.loads == 1
+
+
+def test_reparses_only_on_mtime_change(tmp_path):
+    src = tmp_path / "bulk.csv"
+    src.write_text("name,id\nAcme Corp,1\n")
+    index = StaticIndex(src, csv_rows)
+    assert index.lookup("acme corp") == ["Acme Corp", "1"]
+    index.lookup("acme")
+    assert index.loads == 1
+
+    src.write_text("name,id\nGlobex,2\n")
+    stat = src.stat()
+    os.utime(src, (stat.st_atime, stat.st_mtime + 5))
+    assert index.lookup("acme corp") is None
+    assert index.lookup("globex") == ["Globex", "2"]
+    assert index.loads == 2